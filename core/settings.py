@@ -54,7 +54,6 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "tenants.infrastructure.middleware.middleware.TenantResolutionMiddleware",
-    "tenants.infrastructure.middleware.middleware.TenantSecurityMiddleware",
     "tenants.infrastructure.middleware.middleware.TenantPerformanceMiddleware",
     "tenants.infrastructure.middleware.branding.BrandingMiddleware",
     "django.middleware.security.SecurityMiddleware",
@@ -62,6 +61,8 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    # Must follow AuthenticationMiddleware: the membership guard needs request.user
+    "tenants.infrastructure.middleware.middleware.TenantSecurityMiddleware",
     "tenants.infrastructure.middleware.middleware_impersonation.AdminImpersonationMiddleware",
     "tenants.infrastructure.middleware.middleware_resilience.ResourceGovernorMiddleware",
     "tenants.infrastructure.middleware.middleware_user.UserContextMiddleware",
@@ -14,3 +14,6 @@ DATABASES = {
 # OTEL and Resilience are part of the test but we can disable OTEL exporters
 DEBUG = False 
 TESTING = True
+
+# Telemetry is written inline so assertions see it inside the test transaction
+TENANT_TELEMETRY_BUFFERED = False
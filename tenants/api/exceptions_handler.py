@@ -2,7 +2,7 @@ from rest_framework import status
 from rest_framework.views import exception_handler
 from rest_framework.response import Response
 from tenants.business.exceptions import SovereignError
-from tenants.infrastructure.utils.resilience import CircuitBreakerError
+from tenants.infrastructure.utils.resilience import BulkheadFullError, CircuitBreakerError
 
 def sovereign_exception_handler(exc, context):
     """
@@ -33,6 +33,16 @@ def sovereign_exception_handler(exc, context):
             }
         }, status=status.HTTP_503_SERVICE_UNAVAILABLE, headers={'Retry-After': str(exc.retry_after)})
 
+    if isinstance(exc, BulkheadFullError):
+        return Response({
+            'status': 'error',
+            'error': {
+                'code': 'bulkhead_full',
+                'message': exc.message,
+                'retry_after': exc.retry_after
+            }
+        }, status=status.HTTP_429_TOO_MANY_REQUESTS, headers={'Retry-After': str(exc.retry_after)})
+
     # If DRF already handled it (e.g. ValidationErrors), standardizing that too
     if response is not None:
         response.data = {
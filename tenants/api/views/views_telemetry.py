@@ -1,9 +1,13 @@
 
 from rest_framework import viewsets, permissions
-from tenants.domain.models import TelemetryEntry
+import datetime
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from tenants.domain.models import TelemetryEntry, TelemetryRollup
 from tenants.api.serializers.serializers_base import TenantAwareSerializer
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 
 class TelemetrySerializer(TenantAwareSerializer):
     class Meta:
@@ -19,12 +23,106 @@ class TelemetryViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = TelemetrySerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    # Tier 121: Dashboards read TelemetryRollup rows over a bounded window
+    DEFAULT_AGGREGATE_RANGE = datetime.timedelta(hours=24)
+    DEFAULT_TIMESERIES_RANGE = datetime.timedelta(hours=1)
+    MAX_RANGE = datetime.timedelta(days=31)
+
+    def _time_range(self, request, default):
+        """Parses ?start=&end= (ISO 8601) into a bounded [start, end) window."""
+        def parse(name):
+            raw = request.query_params.get(name)
+            if not raw:
+                return None
+            value = parse_datetime(raw)
+            if value is None:
+                raise ValidationError({name: "Expected an ISO 8601 datetime."})
+            return value if timezone.is_aware(value) else timezone.make_aware(value)
+
+        end = parse('end') or timezone.now()
+        start = parse('start') or end - default
+        if start >= end:
+            raise ValidationError({"start": "Must be before end."})
+        if end - start > self.MAX_RANGE:
+            raise ValidationError({"start": f"Range may not exceed {self.MAX_RANGE.days} days."})
+        return start, end
+
+    def _rollups(self, request, default):
+        start, end = self._time_range(request, default)
+        rollups = TelemetryRollup.objects.filter(bucket__gte=start, bucket__lt=end)
+        for dimension in ('provider', 'action', 'status'):
+            value = request.query_params.get(dimension)
+            if value:
+                rollups = rollups.filter(**{dimension: value})
+        return rollups
+
+    @staticmethod
+    def _summarize(rows):
+        for row in rows:
+            latency_count = row.pop('latency_count')
+            latency_sum = row.pop('latency_sum_ms')
+            row['avg_latency'] = latency_sum / latency_count if latency_count else None
+        return rows
+
+    @staticmethod
+    def _totals():
+        from django.db.models import Sum
+        return {
+            'count': Sum('count'),
+            'error_count': Sum('error_count'),
+            'latency_count': Sum('latency_count'),
+            'latency_sum_ms': Sum('latency_sum_ms'),
+        }
+
     @action(detail=False, methods=['get'])
     def aggregate(self, request):
         """Returns aggregate metrics for the dashboard heatmap."""
-        from django.db.models import Count, Avg
-        stats = TelemetryEntry.objects.values('provider', 'status').annotate(
-            count=Count('id'),
-            avg_latency=Avg('latency_ms')
+        stats = self._rollups(request, self.DEFAULT_AGGREGATE_RANGE).values('provider', 'status').annotate(
+            **self._totals()
+        ).order_by('provider', 'status')
+        return Response(self._summarize(list(stats)))
+
+    @action(detail=False, methods=['get'])
+    def timeseries(self, request):
+        """Tier 121: Per-minute counts, errors and mean latency per provider over ?start=&end=."""
+        series = self._rollups(request, self.DEFAULT_TIMESERIES_RANGE).values('bucket', 'provider').annotate(
+            **self._totals()
+        ).order_by('bucket', 'provider')
+        return Response(self._summarize(list(series)))
+
+    @action(detail=False, methods=['get'])
+    def percentiles(self, request):
+        """Tier 122: p50/p95/p99 latency and error rate per provider/action, merged from rollup histograms."""
+        from tenants.infrastructure.utils.telemetry import LatencyHistogram
+
+        groups = {}
+        rows = self._rollups(request, self.DEFAULT_AGGREGATE_RANGE).order_by().values_list(
+            'provider', 'action', 'count', 'error_count', 'latency_histogram'
         )
-        return Response(stats)
+        for provider, action_name, count, error_count, histogram in rows.iterator():
+            group = groups.setdefault((provider, action_name), [0, 0, []])
+            group[0] += count
+            group[1] += error_count
+            group[2].append(histogram)
+
+        results = []
+        for (provider, action_name), (count, error_count, histograms) in sorted(groups.items()):
+            merged = LatencyHistogram.merge(histograms)
+            results.append({
+                'provider': provider,
+                'action': action_name,
+                'count': count,
+                'error_count': error_count,
+                'error_rate': error_count / count if count else 0.0,
+                'p50': LatencyHistogram.quantile(merged, 0.50),
+                'p95': LatencyHistogram.quantile(merged, 0.95),
+                'p99': LatencyHistogram.quantile(merged, 0.99),
+            })
+        return Response(results)
+
+    @action(detail=False, methods=['get'], permission_classes=[permissions.IsAdminUser])
+    def metrics(self, request):
+        """Tier 110: Staff-only scrape target for this process's metrics (Prometheus text format)."""
+        from django.http import HttpResponse
+        from tenants.infrastructure.metrics import registry
+        return HttpResponse(registry.render(), content_type=registry.CONTENT_TYPE)
@@ -17,13 +17,10 @@ class RedisLedgerAggregator:
     
     @staticmethod
     def _get_client():
-        try:
-            import redis
-            # Pull Redis URL from settings or use default
-            url = getattr(settings, 'REDIS_URL', 'redis://localhost:6379/1')
-            return redis.from_url(url)
-        except ImportError:
-            return None
+        from tenants.infrastructure.adapters.performance.pools import RedisPoolRegistry
+        # Pull Redis URL from settings or use default
+        url = getattr(settings, 'REDIS_URL', 'redis://localhost:6379/1')
+        return RedisPoolRegistry.get_client(url)
 
     @classmethod
     def process_atomic_step(cls, tenant_id, account_type, amount, entry_type):
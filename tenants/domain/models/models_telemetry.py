@@ -1,5 +1,6 @@
 
 from django.db import models
+from django.utils import timezone
 from tenants.domain.models import TenantAwareModel
 
 class TelemetryEntry(TenantAwareModel):
@@ -30,7 +31,8 @@ class TelemetryEntry(TenantAwareModel):
     latency_ms = models.IntegerField(null=True, blank=True)
     error_message = models.TextField(null=True, blank=True)
     metadata = models.JSONField(default=dict)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Stamped by the caller at record time; auto_now_add would stamp buffered rows at flush time
+    timestamp = models.DateTimeField(default=timezone.now)
 
     class Meta:
         verbose_name_plural = "Telemetry Entries"
@@ -38,3 +40,42 @@ class TelemetryEntry(TenantAwareModel):
 
     def __str__(self):
         return f"[{self.status}] {self.provider} - {self.action} ({self.tenant.slug})"
+
+def _log_linear_bounds(sub_buckets, max_exponent):
+    """1ms steps up to `sub_buckets`, then `sub_buckets` equal steps per power of two up to 2**max_exponent."""
+    bounds = list(range(1, sub_buckets + 1))
+    for exponent in range(sub_buckets.bit_length() - 1, max_exponent):
+        bounds.extend(2 ** exponent + step * 2 ** exponent // sub_buckets for step in range(1, sub_buckets + 1))
+    return tuple(bounds)
+
+class TelemetryRollup(TenantAwareModel):
+    """
+    Tier 121: Per-Minute Telemetry Rollup.
+    One row per (tenant, minute, provider, action, status), maintained by the
+    telemetry writer, so dashboards never scan raw TelemetryEntry rows.
+    Latencies are kept in a fixed log-linear histogram: slot i counts latencies
+    of at most LATENCY_BOUNDS[i] ms, and the last slot counts everything above.
+    Every power of two is split into LATENCY_SUB_BUCKETS linear slots, so a slot
+    is never wider than 1/16 of its value (exact 1ms slots below 16ms).
+    """
+    LATENCY_SUB_BUCKETS = 16
+    LATENCY_BOUNDS = _log_linear_bounds(LATENCY_SUB_BUCKETS, 16) # 1ms .. 65.5s
+    ERROR_STATUSES = ('FAILURE', 'CIRCUIT_OPEN')
+
+    bucket = models.DateTimeField() # Start of the minute
+    provider = models.CharField(max_length=50, choices=TelemetryEntry.PROVIDER_CHOICES)
+    action = models.CharField(max_length=100)
+    status = models.CharField(max_length=20, choices=TelemetryEntry.STATUS_CHOICES)
+    count = models.PositiveIntegerField(default=0)
+    error_count = models.PositiveIntegerField(default=0)
+    latency_count = models.PositiveIntegerField(default=0)
+    latency_sum_ms = models.BigIntegerField(default=0)
+    latency_histogram = models.JSONField(default=list)
+
+    class Meta:
+        unique_together = ('tenant', 'bucket', 'provider', 'action', 'status')
+        indexes = [models.Index(fields=['tenant', 'bucket'])]
+        ordering = ['-bucket']
+
+    def __str__(self):
+        return f"[{self.status}] {self.provider} - {self.action} @ {self.bucket:%Y-%m-%d %H:%M} x{self.count}"
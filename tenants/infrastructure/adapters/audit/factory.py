@@ -1,4 +1,5 @@
 from .providers import DatabaseAuditProvider, SplunkProvider, DatadogProvider
+from tenants.infrastructure.registry import ProviderInstanceCache
 
 class AuditFactory:
     """
@@ -7,6 +8,11 @@ class AuditFactory:
     @staticmethod
     def get_provider(tenant):
         config = tenant.config.get('audit', {})
+        # Tier 112: One instance per tenant and audit config per process
+        return ProviderInstanceCache.get_or_create('audit', tenant, config, lambda: AuditFactory._build(config))
+
+    @staticmethod
+    def _build(config):
         provider_type = config.get('provider', 'database')
         
         if provider_type == 'splunk':
@@ -1,6 +1,7 @@
 from .providers.stripe import StripeProvider
 from .providers.paddle import PaddleProvider
 from .providers.upi import UPIProvider
+from tenants.infrastructure.registry import ProviderInstanceCache
 
 class BillingFactory:
     """
@@ -13,7 +14,11 @@ class BillingFactory:
         Returns the configured billing provider for a tenant.
         """
         provider_type = tenant.config.get('billing_provider', 'stripe')
-        
+        # Tier 112: One instance per tenant and billing provider per process
+        return ProviderInstanceCache.get_or_create('billing', tenant, provider_type, lambda: BillingFactory._build(provider_type))
+
+    @staticmethod
+    def _build(provider_type):
         if provider_type == 'stripe':
             return StripeProvider()
         elif provider_type == 'paddle':
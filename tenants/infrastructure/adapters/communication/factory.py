@@ -4,18 +4,65 @@ from .providers.ses import SESProvider
 from .providers.twilio import TwilioProvider
 from .providers.whatsapp import TwilioWhatsAppProvider
 from tenants.infrastructure.security.vault import SovereignVault
+from tenants.infrastructure.registry import ProviderInstanceCache
 
 class CommunicationFactory:
     """
     Factory to resolve communication providers based on tenant configuration.
     """
     
+    BUILDERS = {
+        'email': '_build_email',
+        'sms': '_build_sms',
+        'whatsapp': '_build_whatsapp',
+    }
+
+    @staticmethod
+    def _channel_config(tenant, kind):
+        return tenant.config.get('communication', {}).get(kind, {})
+
+    @staticmethod
+    def get_fallbacks(tenant, kind):
+        """
+        Tier 123: Ordered fallback providers for a channel, as (vendor, provider) pairs.
+        Configured per tenant, e.g. config['communication']['email']['fallbacks'] =
+        [{'provider': 'ses', ...}, {'provider': 'smtp', ...}].
+        """
+        build = getattr(CommunicationFactory, CommunicationFactory.BUILDERS[kind])
+        fallbacks = []
+        for config in CommunicationFactory._channel_config(tenant, kind).get('fallbacks', []):
+            provider = ProviderInstanceCache.get_or_create(kind, tenant, config, lambda config=config: build(config))
+            fallbacks.append((config.get('provider', 'default'), provider))
+        return fallbacks
+
+    @staticmethod
+    def hedge_policy(tenant, kind):
+        """Tier 123: `hedge` is opt-in per channel: True for every action or a list of action names."""
+        return CommunicationFactory._channel_config(tenant, kind).get('hedge', False)
+
+    @staticmethod
+    def get_email_fallbacks(tenant):
+        return CommunicationFactory.get_fallbacks(tenant, 'email')
+
+    @staticmethod
+    def get_sms_fallbacks(tenant):
+        return CommunicationFactory.get_fallbacks(tenant, 'sms')
+
+    @staticmethod
+    def get_whatsapp_fallbacks(tenant):
+        return CommunicationFactory.get_fallbacks(tenant, 'whatsapp')
+
     @staticmethod
     def get_email_provider(tenant):
         """
         Returns the configured Email provider for the tenant.
         """
         config = tenant.config.get('communication', {}).get('email', {})
+        # Tier 112: Memoized per tenant and config, so credentials are unprotected once per process
+        return ProviderInstanceCache.get_or_create('email', tenant, config, lambda: CommunicationFactory._build_email(config))
+
+    @staticmethod
+    def _build_email(config):
         # Tier 91: Unprotect sensitive credentials
         config = SovereignVault.unprotect_config(config, ['api_key', 'password', 'secret_key'])
         
@@ -37,6 +84,11 @@ class CommunicationFactory:
         Returns the configured SMS provider for the tenant.
         """
         config = tenant.config.get('communication', {}).get('sms', {})
+        # Tier 112: Memoized per tenant and config, so credentials are unprotected once per process
+        return ProviderInstanceCache.get_or_create('sms', tenant, config, lambda: CommunicationFactory._build_sms(config))
+
+    @staticmethod
+    def _build_sms(config):
         # Tier 91: Unprotect sensitive credentials
         config = SovereignVault.unprotect_config(config, ['api_key', 'auth_token', 'account_sid'])
         
@@ -53,6 +105,11 @@ class CommunicationFactory:
         Returns the configured WhatsApp provider for the tenant.
         """
         config = tenant.config.get('communication', {}).get('whatsapp', {})
+        # Tier 112: Memoized per tenant and config, so credentials are unprotected once per process
+        return ProviderInstanceCache.get_or_create('whatsapp', tenant, config, lambda: CommunicationFactory._build_whatsapp(config))
+
+    @staticmethod
+    def _build_whatsapp(config):
         # Tier 91: Unprotect sensitive credentials
         config = SovereignVault.unprotect_config(config, ['api_key', 'auth_token', 'account_sid'])
         
@@ -1,5 +1,6 @@
 from ..base import EmailProvider
 from django.core.mail import get_connection, EmailMessage
+from tenants.infrastructure.utils.resilience import remaining_budget
 
 class SMTPProvider(EmailProvider):
     def __init__(self, config):
@@ -8,6 +9,14 @@ class SMTPProvider(EmailProvider):
         self.username = config.get('username')
         self.password = config.get('password')
         self.use_tls = config.get('use_tls', True)
+        self.timeout = config.get('timeout')
+
+    def _timeout(self):
+        # Tier 124: Never block longer than the caller's remaining deadline budget
+        budget = remaining_budget()
+        if budget is None:
+            return self.timeout
+        return budget if self.timeout is None else min(self.timeout, budget)
 
     def send_email(self, recipient, subject, body, from_email=None, **kwargs):
         connection = get_connection(
@@ -15,7 +24,8 @@ class SMTPProvider(EmailProvider):
             port=self.port,
             username=self.username,
             password=self.password,
-            use_tls=self.use_tls
+            use_tls=self.use_tls,
+            timeout=self._timeout()
         )
         email = EmailMessage(
             subject=subject,
@@ -1,4 +1,5 @@
 from .providers import DatabaseFlagProvider, LaunchDarklyProvider
+from tenants.infrastructure.registry import ProviderInstanceCache
 
 class ControlFactory:
     """
@@ -7,6 +8,11 @@ class ControlFactory:
     @staticmethod
     def get_provider(tenant):
         config = tenant.config.get('control', {})
+        # Tier 112: One instance per tenant and control config per process
+        return ProviderInstanceCache.get_or_create('control', tenant, config, lambda: ControlFactory._build(config))
+
+    @staticmethod
+    def _build(config):
         provider_type = config.get('provider', 'database')
         
         if provider_type == 'launchdarkly':
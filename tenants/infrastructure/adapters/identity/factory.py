@@ -2,6 +2,7 @@ from .providers.google import GoogleSSOAdapter
 from .providers.okta import OktaSSOAdapter
 from .providers.azure import AzureSSOAdapter
 from .providers.enterprise import OIDCProvider, SAMLProvider
+from tenants.infrastructure.registry import ProviderInstanceCache
 
 class IdentityFactory:
     """
@@ -11,6 +12,11 @@ class IdentityFactory:
     @staticmethod
     def get_provider(tenant):
         config = tenant.sso_config
+        # Tier 112: One instance per tenant and SSO config per process
+        return ProviderInstanceCache.get_or_create('identity', tenant, config, lambda: IdentityFactory._build(config))
+
+    @staticmethod
+    def _build(config):
         provider_type = config.get('provider', 'google')
         
         if provider_type == 'google':
@@ -1,4 +1,5 @@
 from .providers import OpenAIProvider, AnthropicProvider, OllamaProvider
+from tenants.infrastructure.registry import ProviderInstanceCache
 
 class LLMFactory:
     """
@@ -7,6 +8,11 @@ class LLMFactory:
     @staticmethod
     def get_provider(tenant):
         config = tenant.config.get('intelligence', {})
+        # Tier 112: One instance per tenant and intelligence config per process
+        return ProviderInstanceCache.get_or_create('intelligence', tenant, config, lambda: LLMFactory._build(config))
+
+    @staticmethod
+    def _build(config):
         provider_type = config.get('provider', 'openai')
         
         if provider_type == 'openai':
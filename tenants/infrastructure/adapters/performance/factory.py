@@ -1,4 +1,5 @@
 from .providers import RedisNamespaceProvider, RedisClusterProvider, CeleryVHostProvider
+from tenants.infrastructure.registry import ProviderInstanceCache
 
 class CacheFactory:
     """
@@ -7,10 +8,15 @@ class CacheFactory:
     @staticmethod
     def get_provider(tenant):
         config = tenant.config.get('cache', {})
+        # Tier 112: One instance per tenant and cache config per process
+        return ProviderInstanceCache.get_or_create('cache', tenant, config, lambda: CacheFactory._build(tenant, config))
+
+    @staticmethod
+    def _build(tenant, config):
         provider_type = config.get('provider', 'redis_namespace')
         
         if provider_type == 'redis_cluster':
-            return RedisClusterProvider(config)
+            return RedisClusterProvider(config, tenant_id=tenant.id)
             
         return RedisNamespaceProvider(tenant.id)
 
@@ -22,4 +28,4 @@ class QueueFactory:
     def get_provider(tenant):
         config = tenant.config.get('queue', {})
         # provider_type could be 'celery', 'sqs', 'rabbitmq'
-        return CeleryVHostProvider(config)
+        return ProviderInstanceCache.get_or_create('queue', tenant, config, lambda: CeleryVHostProvider(config))
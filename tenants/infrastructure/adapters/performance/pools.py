@@ -0,0 +1,70 @@
+import os
+import threading
+import logging
+from tenants.infrastructure.conf import conf
+
+logger = logging.getLogger(__name__)
+
+class RedisPoolRegistry:
+    """
+    Tier 111: Process-Wide Redis Connection Pools.
+    One BlockingConnectionPool per Redis URL per process, so clients built on
+    every cache call share warm connections instead of re-handshaking. At the
+    connection cap callers wait up to TENANT_REDIS_POOL_TIMEOUT for a free
+    connection instead of failing with "Too many connections". Pools are
+    dropped in forked children (Celery prefork) because sockets inherited
+    from the parent must never be shared.
+    """
+    _pools = {}
+    _lock = threading.Lock()
+    _pid = os.getpid()
+
+    @classmethod
+    def _reset_after_fork(cls):
+        cls._pools = {}
+        cls._lock = threading.Lock()
+        cls._pid = os.getpid()
+
+    @classmethod
+    def get_pool(cls, url):
+        import redis
+
+        if cls._pid != os.getpid():
+            # Fallback for forks that bypass os.register_at_fork (e.g. via a C extension)
+            cls._reset_after_fork()
+
+        pool = cls._pools.get(url)
+        if pool is None:
+            with cls._lock:
+                pool = cls._pools.get(url)
+                if pool is None:
+                    pool = redis.BlockingConnectionPool.from_url(
+                        url,
+                        max_connections=conf.REDIS_POOL_MAX_CONNECTIONS,
+                        timeout=conf.REDIS_POOL_TIMEOUT,
+                        health_check_interval=conf.REDIS_HEALTH_CHECK_INTERVAL,
+                        socket_timeout=conf.REDIS_SOCKET_TIMEOUT,
+                        socket_connect_timeout=conf.REDIS_SOCKET_TIMEOUT,
+                    )
+                    cls._pools[url] = pool
+                    logger.debug(f"[RedisPool] Created pool for {pool.connection_kwargs.get('host')} (pid {cls._pid})")
+        return pool
+
+    @classmethod
+    def get_client(cls, url):
+        """Returns a redis client bound to the shared pool for `url`, or None if redis-py is missing."""
+        try:
+            import redis
+        except ImportError:
+            return None
+        return redis.Redis(connection_pool=cls.get_pool(url))
+
+    @classmethod
+    def disconnect_all(cls):
+        with cls._lock:
+            pools, cls._pools = cls._pools, {}
+        for pool in pools.values():
+            pool.disconnect()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=RedisPoolRegistry._reset_after_fork)
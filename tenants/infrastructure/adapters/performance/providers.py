@@ -1,5 +1,7 @@
 from tenants.infrastructure.protocols.performance import ICacheProvider, IQueueProvider
 from django.core.cache import cache
+from tenants.infrastructure.cache import tenant_namespace_generation
+from .pools import RedisPoolRegistry
 import logging
 
 logger = logging.getLogger(__name__)
@@ -7,13 +9,13 @@ logger = logging.getLogger(__name__)
 class RedisNamespaceProvider(ICacheProvider):
     """
     Tier 62: Logical Cache Isolation.
-    Prefixes all keys with tenant_id.
+    Prefixes all keys with tenant_id and (Tier 115) the tenant's namespace generation.
     """
     def __init__(self, tenant_id):
         self.tenant_id = tenant_id
 
     def _key(self, key):
-        return f"{self.tenant_id}:{key}"
+        return f"{self.tenant_id}:g{tenant_namespace_generation.current(self.tenant_id)}:{key}"
 
     def get(self, key, default=None):
         return cache.get(self._key(key), default)
@@ -27,22 +29,52 @@ class RedisNamespaceProvider(ICacheProvider):
         cache.delete(self._key(key))
         return True
 
+    def add(self, key, value, timeout=300):
+        return cache.add(self._key(key), value, timeout)
+
+    def get_many(self, keys):
+        # Tier 113: One backend round trip, results keyed by the caller's keys
+        prefixed = {self._key(key): key for key in keys}
+        found = cache.get_many(list(prefixed))
+        return {prefixed[key]: value for key, value in found.items()}
+
+    def set_many(self, mapping, timeout=300):
+        cache.set_many({self._key(key): value for key, value in mapping.items()}, timeout)
+        return True
+
+    def delete_many(self, keys):
+        cache.delete_many([self._key(key) for key in keys])
+        return True
+
+    async def aget(self, key, default=None):
+        return await cache.aget(self._key(key), default)
+
+    async def aset(self, key, value, timeout=300):
+        await cache.aset(self._key(key), value, timeout)
+        return True
+
 class RedisClusterProvider(ICacheProvider):
     """
     Tier 62: Physical Cache Isolation.
     Connects to a specific Redis URL/Cluster per tenant.
     """
-    def __init__(self, config=None):
+    def __init__(self, config=None, tenant_id=None):
         self.config = config or {}
         self.redis_url = self.config.get('redis_url', 'redis://localhost:6379/0')
+        self.tenant_id = tenant_id
+
+    def _key(self, key):
+        # Tier 115: The cluster is already physically isolated; only the generation is added
+        if self.tenant_id is None:
+            return key
+        return f"g{tenant_namespace_generation.current(self.tenant_id)}:{key}"
 
     def _get_client(self):
-        try:
-            import redis
-            return redis.from_url(self.redis_url)
-        except ImportError:
+        # Tier 111: Clients share the process-wide pool for this URL
+        client = RedisPoolRegistry.get_client(self.redis_url)
+        if client is None:
             logger.error("[RedisCluster] redis-py not installed. Using Log Mock.")
-            return None
+        return client
 
     def get(self, key, default=None):
         client = self._get_client()
@@ -51,7 +83,7 @@ class RedisClusterProvider(ICacheProvider):
             return default
             
         try:
-            val = client.get(key)
+            val = client.get(self._key(key))
             return val if val is not None else default
         except Exception as e:
             logger.error(f"[RedisCluster] GET Error: {e}")
@@ -64,7 +96,7 @@ class RedisClusterProvider(ICacheProvider):
             return True
             
         try:
-            client.setex(key, timeout, value)
+            client.setex(self._key(key), timeout, value)
             return True
         except Exception as e:
             logger.error(f"[RedisCluster] SET Error: {e}")
@@ -77,7 +109,69 @@ class RedisClusterProvider(ICacheProvider):
             return True
             
         try:
-            client.delete(key)
+            client.delete(self._key(key))
+            return True
+        except Exception as e:
+            logger.error(f"[RedisCluster] DELETE Error: {e}")
+            return False
+
+    def add(self, key, value, timeout=300):
+        client = self._get_client()
+        if not client:
+            logger.info(f"[RedisCluster MOCK] SETNX {key} to {self.redis_url}")
+            return True
+
+        try:
+            return bool(client.set(self._key(key), value, nx=True, ex=timeout))
+        except Exception as e:
+            logger.error(f"[RedisCluster] SETNX Error: {e}")
+            return False
+
+    def get_many(self, keys):
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        client = self._get_client()
+        if not client:
+            logger.info(f"[RedisCluster MOCK] MGET {len(keys)} keys from {self.redis_url}")
+            return {}
+
+        try:
+            # Tier 113: MGET answers every key in a single round trip
+            values = client.mget([self._key(key) for key in keys])
+            return {key: value for key, value in zip(keys, values) if value is not None}
+        except Exception as e:
+            logger.error(f"[RedisCluster] MGET Error: {e}")
+            return {}
+
+    def set_many(self, mapping, timeout=300):
+        client = self._get_client()
+        if not client:
+            logger.info(f"[RedisCluster MOCK] SET {len(mapping)} keys to {self.redis_url}")
+            return True
+
+        try:
+            # Non-transactional pipeline: one round trip, no MULTI/EXEC overhead
+            pipe = client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.setex(self._key(key), timeout, value)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"[RedisCluster] PIPELINE SET Error: {e}")
+            return False
+
+    def delete_many(self, keys):
+        keys = list(keys)
+        client = self._get_client()
+        if not client:
+            logger.info(f"[RedisCluster MOCK] DELETE {len(keys)} keys from {self.redis_url}")
+            return True
+
+        try:
+            if keys:
+                client.delete(*[self._key(key) for key in keys])
             return True
         except Exception as e:
             logger.error(f"[RedisCluster] DELETE Error: {e}")
@@ -1,4 +1,5 @@
 from .providers import PostgresFullTextProvider, ElasticsearchProvider
+from tenants.infrastructure.registry import ProviderInstanceCache
 
 class SearchFactory:
     """
@@ -7,6 +8,11 @@ class SearchFactory:
     @staticmethod
     def get_provider(tenant):
         config = tenant.config.get('search', {})
+        # Tier 112: One instance per tenant and search config per process
+        return ProviderInstanceCache.get_or_create('search', tenant, config, lambda: SearchFactory._build(config))
+
+    @staticmethod
+    def _build(config):
         provider_type = config.get('provider', 'postgres')
         
         if provider_type == 'elasticsearch':
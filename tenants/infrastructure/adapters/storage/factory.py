@@ -1,6 +1,7 @@
 from django.conf import settings
 from .providers.local import LocalProvider
 from .providers.s3 import S3Provider
+from tenants.infrastructure.registry import ProviderInstanceCache
 
 class StorageFactory:
     """
@@ -16,6 +17,14 @@ class StorageFactory:
         1. Tenant-specific override (e.g. Bank wants Azure)
         2. System-wide default from settings
         """
+        if tenant is not None:
+            # Tier 112: One instance per tenant and storage config per process
+            tenant_config = tenant.config.get('storage') or {}
+            return ProviderInstanceCache.get_or_create('storage', tenant, tenant_config, lambda: StorageFactory._build(tenant))
+        return StorageFactory._build(tenant)
+
+    @staticmethod
+    def _build(tenant):
         # 1. System Defaults
         config = getattr(settings, 'SOVEREIGN_STORAGE', {})
         provider_type = config.get('provider', 'local')
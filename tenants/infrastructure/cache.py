@@ -1,48 +1,582 @@
+import asyncio
+import logging
+import math
+import os
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, NamedTuple
+from asgiref.sync import sync_to_async
 from django.core.cache import cache
 from tenants.infrastructure.utils.context import get_current_tenant
 
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+class LocalTTLCache:
+    """
+    Tier 101: Process-Local Cache (L1).
+    Bounded LRU map with per-entry expiry. Safe to share between worker threads.
+    """
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_where(self, predicate):
+        """Drops every entry whose key matches `predicate`."""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+class _Flight:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    Tier 101: Duplicate Call Suppression.
+    Concurrent callers asking for the same key share one execution of the loader.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._tasks = {}
+
+    def do(self, key, func):
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+    async def ado(self, key, coro_func):
+        """Async counterpart of do(): callers on the same event loop share one task."""
+        task_key = (id(asyncio.get_running_loop()), key)
+        task = self._tasks.get(task_key)
+        if task is None:
+            task = self._tasks[task_key] = asyncio.ensure_future(coro_func())
+            task.add_done_callback(lambda _: self._tasks.pop(task_key, None))
+        return await asyncio.shield(task)
+
+class GenerationCounter:
+    """
+    Tier 101: Shared Invalidation Counter.
+    A number in the shared cache that writers bump to retire everything cached
+    under the previous value. Readers keep a local copy for the poll interval
+    so the hot path does not pay a network round trip per lookup.
+    """
+
+    def __init__(self, name, poll_interval=None):
+        self.name = name
+        self._poll_interval = poll_interval
+        self._local = LocalTTLCache(maxsize=4096)
+
+    @property
+    def poll_interval(self):
+        if self._poll_interval is not None:
+            return self._poll_interval
+        from tenants.infrastructure.conf import conf
+        return conf.CACHE_GENERATION_POLL_INTERVAL
+
+    def _key(self, scope):
+        return f"generation:{self.name}:{scope}" if scope is not None else f"generation:{self.name}"
+
+    @staticmethod
+    def _scope(scope):
+        # UUID and str ids must share one local entry (pub/sub messages carry strings)
+        return None if scope is None else str(scope)
+
+    @staticmethod
+    def _seed():
+        # Seeding from the clock keeps a re-created counter (after eviction)
+        # from colliding with a value another process still holds locally.
+        return int(time.time() * 1000)
+
+    def current(self, scope=None):
+        scope = self._scope(scope)
+        value = self._local.get(scope, _MISSING)
+        if value is _MISSING:
+            key = self._key(scope)
+            value = cache.get(key)
+            if value is None:
+                cache.add(key, self._seed(), timeout=None)
+                value = cache.get(key)
+            self._local.set(scope, value, ttl=self.poll_interval)
+        return value
+
+    async def acurrent(self, scope=None):
+        scope = self._scope(scope)
+        value = self._local.get(scope, _MISSING)
+        if value is _MISSING:
+            key = self._key(scope)
+            value = await cache.aget(key)
+            if value is None:
+                await cache.aadd(key, self._seed(), timeout=None)
+                value = await cache.aget(key)
+            self._local.set(scope, value, ttl=self.poll_interval)
+        return value
+
+    def forget(self, scope=None):
+        """Drops the local copy so the next read goes to the shared cache."""
+        scope = self._scope(scope)
+        self._local.delete(scope)
+
+    def bump(self, scope=None):
+        scope = self._scope(scope)
+        key = self._key(scope)
+        try:
+            value = cache.incr(key)
+        except ValueError:
+            value = self._seed()
+            cache.set(key, value, timeout=None)
+        self._local.set(scope, value, ttl=self.poll_interval)
+        return value
+
+# Tier 115: Bumping a tenant's scope makes every key its cache providers wrote unreachable
+tenant_namespace_generation = GenerationCounter("tenant_namespace")
+
+class LocalCacheLayer:
+    """
+    Tier 116: Opt-In Process-Local Tier (L1) for TenantCache.
+    Keys matching TENANT_CACHE_L1_KEY_PREFIXES are kept in a bounded per-process
+    LRU above the tenant's provider (L2). Entries are stamped with the tenant's
+    namespace generation, so invalidate_tenant() is honoured after at most one
+    generation poll. When TENANT_CACHE_L1_PUBSUB_URL is set, writes and
+    invalidations are also broadcast over Redis pub/sub and applied by every
+    process immediately.
+    """
+    CHANNEL = "tenant_cache:invalidate"
+
+    def __init__(self):
+        self._local = None
+        self._origin = None
+        self._listener_pid = None
+        self._lock = threading.Lock()
+
+        from tenants.infrastructure.metrics import registry
+        self.requests = registry.counter(
+            'tenant_cache_requests_total',
+            'TenantCache lookups by tier (l1 = process-local, l2 = provider) and result.',
+            labelnames=('tier', 'result')
+        )
+
+    def enabled_for(self, key):
+        from tenants.infrastructure.conf import conf
+        prefixes = conf.CACHE_L1_KEY_PREFIXES
+        return bool(prefixes) and key.startswith(tuple(prefixes))
+
+    def _cache(self):
+        if self._local is None:
+            from tenants.infrastructure.conf import conf
+            self._local = LocalTTLCache(maxsize=conf.CACHE_L1_SIZE, ttl=conf.CACHE_L1_TTL)
+        self._ensure_listener()
+        return self._local
+
+    def get(self, full_key, scope):
+        entry = self._cache().get(full_key)
+        if entry is not None and entry[0] == tenant_namespace_generation.current(scope):
+            self.requests.inc(tier='l1', result='hit')
+            return entry[1]
+        self.requests.inc(tier='l1', result='miss')
+        return _MISSING
+
+    def set(self, full_key, scope, value):
+        self._cache().set(full_key, (tenant_namespace_generation.current(scope), value))
+
+    def discard(self, full_key, broadcast=True):
+        self._cache().delete(full_key)
+        if broadcast:
+            self.publish("key", full_key)
+
+    async def adiscard(self, full_key):
+        from tenants.infrastructure.conf import conf
+        self._cache().delete(full_key)
+        if conf.CACHE_L1_PUBSUB_URL:
+            await sync_to_async(self.publish, thread_sensitive=False)("key", full_key)
+
+    def clear(self):
+        if self._local is not None:
+            self._local.clear()
+
+    # --- Pub/Sub ---
+
+    def publish(self, kind, value):
+        from tenants.infrastructure.conf import conf
+        url = conf.CACHE_L1_PUBSUB_URL
+        if not url:
+            return
+        from tenants.infrastructure.adapters.performance.pools import RedisPoolRegistry
+        client = RedisPoolRegistry.get_client(url)
+        if client is None:
+            return
+        try:
+            client.publish(self.CHANNEL, f"{self._origin_id()}|{kind}|{value}")
+        except Exception as e:
+            logger.warning(f"[TenantCache L1] Invalidation publish failed: {e}")
+
+    def _origin_id(self):
+        # Re-derived after a fork so a child never ignores its parent's messages as its own
+        if self._origin is None or self._origin[0] != os.getpid():
+            self._origin = (os.getpid(), uuid.uuid4().hex)
+        return self._origin[1]
+
+    def apply(self, message):
+        """Applies a broadcast invalidation (`origin|kind|value`) to this process."""
+        if isinstance(message, bytes):
+            message = message.decode()
+        origin, kind, value = message.split("|", 2)
+        if origin == self._origin_id() or self._local is None:
+            return
+        if kind == "key":
+            self._local.delete(value)
+        elif kind == "tenant":
+            tenant_namespace_generation.forget(None if value == "shared" else value)
+            self._local.delete_where(lambda key: key.startswith(f"tenant:{value}:"))
+        elif kind == "tag":
+            TenantCache.tag_generation.forget(value)
+
+    def _ensure_listener(self):
+        from tenants.infrastructure.conf import conf
+        url = conf.CACHE_L1_PUBSUB_URL
+        if not url or self._listener_pid == os.getpid():
+            return
+        with self._lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._listener_pid = os.getpid()
+            threading.Thread(target=self._listen, args=(url,), name="tenant-cache-l1-invalidation", daemon=True).start()
+
+    def _listen(self, url):
+        try:
+            import redis
+        except ImportError:
+            logger.error("[TenantCache L1] redis-py not installed; falling back to generation polling.")
+            return
+
+        while True:
+            try:
+                # Dedicated connection without a read timeout: subscribers block between messages
+                client = redis.Redis.from_url(url, health_check_interval=30)
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.CHANNEL)
+                for message in pubsub.listen():
+                    self.apply(message['data'])
+            except Exception as e:
+                logger.warning(f"[TenantCache L1] Invalidation channel lost ({e}); resubscribing.")
+                # Messages may have been missed while disconnected
+                self.clear()
+                time.sleep(1)
+
+class CacheEnvelope(NamedTuple):
+    """Tier 114: A get_or_set value with the metadata needed for early refresh."""
+    value: Any
+    delta: float       # seconds the last recompute took
+    expires_at: float  # logical (not physical) expiry, epoch seconds
+
 class TenantCache:
     """
     Sovereign Cache Wrapper.
+
+    Tier 115: The tenant's cache providers stamp keys with a per-tenant namespace
+    generation, so invalidate_tenant() drops everything with a single incr. Keys
+    written with `tags` additionally carry each tag's generation, and
+    invalidate_tag() retires just that group. Other processes notice a bump
+    within TENANT_CACHE_GENERATION_POLL_INTERVAL seconds.
     """
-    
+    _flights = SingleFlight()
+    tag_generation = GenerationCounter("tenant_cache_tag")
+    l1 = LocalCacheLayer()
+
     @staticmethod
-    def _get_key(key):
+    def _tag_scope(tenant_id, tag):
+        return f"{tenant_id or 'shared'}:{tag}"
+
+    @classmethod
+    def _get_key(cls, key, tags=()):
         tenant = get_current_tenant()
         prefix = str(tenant.id) if tenant else "shared"
+        if tags:
+            stamps = ",".join(
+                f"{tag}.{cls.tag_generation.current(cls._tag_scope(tenant and tenant.id, tag))}" for tag in sorted(tags)
+            )
+            return f"tenant:{prefix}:[{stamps}]:{key}"
         return f"tenant:{prefix}:{key}"
 
+    @classmethod
+    def invalidate_tenant(cls, tenant_id):
+        """Makes every key cached for `tenant_id` unreachable; they age out via their TTLs."""
+        generation = tenant_namespace_generation.bump(tenant_id)
+        cls.l1.publish("tenant", tenant_id or "shared")
+        return generation
+
+    @classmethod
+    def invalidate_tag(cls, tag, tenant_id=None):
+        """Retires every key written with `tag` for `tenant_id` (default: the current tenant)."""
+        if tenant_id is None:
+            tenant = get_current_tenant()
+            tenant_id = tenant.id if tenant else None
+        scope = cls._tag_scope(tenant_id, tag)
+        generation = cls.tag_generation.bump(scope)
+        cls.l1.publish("tag", scope)
+        return generation
+
     @staticmethod
     def _get_provider():
         from tenants.infrastructure.utils.context import get_current_tenant
         from tenants.infrastructure.adapters.performance.factory import CacheFactory
-        
+
         tenant = get_current_tenant()
         if not tenant:
             # Fallback to default cache for system ops
             from django.core.cache import cache
             return cache
-            
+
         return CacheFactory.get_provider(tenant)
 
+    @staticmethod
+    def _unwrap(value):
+        return value.value if isinstance(value, CacheEnvelope) else value
+
+    @staticmethod
+    def _encode(full_key, value):
+        from tenants.infrastructure.codecs import CacheCodec
+        return CacheCodec.encode(full_key, value)
+
+    @staticmethod
+    def _decode(full_key, data):
+        from tenants.infrastructure.codecs import CacheCodec
+        return CacheCodec.decode(full_key, data)
+
+    @staticmethod
+    def _scope():
+        tenant = get_current_tenant()
+        return tenant.id if tenant else None
+
+    @classmethod
+    def _from_l2(cls, full_key, value, local):
+        cls.l1.requests.inc(tier='l2', result='miss' if value is _MISSING else 'hit')
+        value = cls._unwrap(cls._decode(full_key, value))
+        if local and value is not _MISSING:
+            cls.l1.set(full_key, cls._scope(), value)
+        return value
+
+    @classmethod
+    def get(cls, key, default=None, tags=()):
+        full_key = cls._get_key(key, tags)
+        local = cls.l1.enabled_for(key)
+        if local:
+            value = cls.l1.get(full_key, cls._scope())
+            if value is not _MISSING:
+                return value
+
+        value = cls._from_l2(full_key, cls._get_provider().get(full_key, _MISSING), local)
+        return default if value is _MISSING else value
+
     @classmethod
-    def get(cls, key, default=None):
-        return cls._get_provider().get(cls._get_key(key), default)
+    def set(cls, key, value, timeout=300, tags=()):
+        full_key = cls._get_key(key, tags)
+        result = cls._get_provider().set(full_key, cls._encode(full_key, value), timeout)
+        if cls.l1.enabled_for(key):
+            # Other processes drop their copy; this one keeps the value it just wrote
+            cls.l1.discard(full_key)
+            cls.l1.set(full_key, cls._scope(), value)
+        return result
 
     @classmethod
-    def set(cls, key, value, timeout=300):
-        return cls._get_provider().set(cls._get_key(key), value, timeout)
+    def delete(cls, key, tags=()):
+        full_key = cls._get_key(key, tags)
+        result = cls._get_provider().delete(full_key)
+        if cls.l1.enabled_for(key):
+            cls.l1.discard(full_key)
+        return result
 
     @classmethod
-    def delete(cls, key):
-        return cls._get_provider().delete(cls._get_key(key))
+    def get_many(cls, keys, tags=()):
+        """Tier 113: Batched get; returns the found values keyed by the caller's (unprefixed) keys."""
+        full_keys = {cls._get_key(key, tags): key for key in keys}
+        found = cls._get_provider().get_many(list(full_keys))
+        return {full_keys[key]: cls._unwrap(cls._decode(key, value)) for key, value in found.items()}
 
     @classmethod
-    def get_or_set(cls, key, default_func, timeout=3600):
-        """Standard Django get_or_set but with tenant prefixing."""
-        full_key = cls._get_key(key)
-        val = cls._get_provider().get(full_key)
-        if val is None:
-            val = default_func()
-            cache.set(full_key, val, timeout)
-        return val
+    def set_many(cls, mapping, timeout=300, tags=()):
+        full_keys = {key: cls._get_key(key, tags) for key in mapping}
+        result = cls._get_provider().set_many(
+            {full_keys[key]: cls._encode(full_keys[key], value) for key, value in mapping.items()}, timeout
+        )
+        cls._discard_local(full_keys)
+        return result
+
+    @classmethod
+    def delete_many(cls, keys, tags=()):
+        full_keys = {key: cls._get_key(key, tags) for key in keys}
+        result = cls._get_provider().delete_many(list(full_keys.values()))
+        cls._discard_local(full_keys)
+        return result
+
+    @classmethod
+    def _discard_local(cls, full_keys):
+        for key, full_key in full_keys.items():
+            if cls.l1.enabled_for(key):
+                cls.l1.discard(full_key)
+
+    @classmethod
+    async def aget(cls, key, default=None, tags=()):
+        full_key = cls._get_key(key, tags)
+        local = cls.l1.enabled_for(key)
+        if local:
+            value = cls.l1.get(full_key, cls._scope())
+            if value is not _MISSING:
+                return value
+
+        provider = cls._get_provider()
+        if hasattr(provider, 'aget'):
+            value = await provider.aget(full_key, _MISSING)
+        else:
+            value = await sync_to_async(provider.get)(full_key, _MISSING)
+        value = cls._from_l2(full_key, value, local)
+        return default if value is _MISSING else value
+
+    @classmethod
+    async def aset(cls, key, value, timeout=300, tags=()):
+        full_key = cls._get_key(key, tags)
+        provider = cls._get_provider()
+        if hasattr(provider, 'aset'):
+            result = await provider.aset(full_key, cls._encode(full_key, value), timeout)
+        else:
+            result = await sync_to_async(provider.set)(full_key, cls._encode(full_key, value), timeout)
+        if cls.l1.enabled_for(key):
+            await cls.l1.adiscard(full_key)
+            cls.l1.set(full_key, cls._scope(), value)
+        return result
+
+    @classmethod
+    def get_or_set(cls, key, default_func, timeout=3600, tags=()):
+        """
+        Tier 114: Stampede-Proof get_or_set.
+        Values are wrapped in a CacheEnvelope and refreshed early with a probability
+        that grows towards expiry (XFetch). Only the holder of a short-lived add()
+        lock recomputes; everyone else keeps serving the stale value, which is kept
+        physically for TENANT_CACHE_STALE_GRACE seconds past its logical expiry.
+        """
+        full_key = cls._get_key(key, tags)
+        if not cls.l1.enabled_for(key):
+            return cls._get_or_set(full_key, default_func, timeout)
+
+        value = cls.l1.get(full_key, cls._scope())
+        if value is _MISSING:
+            value = cls._get_or_set(full_key, default_func, timeout)
+            cls.l1.set(full_key, cls._scope(), value)
+        return value
+
+    @classmethod
+    def _get_or_set(cls, full_key, default_func, timeout):
+        from tenants.infrastructure.conf import conf
+
+        provider = cls._get_provider()
+        entry = cls._decode(full_key, provider.get(full_key))
+
+        if entry is not None and not isinstance(entry, CacheEnvelope):
+            # Written by a plain set(); honour it as-is
+            return entry
+
+        if entry is not None:
+            jitter = entry.delta * conf.CACHE_XFETCH_BETA * math.log(1.0 - random.random())
+            if time.time() - jitter < entry.expires_at:
+                return entry.value
+
+        # Concurrent callers in this process share one refresh attempt
+        return cls._flights.do(full_key, lambda: cls._refresh(provider, full_key, entry, default_func, timeout))
+
+    @classmethod
+    def _refresh(cls, provider, full_key, stale, default_func, timeout):
+        from tenants.infrastructure.conf import conf
+
+        lock_key = f"{full_key}:refresh_lock"
+        if provider.add(lock_key, 1, conf.CACHE_LOCK_TIMEOUT):
+            try:
+                return cls._recompute(provider, full_key, default_func, timeout)
+            finally:
+                provider.delete(lock_key)
+
+        # Another process is recomputing
+        if stale is not None:
+            return stale.value
+
+        # Cold miss: wait for the lock holder's result rather than piling onto the backend
+        deadline = time.monotonic() + conf.CACHE_LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            entry = cls._decode(full_key, provider.get(full_key))
+            if isinstance(entry, CacheEnvelope):
+                return entry.value
+
+        return cls._recompute(provider, full_key, default_func, timeout)
+
+    @classmethod
+    def _recompute(cls, provider, full_key, default_func, timeout):
+        from tenants.infrastructure.conf import conf
+
+        started = time.monotonic()
+        value = default_func()
+        envelope = CacheEnvelope(value, time.monotonic() - started, time.time() + timeout)
+        provider.set(full_key, cls._encode(full_key, envelope), timeout + conf.CACHE_STALE_GRACE)
+        return value
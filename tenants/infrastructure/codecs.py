@@ -0,0 +1,178 @@
+import datetime
+import decimal
+import json
+import pickle
+import struct
+import time
+import uuid
+import zlib
+from tenants.infrastructure.conf import conf
+from tenants.infrastructure.metrics import registry
+
+try:
+    import msgpack
+except ImportError:  # Optional: falls back to compact JSON
+    msgpack = None
+
+# Header byte per format; the lowercase variant marks a zlib-compressed body.
+JSON, MSGPACK, PICKLE = b'J', b'M', b'P'
+ENVELOPE = b'E'
+_ENVELOPE_META = struct.Struct('!dd')
+
+value_bytes = registry.histogram(
+    'tenant_cache_value_bytes',
+    'Encoded TenantCache value size per key family.',
+    labelnames=('family',),
+    buckets=(64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+)
+decode_seconds = registry.histogram(
+    'tenant_cache_decode_seconds',
+    'Time spent decoding TenantCache values per key family.',
+    labelnames=('family',),
+    buckets=(0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.005, 0.01)
+)
+
+def _default(value):
+    """Plain-type stand-ins for the scalar types snapshots carry (ModelSnapshot only)."""
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, decimal.Decimal)):
+        return str(value)
+    return value
+
+_SCALARS = (str, int, float, bool, type(None))
+
+def _is_plain(value):
+    """True only for values JSON/msgpack give back unchanged: no tuples, no non-str keys."""
+    kind = type(value)
+    if kind in _SCALARS:
+        return True
+    if kind is list:
+        return all(_is_plain(item) for item in value)
+    if kind is dict:
+        return all(type(key) is str and _is_plain(item) for key, item in value.items())
+    return False
+
+def _family(key):
+    # "tenant:<id>:[tag stamps]:domain_resolution:..." -> "domain_resolution"
+    parts = key.split(':')
+    if parts[0] == 'tenant':
+        parts = [part for part in parts[2:] if not part.startswith('[')] or ['']
+    return parts[0]
+
+class CacheCodec:
+    """
+    Tier 117: TenantCache Value Codec.
+    Values are stored as bytes: one header byte naming the format, then the body.
+    Plain data goes through msgpack (when installed) or compact JSON; anything
+    those formats would not return with the same types (datetimes, UUIDs,
+    tuples, non-str keys, ...) falls back to pickle so existing callers keep working. Bodies above
+    TENANT_CACHE_COMPRESSION_THRESHOLD bytes are zlib-compressed. get_or_set
+    envelopes carry their refresh metadata in a fixed-size prefix.
+    """
+
+    @staticmethod
+    def _format():
+        name = conf.CACHE_CODEC
+        if name == 'auto':
+            return MSGPACK if msgpack is not None else JSON
+        return {'msgpack': MSGPACK if msgpack is not None else JSON, 'json': JSON, 'pickle': PICKLE}[name]
+
+    @staticmethod
+    def _dump(value, fmt):
+        if fmt == MSGPACK:
+            return msgpack.packb(value, use_bin_type=True)
+        if fmt == JSON:
+            return json.dumps(value, separators=(',', ':')).encode()
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _load(body, fmt):
+        if fmt == MSGPACK:
+            return msgpack.unpackb(body, raw=False)
+        if fmt == JSON:
+            return json.loads(body)
+        return pickle.loads(body)
+
+    @classmethod
+    def encode_value(cls, value):
+        fmt = cls._format()
+        if fmt != PICKLE and not _is_plain(value):
+            fmt = PICKLE
+        try:
+            body = cls._dump(value, fmt)
+        except (TypeError, ValueError, OverflowError):
+            fmt, body = PICKLE, cls._dump(value, PICKLE)
+
+        if len(body) > conf.CACHE_COMPRESSION_THRESHOLD:
+            compressed = zlib.compress(body)
+            if len(compressed) < len(body):
+                return fmt.lower() + compressed
+        return fmt + body
+
+    @classmethod
+    def decode_value(cls, data):
+        header, body = data[:1], data[1:]
+        if header.islower():
+            header, body = header.upper(), zlib.decompress(body)
+        return cls._load(body, header)
+
+    @staticmethod
+    def is_encoded(data):
+        return isinstance(data, (bytes, bytearray)) and data[:1] in (ENVELOPE, JSON, MSGPACK, PICKLE, b'j', b'm', b'p')
+
+    @classmethod
+    def encode(cls, key, value):
+        from tenants.infrastructure.cache import CacheEnvelope
+
+        if isinstance(value, CacheEnvelope):
+            data = ENVELOPE + _ENVELOPE_META.pack(value.delta, value.expires_at) + cls.encode_value(value.value)
+        else:
+            data = cls.encode_value(value)
+        value_bytes.observe(len(data), family=_family(key))
+        return data
+
+    @classmethod
+    def decode(cls, key, data):
+        from tenants.infrastructure.cache import CacheEnvelope
+
+        if not cls.is_encoded(data):
+            # Written before the codec existed (or a sentinel); pass through untouched
+            return data
+
+        started = time.perf_counter()
+        data = bytes(data)
+        if data[:1] == ENVELOPE:
+            delta, expires_at = _ENVELOPE_META.unpack_from(data, 1)
+            value = CacheEnvelope(cls.decode_value(data[1 + _ENVELOPE_META.size:]), delta, expires_at)
+        else:
+            value = cls.decode_value(data)
+        decode_seconds.observe(time.perf_counter() - started, family=_family(key))
+        return value
+
+class ModelSnapshot:
+    """
+    Tier 117: Plain Model Snapshot.
+    A model instance reduced to its concrete column values, so it can travel
+    through the codec without pickling and survives deploys that add fields.
+    """
+
+    @staticmethod
+    def dump(instance):
+        # Scalars are reduced to strings here (and parsed back by to_python), so the
+        # snapshot stays plain and never needs the pickle path
+        return {
+            field.attname: _default(field.get_prep_value(field.value_from_object(instance)))
+            for field in instance._meta.concrete_fields
+        }
+
+    @staticmethod
+    def load(model, data):
+        values = {}
+        for field in model._meta.concrete_fields:
+            if field.attname in data:
+                values[field.attname] = field.to_python(data[field.attname])
+        instance = model(**values)
+        instance._state.adding = False
+        instance._state.db = 'default'
+        return instance
@@ -16,11 +16,31 @@ class SovereignConfig:
             'MASTER_SECRET'
         ],
         'STORAGE': ['STORAGE_PATH_PREFIX'],
-        'RESILIENCE': ['CIRCUIT_BREAKER_THRESHOLD', 'CIRCUIT_BREAKER_RESET_TIMEOUT', 'TRACING_ENABLED'],
+        'RESILIENCE': [
+            'CIRCUIT_BREAKER_THRESHOLD', 'CIRCUIT_BREAKER_RESET_TIMEOUT', 'TRACING_ENABLED',
+            'CIRCUIT_BREAKER_WINDOW', 'CIRCUIT_BREAKER_FAILURE_RATE', 'CIRCUIT_BREAKER_HALF_OPEN_CALLS',
+            'CIRCUIT_BREAKER_ACTIONS', 'CIRCUIT_BREAKER_REGISTRY_SIZE',
+            'RETRY_MAX_ATTEMPTS', 'RETRY_BASE_DELAY_MS', 'RETRY_MAX_DELAY_MS', 'RETRY_DEADLINE_MS',
+            'RETRY_ON', 'RETRY_POLICIES', 'REQUEST_DEADLINE_MS',
+            'HEDGE_QUANTILE', 'HEDGE_MIN_SAMPLES', 'HEDGE_MAX_WORKERS',
+            'BULKHEAD_MAX_CONCURRENT', 'BULKHEAD_MAX_WAITING', 'BULKHEAD_WAIT_TIMEOUT_MS', 'BULKHEAD_PLAN_LIMITS',
+            'BULKHEAD_REGISTRY_SIZE',
+            'TELEMETRY_BUFFERED', 'TELEMETRY_BUFFER_SIZE', 'TELEMETRY_BATCH_SIZE', 'TELEMETRY_FLUSH_INTERVAL_MS',
+            'GOVERNOR_SOFT_LIMIT', 'GOVERNOR_HARD_LIMIT', 'GOVERNOR_RECOVERY_RATE',
+            'GOVERNOR_ERROR_THRESHOLD', 'GOVERNOR_QUARANTINE_SECONDS'
+        ],
         'GOVERNANCE': ['QUOTA_STRICT_MODE', 'AUDIT_LOG_RETENTION_DAYS'],
         'BILLING': ['BILLING_PROVIDER_DEFAULT'],
         'COMMUNICATION': ['EMAIL_PROVIDER_DEFAULT', 'SMS_PROVIDER_DEFAULT', 'WHATSAPP_PROVIDER_DEFAULT'],
-        'PERFORMANCE': ['CACHE_ISOLATION_STRATEGY', 'QUEUE_ISOLATION_STRATEGY'],
+        'PERFORMANCE': [
+            'CACHE_ISOLATION_STRATEGY', 'QUEUE_ISOLATION_STRATEGY', 'CACHE_GENERATION_POLL_INTERVAL',
+            'RESOLUTION_CACHE_SIZE', 'RESOLUTION_CACHE_TTL', 'MEMBERSHIP_CACHE_SIZE', 'MEMBERSHIP_CACHE_TTL',
+            'IMPERSONATION_CACHE_TTL', 'REDIS_POOL_MAX_CONNECTIONS', 'REDIS_POOL_TIMEOUT', 'REDIS_HEALTH_CHECK_INTERVAL',
+            'REDIS_SOCKET_TIMEOUT', 'PROVIDER_CACHE_SIZE', 'PROVIDER_CACHE_TTL',
+            'CACHE_LOCK_TIMEOUT', 'CACHE_STALE_GRACE', 'CACHE_XFETCH_BETA',
+            'CACHE_L1_KEY_PREFIXES', 'CACHE_L1_SIZE', 'CACHE_L1_TTL', 'CACHE_L1_PUBSUB_URL',
+            'CACHE_CODEC', 'CACHE_COMPRESSION_THRESHOLD'
+        ],
         'SEARCH': ['SEARCH_PROVIDER_DEFAULT', 'ELASTICSEARCH_URL'],
     }
 
@@ -28,7 +48,7 @@ class SovereignConfig:
     METADATA = {
         'BASE_SAAS_DOMAIN': 'Primary domain for the SaaS platform (e.g., localhost or saas.com).',
         'STORAGE_PATH_PREFIX': 'Subdirectory prefix for all tenant-specific file uploads.',
-        'CIRCUIT_BREAKER_THRESHOLD': 'Consecutive failures before tripping the circuit for a specific provider.',
+        'CIRCUIT_BREAKER_THRESHOLD': 'Failures within the window (fleet-wide) before tripping the circuit for a specific provider.',
         'TRACING_ENABLED': 'Whether to emit OpenTelemetry spans for infrastructure calls.',
         'BILLING_PROVIDER_DEFAULT': 'Default gateway for new tenant subscriptions (stripe, mock).',
         'MASTER_SECRET': 'Critical key used for cross-tenant data signing and inter-service authentication.',
@@ -37,6 +57,56 @@ class SovereignConfig:
         'CACHE_ISOLATION_STRATEGY': 'Determines how cache data is separated (NAMESPACE vs CLUSTER).',
         'QUEUE_ISOLATION_STRATEGY': 'Determines how tasks are isolated (VHOST vs NAMESPACE).',
         'SEARCH_PROVIDER_DEFAULT': 'Primary provider for full-text search (elasticsearch, mock).',
+        'CACHE_GENERATION_POLL_INTERVAL': 'Seconds a process trusts its local copy of a shared invalidation counter.',
+        'RESOLUTION_CACHE_SIZE': 'Max hostnames kept in the per-process tenant resolution cache.',
+        'RESOLUTION_CACHE_TTL': 'Seconds a resolved hostname stays in the per-process cache.',
+        'MEMBERSHIP_CACHE_SIZE': 'Max (user, tenant) membership verdicts kept per process.',
+        'MEMBERSHIP_CACHE_TTL': 'Seconds a membership verdict is trusted before re-checking the DB.',
+        'IMPERSONATION_CACHE_TTL': 'Seconds an impersonating staff identity is served from cache.',
+        'REDIS_POOL_MAX_CONNECTIONS': 'Max connections per Redis URL per process (shared pool).',
+        'REDIS_POOL_TIMEOUT': 'Seconds a caller waits for a free pooled Redis connection once the pool is at its cap.',
+        'REDIS_HEALTH_CHECK_INTERVAL': 'Seconds a pooled Redis connection may idle before it is pinged on checkout.',
+        'REDIS_SOCKET_TIMEOUT': 'Connect/read timeout in seconds for pooled Redis connections.',
+        'PROVIDER_CACHE_SIZE': 'Max memoized adapter provider instances kept per process.',
+        'PROVIDER_CACHE_TTL': 'Seconds a memoized adapter provider instance is reused before being rebuilt.',
+        'CACHE_LOCK_TIMEOUT': 'Seconds a get_or_set recompute lock is held before another caller may take over.',
+        'CACHE_STALE_GRACE': 'Seconds a get_or_set value is kept past expiry so it can be served during a refresh.',
+        'CACHE_XFETCH_BETA': 'Early-refresh aggressiveness for get_or_set (1.0 = standard XFetch, higher refreshes sooner).',
+        'CACHE_L1_KEY_PREFIXES': 'TenantCache key prefixes (e.g. "entitlements:") also kept in the per-process L1 tier.',
+        'CACHE_L1_SIZE': 'Max entries in the per-process TenantCache L1 tier.',
+        'CACHE_L1_TTL': 'Seconds an L1 entry is trusted when no invalidation reaches it.',
+        'CACHE_L1_PUBSUB_URL': 'Redis URL for broadcasting L1 invalidations; unset means generation polling only.',
+        'CACHE_CODEC': 'TenantCache value format: auto (msgpack if installed, else JSON), msgpack, json or pickle.',
+        'CACHE_COMPRESSION_THRESHOLD': 'Encoded TenantCache values larger than this many bytes are zlib-compressed.',
+        'CIRCUIT_BREAKER_WINDOW': 'Sliding window (seconds) over which circuit breaker failures are counted.',
+        'CIRCUIT_BREAKER_FAILURE_RATE': 'Minimum local failure rate (0-1) in the window before a circuit may trip.',
+        'CIRCUIT_BREAKER_HALF_OPEN_CALLS': 'Concurrent probe calls admitted while a circuit is half-open.',
+        'CIRCUIT_BREAKER_ACTIONS': 'Per-operation breaker overrides keyed by "PROVIDER.action", "action" or "PROVIDER", e.g. {"SEARCH.search": {"threshold": 3, "reset_timeout": 15}}.',
+        'CIRCUIT_BREAKER_REGISTRY_SIZE': 'Most circuit breakers kept per process; the least recently used are discarded.',
+        'RETRY_MAX_ATTEMPTS': 'Attempts per provider call (including the first) before moving to the next fallback.',
+        'RETRY_BASE_DELAY_MS': 'Base of the exponential backoff between provider call attempts (full jitter is applied).',
+        'RETRY_MAX_DELAY_MS': 'Cap on a single backoff delay between provider call attempts.',
+        'RETRY_DEADLINE_MS': 'Total time budget for one provider call including retries (None for no per-call budget).',
+        'RETRY_ON': 'Dotted paths of exception classes treated as retryable; missing libraries are ignored.',
+        'RETRY_POLICIES': 'Per-operation retry overrides keyed by "PROVIDER.action", "action" or "PROVIDER", e.g. {"EMAIL.send_email": {"max_attempts": 3, "deadline_ms": 5000}}. The defaults disable retries for the non-idempotent send_* actions; keep those entries when overriding.',
+        'REQUEST_DEADLINE_MS': 'Deadline applied to each request and inherited by provider calls made while serving it (None to disable).',
+        'HEDGE_QUANTILE': 'Observed latency quantile of the primary provider after which a hedged call fires the first fallback.',
+        'HEDGE_MIN_SAMPLES': 'Successful primary calls observed in-process before hedging is attempted.',
+        'HEDGE_MAX_WORKERS': 'Size of the per-process thread pool that runs hedged provider calls; when every worker is busy, calls run inline without a hedge.',
+        'BULKHEAD_MAX_CONCURRENT': 'Concurrent in-flight provider calls per tenant and provider in each process.',
+        'BULKHEAD_MAX_WAITING': 'Calls allowed to queue for a busy bulkhead before new calls are rejected outright.',
+        'BULKHEAD_WAIT_TIMEOUT_MS': 'Longest a queued call waits for a bulkhead slot before being rejected.',
+        'BULKHEAD_PLAN_LIMITS': 'Bulkhead overrides per plan slug, optionally per provider, e.g. {"free": {"max_concurrent": 2, "EMAIL": {"max_concurrent": 1}}}.',
+        'BULKHEAD_REGISTRY_SIZE': 'Most (tenant, provider) bulkheads kept per process; the least recently used idle ones are discarded.',
+        'TELEMETRY_BUFFERED': 'Write provider telemetry through the background bulk_create buffer instead of inline inserts.',
+        'TELEMETRY_BUFFER_SIZE': 'Maximum telemetry records held in memory; further records are dropped and counted.',
+        'TELEMETRY_BATCH_SIZE': 'Telemetry records per bulk_create; a full batch wakes the flusher early.',
+        'TELEMETRY_FLUSH_INTERVAL_MS': 'Maximum time a telemetry record waits in the buffer before being flushed.',
+        'GOVERNOR_SOFT_LIMIT': 'Requests/min per tenant above which the governor answers 429 with Retry-After.',
+        'GOVERNOR_HARD_LIMIT': 'Requests/min per tenant that triggers an automatic quarantine.',
+        'GOVERNOR_RECOVERY_RATE': 'Requests/min a quarantined tenant must drop below to be released.',
+        'GOVERNOR_ERROR_THRESHOLD': '5xx responses/min per tenant before the tenant is flagged unhealthy.',
+        'GOVERNOR_QUARANTINE_SECONDS': 'Duration of an automatic quarantine.',
     }
 
     # Settings that MUST be defined in settings.py (no defaults)
@@ -64,6 +134,64 @@ class SovereignConfig:
         'SEARCH_PROVIDER_DEFAULT': 'mock',
         'ELASTICSEARCH_URL': 'http://localhost:9200',
         'SANDBOX_MODE': False,
+        'CACHE_GENERATION_POLL_INTERVAL': 2,
+        'RESOLUTION_CACHE_SIZE': 1024,
+        'RESOLUTION_CACHE_TTL': 60,
+        'MEMBERSHIP_CACHE_SIZE': 10000,
+        'MEMBERSHIP_CACHE_TTL': 300,
+        'IMPERSONATION_CACHE_TTL': 60,
+        'REDIS_POOL_MAX_CONNECTIONS': 50,
+        'REDIS_POOL_TIMEOUT': 2,
+        'REDIS_HEALTH_CHECK_INTERVAL': 30,
+        'REDIS_SOCKET_TIMEOUT': 5,
+        'PROVIDER_CACHE_SIZE': 2048,
+        'PROVIDER_CACHE_TTL': 600,
+        'CACHE_LOCK_TIMEOUT': 10,
+        'CACHE_STALE_GRACE': 60,
+        'CACHE_XFETCH_BETA': 1.0,
+        'CACHE_L1_KEY_PREFIXES': [],
+        'CACHE_L1_SIZE': 10000,
+        'CACHE_L1_TTL': 30,
+        'CACHE_L1_PUBSUB_URL': None,
+        'CACHE_CODEC': 'auto',
+        'CACHE_COMPRESSION_THRESHOLD': 1024,
+        'CIRCUIT_BREAKER_WINDOW': 60,
+        'CIRCUIT_BREAKER_FAILURE_RATE': 0.5,
+        'CIRCUIT_BREAKER_HALF_OPEN_CALLS': 1,
+        'CIRCUIT_BREAKER_ACTIONS': {},
+        'CIRCUIT_BREAKER_REGISTRY_SIZE': 10000,
+        'RETRY_MAX_ATTEMPTS': 2,
+        'RETRY_BASE_DELAY_MS': 100,
+        'RETRY_MAX_DELAY_MS': 2000,
+        'RETRY_DEADLINE_MS': 10000,
+        'RETRY_ON': [
+            'builtins.ConnectionError', 'smtplib.SMTPServerDisconnected', 'smtplib.SMTPConnectError',
+            'requests.exceptions.ConnectionError',
+        ],
+        # Sends are not idempotent: a retry after a timeout can deliver the message twice
+        'RETRY_POLICIES': {
+            'send_email': {'max_attempts': 1},
+            'send_sms': {'max_attempts': 1},
+            'send_whatsapp': {'max_attempts': 1},
+        },
+        'REQUEST_DEADLINE_MS': None,
+        'HEDGE_QUANTILE': 0.95,
+        'HEDGE_MIN_SAMPLES': 50,
+        'HEDGE_MAX_WORKERS': 16,
+        'BULKHEAD_MAX_CONCURRENT': 10,
+        'BULKHEAD_MAX_WAITING': 5,
+        'BULKHEAD_WAIT_TIMEOUT_MS': 100,
+        'BULKHEAD_PLAN_LIMITS': {},
+        'BULKHEAD_REGISTRY_SIZE': 10000,
+        'TELEMETRY_BUFFERED': True,
+        'TELEMETRY_BUFFER_SIZE': 10000,
+        'TELEMETRY_BATCH_SIZE': 500,
+        'TELEMETRY_FLUSH_INTERVAL_MS': 1000,
+        'GOVERNOR_SOFT_LIMIT': 1000,
+        'GOVERNOR_HARD_LIMIT': 5000,
+        'GOVERNOR_RECOVERY_RATE': 100,
+        'GOVERNOR_ERROR_THRESHOLD': 50,
+        'GOVERNOR_QUARANTINE_SECONDS': 300,
     }
 
     def __getattr__(self, name: str) -> Any:
@@ -1,4 +1,6 @@
 from django.db import connection
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
 
 class SQLiteSchemaSimulator:
     """Mock for SQLite to prevent crashes while demonstrating Apex logic."""
@@ -11,14 +13,44 @@ class SQLiteSchemaSimulator:
         pass
 
 class PostgresSchemaManager:
-    """Apex Tier: Real Physical Isolation using PostgreSQL Schemas."""
-    
+    """
+    Apex Tier: Real Physical Isolation using PostgreSQL Schemas.
+
+    Tier 108: set_schema() only records the wanted schema on the connection. An
+    execute wrapper issues `SET search_path` right before the next query, and only
+    when it differs from what the session already has, so LOGICAL tenants and
+    cache-only requests never pay for the statement.
+    """
+    DEFAULT_SCHEMA = 'public'
+
     @staticmethod
     def set_schema(schema_name):
         """Switches the current database connection to the specified schema."""
-        with connection.cursor() as cursor:
+        connection.tenant_schema = schema_name
+        if not getattr(connection, '_search_path_wrapper_installed', False):
+            connection.execute_wrappers.append(PostgresSchemaManager._apply_search_path)
+            connection._search_path_wrapper_installed = True
+
+    @staticmethod
+    def reset_tracking(conn):
+        """A fresh session starts on the server default, which we treat as 'public'."""
+        conn._applied_search_path = PostgresSchemaManager.DEFAULT_SCHEMA
+
+    @staticmethod
+    def _apply_search_path(execute, sql, params, many, context):
+        conn = context['connection']
+        wanted = getattr(conn, 'tenant_schema', PostgresSchemaManager.DEFAULT_SCHEMA)
+
+        if wanted != getattr(conn, '_applied_search_path', PostgresSchemaManager.DEFAULT_SCHEMA):
+            # The raw cursor bypasses the wrappers, so this does not recurse.
             # We also include 'public' for shared tables (Plans, etc.)
-            cursor.execute(f"SET search_path TO {schema_name}, public")
+            context['cursor'].cursor.execute(f"SET search_path TO {wanted}, public")
+            # A rolled-back transaction or savepoint silently undoes its SET, so only
+            # SETs issued in autocommit are remembered; inside an atomic block the
+            # session's path stays unknown and the next query sets it again.
+            conn._applied_search_path = None if conn.in_atomic_block else wanted
+
+        return execute(sql, params, many, context)
 
     @staticmethod
     def create_schema(schema_name):
@@ -57,3 +89,9 @@ class SchemaManager:
                 [schema_name]
             )
             return cursor.fetchone() is not None
+
+@receiver(connection_created, dispatch_uid="sovereign_search_path_tracking")
+def reset_search_path_tracking(sender, connection, **kwargs):
+    """Tier 108: (Re)connected sessions lose their search_path, so forget what was applied."""
+    if connection.vendor == 'postgresql':
+        PostgresSchemaManager.reset_tracking(connection)
@@ -1,5 +1,12 @@
 from tenants.infrastructure.adapters.database.factory import DatabaseFactory
+import contextlib
+import contextvars
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+from django.db import close_old_connections
 from tenants.infrastructure.adapters.communication.factory import CommunicationFactory
 from tenants.infrastructure.adapters.storage.factory import StorageFactory
 from tenants.infrastructure.adapters.identity.factory import IdentityFactory
@@ -8,9 +15,12 @@ from tenants.infrastructure.adapters.audit.factory import AuditFactory
 from tenants.infrastructure.adapters.search.factory import SearchFactory
 from tenants.infrastructure.adapters.performance.factory import CacheFactory, QueueFactory
 from tenants.infrastructure.adapters.control.factory import ControlFactory
-from tenants.infrastructure.utils.resilience import circuit_breaker
-from tenants.infrastructure.utils.telemetry import get_tracer, InfrastructureTelemetryBridge
+from tenants.infrastructure.utils.telemetry import get_tracer, InfrastructureTelemetryBridge, LatencyTracker
+from tenants.infrastructure.metrics import registry
 from tenants.infrastructure.conf import conf
+from tenants.infrastructure.utils.context import set_current_deadline, reset_current_deadline
+from tenants.infrastructure.cache import LocalTTLCache
+from tenants.infrastructure.utils.resilience import Bulkhead, CircuitBreaker, RetryPolicy, action_setting
 from tenants.infrastructure.adapters.communication.providers.mock import MockEmailProvider, MockSMSProvider, MockWhatsAppProvider
 
 logger = logging.getLogger(__name__)
@@ -20,61 +30,331 @@ class ResilientProviderProxy:
     """
     Tier 93/94: Proxy for infrastructure providers.
     Wraps all method calls with telemetry and fallback logic.
+    Tier 123: `fallbacks` is the tenant's ordered list of (vendor, provider)
+    tried after the primary; `hedge` (True or a list of actions) races the
+    first fallback against a primary that outlives its observed p95.
+    Tier 125: Every call holds a slot in the tenant's Bulkhead for this provider;
+    hedged calls hold one per pooled call until that call finishes.
     """
-    def __init__(self, tenant, provider_name, provider_inst):
+    _plan_slugs = LocalTTLCache(maxsize=1024, ttl=300)
+    def __init__(self, tenant, provider_name, provider_inst, fallbacks=(), hedge=False):
         self._tenant = tenant
         self._provider_name = provider_name
         self._provider_inst = provider_inst
+        self._fallbacks = list(fallbacks)
+        self._hedge = hedge
+
+    def _links(self, name, attr):
+        links = [(self._provider_name, attr)]
+        for vendor, provider in self._fallbacks:
+            fallback_attr = getattr(provider, name, None)
+            if callable(fallback_attr):
+                links.append((f"{self._provider_name}/{vendor}", fallback_attr))
+        return links
+
+    @classmethod
+    def _plan_slug(cls, tenant):
+        if tenant is None or tenant.plan_id is None:
+            return None
+        slug = cls._plan_slugs.get(tenant.plan_id)
+        if slug is None:
+            from tenants.domain.models import Plan
+            slug = Plan.objects.filter(id=tenant.plan_id).values_list('slug', flat=True).first() or ''
+            cls._plan_slugs.set(tenant.plan_id, slug)
+        return slug or None
+
+    @classmethod
+    def bulkhead_for(cls, tenant, provider_name):
+        """Limits come from TENANT_BULKHEAD_* defaults and TENANT_BULKHEAD_PLAN_LIMITS[plan slug] (optionally per provider)."""
+        limits = {
+            'max_concurrent': conf.BULKHEAD_MAX_CONCURRENT,
+            'max_waiting': conf.BULKHEAD_MAX_WAITING,
+            'wait_timeout_ms': conf.BULKHEAD_WAIT_TIMEOUT_MS,
+        }
+        plan_slug = cls._plan_slug(tenant)
+        plan_limits = conf.BULKHEAD_PLAN_LIMITS.get(plan_slug, {}) if plan_slug else {}
+        limits.update({key: value for key, value in plan_limits.items() if key in limits})
+        limits.update(plan_limits.get(provider_name, {}))
+
+        tenant_slug = tenant.slug if tenant else "global"
+        # Limits are re-applied on every call, so a plan change takes effect on the next one
+        return Bulkhead.get(tenant_slug, provider_name, **limits)
+
+    def _hedges(self, name):
+        return self._hedge is True or (isinstance(self._hedge, (list, tuple)) and name in self._hedge)
 
     def __getattr__(self, name):
         attr = getattr(self._provider_inst, name)
         if callable(attr):
-            def wrapper(*args, **kwargs):
-                return ResilientProviderChain.execute(
-                    self._tenant, self._provider_name, name, attr, *args, **kwargs
+            if not self._fallbacks:
+                def wrapper(*args, **kwargs):
+                    with self.bulkhead_for(self._tenant, self._provider_name):
+                        return ResilientProviderChain.execute(
+                            self._tenant, self._provider_name, name, attr, *args, **kwargs
+                        )
+                return wrapper
+
+            def chained(*args, **kwargs):
+                return ResilientProviderChain.execute_chain(
+                    self._tenant, self._provider_name, name, self._links(name, attr), args, kwargs,
+                    hedge=self._hedges(name), bulkhead=self.bulkhead_for(self._tenant, self._provider_name)
                 )
-            return wrapper
+            return chained
         return attr
 
+# Marks a link attempt that failed or was short-circuited (providers may legitimately return None)
+_FAILED = object()
+
 class ResilientProviderChain:
     """
     Tier 93: Active Resilience.
     Orchestrates provider fallbacks and records telemetry.
+    Tier 119: Each (tenant, provider, action) runs behind its own CircuitBreaker;
+    an open circuit skips the provider and goes straight to the degraded path.
+    Tier 123: Tenant fallback chains are walked in order, each link behind its
+    own breaker, and the first two links can be hedged.
+    Tier 124: Every link is retried according to its RetryPolicy.
     """
+    latency = LatencyTracker()
+    hedges = registry.counter(
+        'tenant_provider_hedges_total', 'Hedged provider calls by the link that answered.',
+        labelnames=('provider', 'winner')
+    )
+    retries = registry.counter(
+        'tenant_provider_retries_total', 'Provider call retries scheduled by RetryPolicy.',
+        labelnames=('provider', 'action')
+    )
+    _executor = None
+    _executor_slots = None
+    _executor_pid = None
+    _executor_lock = threading.Lock()
+
     @staticmethod
-    def execute(tenant, provider_name, action, func, *args, **kwargs):
+    def breaker_for(tenant, provider_name, action, link=None):
+        """Per-action thresholds come from TENANT_CIRCUIT_BREAKER_ACTIONS ("PROVIDER.action", "action" or "PROVIDER")."""
+        params = {'threshold': conf.CIRCUIT_BREAKER_THRESHOLD, 'reset_timeout': conf.CIRCUIT_BREAKER_RESET_TIMEOUT}
+        params.update(action_setting(conf.CIRCUIT_BREAKER_ACTIONS, provider_name, action))
+        tenant_slug = tenant.slug if tenant else "global"
+        return CircuitBreaker.get(f"{tenant_slug}:{link or provider_name}:{action}", **params)
+
+    @classmethod
+    def _hedge_executor(cls):
+        """Returns the process's hedge pool and the semaphore tracking its free workers."""
+        # Worker threads do not survive fork; prefork children build their own pool
+        if cls._executor is None or cls._executor_pid != os.getpid():
+            with cls._executor_lock:
+                if cls._executor is None or cls._executor_pid != os.getpid():
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=conf.HEDGE_MAX_WORKERS, thread_name_prefix="provider-hedge"
+                    )
+                    cls._executor_slots = threading.BoundedSemaphore(conf.HEDGE_MAX_WORKERS)
+                    cls._executor_pid = os.getpid()
+        return cls._executor, cls._executor_slots
+
+    @staticmethod
+    def _degrade(provider_name):
+        # 2. Trigger Active Fallback (Degraded Mode)
+        # Reached once every configured provider has failed or is short-circuited
+        if conf.SANDBOX_MODE:
+            return None # Already handled in Hub logic usually
+
+        logger.info(f"[HUB-RESILIENCE] Falling back to Degraded Mode for {provider_name}")
+        return "DEGRADED_MODE"
+
+    @staticmethod
+    def _call_once(tenant, provider_name, link, action, func, args, kwargs, attempt):
+        """One call behind the link's breaker, with telemetry. Returns (result or _FAILED, error)."""
         from tenants.infrastructure.utils.resilience import CircuitBreakerError
-        import time
+
+        metadata = {"link": link} if link != provider_name else {}
+        if attempt > 1:
+            metadata["attempt"] = attempt
+        breaker = ResilientProviderChain.breaker_for(tenant, provider_name, action, link)
+        try:
+            probe = breaker.before_call()
+        except CircuitBreakerError as e:
+            # Short-circuit: the provider is not contacted while the circuit is open
+            InfrastructureTelemetryBridge.record(
+                tenant, provider_name, action, "CIRCUIT_OPEN",
+                latency_ms=None, error_message=str(e), metadata={"retry_after": e.retry_after, **metadata}
+            )
+            return _FAILED, e
 
         start_time = time.time()
         try:
-            # 1. Try Primary Execution
             result = func(*args, **kwargs)
+        except Exception as e:
             latency = int((time.time() - start_time) * 1000)
-            
-            # Record Success
+            breaker.record_failure(e, probe=probe)
+            logger.warning(f"[HUB-RESILIENCE] {link} failed for {action} (attempt {attempt}). Latency: {latency}ms. Error: {e}")
             InfrastructureTelemetryBridge.record(
-                tenant, provider_name, action, "SUCCESS", latency_ms=latency
+                tenant, provider_name, action, "FAILURE",
+                latency_ms=latency, error_message=str(e), metadata=metadata
             )
-            return result
-        except (CircuitBreakerError, Exception) as e:
-            latency = int((time.time() - start_time) * 1000)
-            logger.warning(f"[HUB-RESILIENCE] Primary failed for {provider_name}. Latency: {latency}ms. Error: {e}")
-            
-            # Record Initial Failure
-            InfrastructureTelemetryBridge.record(
-                tenant, provider_name, action, "FAILURE", 
-                latency_ms=latency, error_message=str(e)
+            return _FAILED, e
+
+        latency = int((time.time() - start_time) * 1000)
+        breaker.record_success(probe=probe)
+        ResilientProviderChain.latency.observe((link, action), latency)
+        InfrastructureTelemetryBridge.record(
+            tenant, provider_name, action, "SUCCESS", latency_ms=latency, metadata=metadata
+        )
+        return result, None
+
+    @staticmethod
+    def _attempt(tenant, provider_name, link, action, func, args, kwargs):
+        """
+        Tier 124: Runs one link under its RetryPolicy. Returns _FAILED once attempts,
+        retryable errors or the deadline budget run out.
+        """
+        policy = RetryPolicy.for_action(provider_name, action)
+        deadline = policy.deadline()
+        # Providers read the budget (e.g. as a socket timeout) via remaining_budget()
+        token = set_current_deadline(deadline)
+        try:
+            attempt = 1
+            while True:
+                if deadline is not None and time.monotonic() >= deadline:
+                    InfrastructureTelemetryBridge.record(
+                        tenant, provider_name, action, "FAILURE", latency_ms=None,
+                        error_message="Deadline exceeded before the call was made", metadata={"link": link, "attempt": attempt}
+                    )
+                    return _FAILED
+
+                result, error = ResilientProviderChain._call_once(
+                    tenant, provider_name, link, action, func, args, kwargs, attempt
+                )
+                if result is not _FAILED:
+                    return result
+                if attempt >= policy.max_attempts or not policy.is_retryable(error):
+                    return _FAILED
+
+                delay = policy.backoff(attempt)
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    return _FAILED
+                ResilientProviderChain.retries.inc(provider=provider_name, action=action)
+                time.sleep(delay)
+                attempt += 1
+        finally:
+            reset_current_deadline(token)
+
+    @staticmethod
+    def _in_worker(func, *args):
+        """Runs `func` on a hedge worker; pool threads never see request_finished, so close here."""
+        close_old_connections()
+        try:
+            return func(*args)
+        finally:
+            close_old_connections()
+
+    @staticmethod
+    def _hedged(tenant, provider_name, action, primary, secondary, delay_ms, args, kwargs, bulkhead=None):
+        """
+        Races `secondary` against a slow `primary`. Returns (result, links consumed);
+        0 links consumed means the pool had no free worker and the caller runs inline.
+        Pooled calls never queue: each needs a free worker and holds its own bulkhead
+        slot until it finishes, so abandoned calls still count against the tenant.
+        The wait is capped by the action's RetryPolicy deadline.
+        """
+        executor, workers = ResilientProviderChain._hedge_executor()
+
+        def submit(link, blocking):
+            if not workers.acquire(blocking=False):
+                return None
+            try:
+                admitted = bulkhead is None or bulkhead.acquire(blocking=blocking)
+            except BaseException:
+                workers.release()
+                raise
+            if not admitted:
+                workers.release()
+                return None
+
+            def done(future):
+                workers.release()
+                if bulkhead is not None:
+                    bulkhead.release()
+
+            label, func = link
+            context = contextvars.copy_context()
+            future = executor.submit(
+                context.run, ResilientProviderChain._in_worker,
+                ResilientProviderChain._attempt, tenant, provider_name, label, action, func, args, kwargs
             )
-            
-            # 2. Trigger Active Fallback (Degraded Mode)
-            # In a production system, we'd lookup configured fallbacks per tenant
-            # For this demo, we fallback to a Platform-Default Mock if the primary fails
-            if conf.SANDBOX_MODE:
-                return None # Already handled in Hub logic usually
-            
-            logger.info(f"[HUB-RESILIENCE] Falling back to Degraded Mode for {provider_name}")
-            return "DEGRADED_MODE"
+            future.add_done_callback(done)
+            return future
+
+        deadline = RetryPolicy.for_action(provider_name, action).deadline()
+
+        def remaining(cap=None):
+            if deadline is None:
+                return cap
+            budget = max(0.0, deadline - time.monotonic())
+            return budget if cap is None else min(cap, budget)
+
+        first = submit(primary, blocking=True)
+        if first is None:
+            return _FAILED, 0
+        try:
+            result = first.result(timeout=remaining(delay_ms / 1000))
+        except FuturesTimeout:
+            pass
+        else:
+            return result, 1
+
+        # No free worker or bulkhead slot for the hedge: just keep waiting on the primary
+        second = submit(secondary, blocking=False)
+        futures = (first,) if second is None else (first, second)
+        try:
+            for future in as_completed(futures, timeout=remaining()):
+                result = future.result()
+                if result is not _FAILED:
+                    # The slower call is cancelled if still queued, otherwise left to finish and ignored
+                    for other in futures:
+                        if other is not future:
+                            other.cancel()
+                    if second is not None:
+                        winner = primary[0] if future is first else secondary[0]
+                        ResilientProviderChain.hedges.inc(provider=provider_name, winner=winner)
+                    return result, len(futures)
+        except FuturesTimeout:
+            logger.warning(f"[HUB-RESILIENCE] Hedged {provider_name}.{action} ran past its deadline")
+            for future in futures:
+                future.cancel()
+        if second is not None:
+            ResilientProviderChain.hedges.inc(provider=provider_name, winner="none")
+        return _FAILED, len(futures)
+
+    @staticmethod
+    def execute_chain(tenant, provider_name, action, links, args=(), kwargs=None, hedge=False, bulkhead=None):
+        """
+        Tries each (link, func) in order until one succeeds, then falls back to the degraded path.
+        Links run inline hold one slot of `bulkhead` between them; hedged links hold their own.
+        """
+        kwargs = kwargs or {}
+        index = 0
+        if hedge and len(links) > 1:
+            delay_ms = ResilientProviderChain.latency.quantile(
+                (links[0][0], action), conf.HEDGE_QUANTILE, min_samples=conf.HEDGE_MIN_SAMPLES
+            )
+            if delay_ms is not None:
+                result, index = ResilientProviderChain._hedged(
+                    tenant, provider_name, action, links[0], links[1], delay_ms, args, kwargs, bulkhead
+                )
+                if result is not _FAILED:
+                    return result
+
+        if links[index:]:
+            with bulkhead or contextlib.nullcontext():
+                for link, func in links[index:]:
+                    result = ResilientProviderChain._attempt(tenant, provider_name, link, action, func, args, kwargs)
+                    if result is not _FAILED:
+                        return result
+        return ResilientProviderChain._degrade(provider_name)
+
+    @staticmethod
+    def execute(tenant, provider_name, action, func, *args, **kwargs):
+        return ResilientProviderChain.execute_chain(tenant, provider_name, action, [(provider_name, func)], args, kwargs)
 
 class InfrastructureHub:
     """
@@ -89,7 +369,6 @@ class InfrastructureHub:
         return DatabaseFactory.get_provider()
 
     @staticmethod
-    @circuit_breaker(threshold=5, reset_timeout=60)
     def email(tenant):
         """Returns the tenant's Email Provider."""
         if conf.SANDBOX_MODE:
@@ -97,10 +376,13 @@ class InfrastructureHub:
             
         with tracer.start_as_current_span("hub.email", attributes={"tenant.slug": tenant.slug}):
             provider = CommunicationFactory.get_email_provider(tenant)
-            return ResilientProviderProxy(tenant, "EMAIL", provider)
+            return ResilientProviderProxy(
+                tenant, "EMAIL", provider,
+                fallbacks=CommunicationFactory.get_email_fallbacks(tenant),
+                hedge=CommunicationFactory.hedge_policy(tenant, 'email')
+            )
 
     @staticmethod
-    @circuit_breaker(threshold=conf.CIRCUIT_BREAKER_THRESHOLD, reset_timeout=conf.CIRCUIT_BREAKER_RESET_TIMEOUT)
     def sms(tenant):
         """Returns the tenant's SMS Provider."""
         if conf.SANDBOX_MODE:
@@ -108,38 +390,37 @@ class InfrastructureHub:
             
         with tracer.start_as_current_span("hub.sms", attributes={"tenant.slug": tenant.slug}):
             provider = CommunicationFactory.get_sms_provider(tenant)
-            return ResilientProviderProxy(tenant, "SMS", provider)
+            return ResilientProviderProxy(
+                tenant, "SMS", provider,
+                fallbacks=CommunicationFactory.get_sms_fallbacks(tenant),
+                hedge=CommunicationFactory.hedge_policy(tenant, 'sms')
+            )
 
     @staticmethod
-    @circuit_breaker(threshold=conf.CIRCUIT_BREAKER_THRESHOLD, reset_timeout=conf.CIRCUIT_BREAKER_RESET_TIMEOUT)
     def storage(tenant):
         """Returns the tenant's Storage Provider."""
         with tracer.start_as_current_span("hub.storage", attributes={"tenant.slug": tenant.slug}):
             return StorageFactory.get_provider(tenant)
 
     @staticmethod
-    @circuit_breaker(threshold=conf.CIRCUIT_BREAKER_THRESHOLD, reset_timeout=conf.CIRCUIT_BREAKER_RESET_TIMEOUT)
     def identity(tenant, provider_type='google'):
         """Returns the tenant's Identity Provider."""
         with tracer.start_as_current_span("hub.identity", attributes={"tenant.slug": tenant.slug, "provider": provider_type}):
             return IdentityFactory.get_provider(tenant, provider_type)
 
     @staticmethod
-    @circuit_breaker(threshold=conf.CIRCUIT_BREAKER_THRESHOLD, reset_timeout=conf.CIRCUIT_BREAKER_RESET_TIMEOUT)
     def intelligence(tenant):
         """Returns the tenant's Intelligence (AI) Provider."""
         with tracer.start_as_current_span("hub.intelligence", attributes={"tenant.slug": tenant.slug}):
             return LLMFactory.get_provider(tenant)
 
     @staticmethod
-    @circuit_breaker(threshold=conf.CIRCUIT_BREAKER_THRESHOLD, reset_timeout=conf.CIRCUIT_BREAKER_RESET_TIMEOUT)
     def audit(tenant):
         """Returns the tenant's Audit/Compliance Provider."""
         with tracer.start_as_current_span("hub.audit", attributes={"tenant.slug": tenant.slug}):
             return AuditFactory.get_provider(tenant)
 
     @staticmethod
-    @circuit_breaker(threshold=conf.CIRCUIT_BREAKER_THRESHOLD, reset_timeout=conf.CIRCUIT_BREAKER_RESET_TIMEOUT)
     def search(tenant):
         """Returns the tenant's Search Provider."""
         # Tier 95: Integrated Sandbox
@@ -152,28 +433,24 @@ class InfrastructureHub:
             return ResilientProviderProxy(tenant, "SEARCH", provider)
 
     @staticmethod
-    @circuit_breaker(threshold=conf.CIRCUIT_BREAKER_THRESHOLD, reset_timeout=conf.CIRCUIT_BREAKER_RESET_TIMEOUT)
     def cache(tenant):
         """Returns the tenant's Cache Provider."""
         with tracer.start_as_current_span("hub.cache", attributes={"tenant.slug": tenant.slug}):
             return CacheFactory.get_provider(tenant)
 
     @staticmethod
-    @circuit_breaker(threshold=conf.CIRCUIT_BREAKER_THRESHOLD, reset_timeout=conf.CIRCUIT_BREAKER_RESET_TIMEOUT)
     def queue(tenant):
         """Returns the tenant's Queue/Task Provider."""
         with tracer.start_as_current_span("hub.queue", attributes={"tenant.slug": tenant.slug}):
             return QueueFactory.get_provider(tenant)
 
     @staticmethod
-    @circuit_breaker(threshold=conf.CIRCUIT_BREAKER_THRESHOLD, reset_timeout=conf.CIRCUIT_BREAKER_RESET_TIMEOUT)
     def control(tenant):
         """Returns the tenant's Feature Flag/Control Provider."""
         with tracer.start_as_current_span("hub.control", attributes={"tenant.slug": tenant.slug}):
             return ControlFactory.get_provider(tenant)
 
     @staticmethod
-    @circuit_breaker(threshold=conf.CIRCUIT_BREAKER_THRESHOLD, reset_timeout=conf.CIRCUIT_BREAKER_RESET_TIMEOUT)
     def whatsapp(tenant):
         """Returns the tenant's WhatsApp Provider."""
         if conf.SANDBOX_MODE:
@@ -181,4 +458,8 @@ class InfrastructureHub:
             
         with tracer.start_as_current_span("hub.whatsapp", attributes={"tenant.slug": tenant.slug}):
             provider = CommunicationFactory.get_whatsapp_provider(tenant)
-            return ResilientProviderProxy(tenant, "WHATSAPP", provider)
+            return ResilientProviderProxy(
+                tenant, "WHATSAPP", provider,
+                fallbacks=CommunicationFactory.get_whatsapp_fallbacks(tenant),
+                hedge=CommunicationFactory.hedge_policy(tenant, 'whatsapp')
+            )
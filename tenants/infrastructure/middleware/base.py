@@ -0,0 +1,110 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.exceptions import ImproperlyConfigured
+from tenants.infrastructure.profile import TenantRequestProfile
+
+class TenantMiddlewareBase:
+    """
+    Tier 105: Sync-and-Async Middleware Base.
+    Subclasses implement request/response hooks; the base picks the sync or the
+    native async path to match the handler chain, so ASGI requests never hop
+    into a worker thread per middleware layer.
+
+    Hooks (all optional):
+        process_request / aprocess_request   -> return a response to short-circuit
+        process_response / aprocess_response -> return the (possibly new) response
+        teardown                             -> always runs once the request has been admitted
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        response = self.process_request(request)
+        try:
+            if response is None:
+                response = self.get_response(request)
+            return self.process_response(request, response)
+        finally:
+            self.teardown(request)
+
+    async def __acall__(self, request):
+        response = await self.aprocess_request(request)
+        try:
+            if response is None:
+                response = await self.get_response(request)
+            return await self.aprocess_response(request, response)
+        finally:
+            self.teardown(request)
+
+    def process_request(self, request):
+        return None
+
+    async def aprocess_request(self, request):
+        # Hooks without I/O can share the sync implementation
+        return self.process_request(request)
+
+    def process_response(self, request, response):
+        return response
+
+    async def aprocess_response(self, request, response):
+        return self.process_response(request, response)
+
+    def teardown(self, request):
+        pass
+
+    @staticmethod
+    def get_host(request):
+        """Tier 110: The request host without port, parsed once and shared by every tenant layer."""
+        host = getattr(request, 'tenant_host', None)
+        if host is None:
+            host = request.tenant_host = request.get_host().split(':')[0]
+        return host
+
+    @staticmethod
+    def get_profile(request):
+        """Returns the request's TenantRequestProfile, compiling it at most once per request."""
+        profile = getattr(request, 'tenant_profile', None)
+        tenant = getattr(request, 'tenant', None)
+        if profile is None and tenant:
+            profile = request.tenant_profile = TenantRequestProfile.for_tenant(tenant)
+        return profile
+
+    @staticmethod
+    async def aget_profile(request):
+        profile = getattr(request, 'tenant_profile', None)
+        tenant = getattr(request, 'tenant', None)
+        if profile is None and tenant:
+            profile = request.tenant_profile = await TenantRequestProfile.afor_tenant(tenant)
+        return profile
+
+    @staticmethod
+    def _missing_user():
+        # Fail closed: without request.user the membership guard cannot run
+        return ImproperlyConfigured(
+            "Tenant guards need request.user; place them after "
+            "django.contrib.auth.middleware.AuthenticationMiddleware in MIDDLEWARE."
+        )
+
+    @staticmethod
+    def get_user(request, required=False):
+        """Returns request.user; with `required`, a missing user raises instead of reading as anonymous."""
+        if not hasattr(request, 'user'):
+            if required:
+                raise TenantMiddlewareBase._missing_user()
+            return None
+        return request.user
+
+    @staticmethod
+    async def aget_user(request, required=False):
+        """Resolves request.user without a sync DB hit inside the event loop."""
+        if hasattr(request, 'auser'):
+            return await request.auser()
+        return TenantMiddlewareBase.get_user(request, required)
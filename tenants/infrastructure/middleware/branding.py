@@ -1,31 +1,51 @@
-
+import functools
+import zoneinfo
+from django.conf import settings
 from django.utils import timezone, translation
-import pytz
-
-class BrandingMiddleware:
-    """Layer 4: Localization & Branding."""
-    def __init__(self, get_response):
-        self.get_response = get_response
-
-    def __call__(self, request):
-        tenant = getattr(request, 'tenant', None)
-        if tenant:
-            # Timezone
-            if tenant.timezone:
-                try:
-                    timezone.activate(pytz.timezone(tenant.timezone))
-                except pytz.UnknownTimeZoneError:
-                    pass
-            
-            # Locale
-            if tenant.locale:
-                translation.activate(tenant.locale)
-                request.LANGUAGE_CODE = translation.get_language()
-        
-        response = self.get_response(request)
-        
-        if tenant:
+from tenants.infrastructure.middleware.base import TenantMiddlewareBase
+
+@functools.lru_cache(maxsize=None)
+def get_zone(name):
+    """Tier 107: Memoized zoneinfo lookup; unknown names resolve to None."""
+    try:
+        return zoneinfo.ZoneInfo(name)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+        return None
+
+class BrandingMiddleware(TenantMiddlewareBase):
+    """
+    Layer 4: Localization & Branding.
+
+    Tier 107: Zones are memoized by name and language codes are pre-resolved on
+    the tenant profile; activation is skipped when a tenant matches the process defaults.
+    """
+
+    def _activate(self, request, profile):
+        if not profile:
+            return
+
+        # Timezone
+        if profile.timezone and profile.timezone != settings.TIME_ZONE:
+            zone = get_zone(profile.timezone)
+            if zone is not None:
+                timezone.activate(zone)
+                request._branding_timezone_active = True
+
+        # Locale
+        if profile.language:
+            if profile.language != settings.LANGUAGE_CODE:
+                translation.activate(profile.language)
+                request._branding_language_active = True
+            request.LANGUAGE_CODE = profile.language
+
+    def process_request(self, request):
+        self._activate(request, self.get_profile(request))
+
+    async def aprocess_request(self, request):
+        self._activate(request, await self.aget_profile(request))
+
+    def teardown(self, request):
+        if getattr(request, '_branding_timezone_active', False):
             timezone.deactivate()
+        if getattr(request, '_branding_language_active', False):
             translation.deactivate()
-            
-        return response
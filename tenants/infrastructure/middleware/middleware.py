@@ -1,59 +1,66 @@
-from tenants.domain.models import Domain, Membership
-from tenants.infrastructure.utils.context import set_current_tenant
-from tenants.infrastructure.cache import TenantCache
+import time
+from asgiref.sync import sync_to_async
+from tenants.infrastructure.conf import conf
+from tenants.infrastructure.utils.context import (
+    set_current_tenant, reset_current_tenant, set_current_deadline, reset_current_deadline
+)
+from tenants.infrastructure.resolution import TenantResolver
+from tenants.infrastructure.security.membership import MembershipCache
+from tenants.infrastructure.middleware.base import TenantMiddlewareBase
 from django.shortcuts import render
 from django.http import HttpResponsePermanentRedirect, JsonResponse
 from tenants.infrastructure.utils.security import SchemaSanitizer
 
-class TenantResolutionMiddleware:
+class TenantResolutionMiddleware(TenantMiddlewareBase):
     """Layer 1: Identity & Context Resolution."""
-    def __init__(self, get_response):
-        self.get_response = get_response
-
-    def __call__(self, request):
-        host = request.get_host().split(':')[0]
-        cache_key = f"domain_resolution:{host}"
-        domain = TenantCache.get(cache_key)
-        
-        if domain is None:
-            try:
-                domain = Domain.objects.select_related('tenant').get(domain=host, status='ACTIVE')
-                TenantCache.set(cache_key, domain, timeout=3600)
-            except Domain.DoesNotExist:
-                domain = False
-                TenantCache.set(cache_key, domain, timeout=300)
-
-        tenant = domain.tenant if domain else None
+
+    def _activate(self, request, tenant):
         request.tenant = tenant
-        set_current_tenant(tenant)
+        request._tenant_context_token = set_current_tenant(tenant)
+        # Tier 124: Provider calls made while serving the request share its deadline budget
+        deadline_ms = conf.REQUEST_DEADLINE_MS
+        request._deadline_token = (
+            set_current_deadline(time.monotonic() + deadline_ms / 1000) if deadline_ms else None
+        )
+
+    @staticmethod
+    def _activate_schema(tenant):
+        from tenants.infrastructure.database.schemas import SovereignSchemaManager
 
         # Apex Tier: Physical Schema Isolation (Configurable)
         if tenant and tenant.isolation_mode == 'PHYSICAL':
-            from tenants.infrastructure.database.schemas import SovereignSchemaManager
             # Tier 80: Use SchemaSanitizer for absolute identifier security
             schema_name = SchemaSanitizer.sanitize(tenant.slug)
             SovereignSchemaManager.set_active_schema(schema_name)
         else:
             # Default to Logical Isolation (using 'public'/default search path)
-            from tenants.infrastructure.database.schemas import SovereignSchemaManager
             SovereignSchemaManager.set_active_schema('public')
 
-        try:
-            response = self.get_response(request)
-        finally:
-            set_current_tenant(None)
-
-        return response
-
-class TenantSecurityMiddleware:
+    def process_request(self, request):
+        # Tier 101: L1 (process) -> L2 (TenantCache) -> DB, with single-flight misses
+        tenant = TenantResolver.resolve(self.get_host(request))
+        self._activate(request, tenant)
+        self._activate_schema(tenant)
+
+    async def aprocess_request(self, request):
+        tenant = await TenantResolver.aresolve(self.get_host(request))
+        self._activate(request, tenant)
+        # Connections are per-thread: record the schema on the connection the async ORM
+        # will use (the thread-sensitive executor), not the event loop's. Tier 108 defers the SET.
+        await sync_to_async(self._activate_schema)(tenant)
+
+    def teardown(self, request):
+        if request._deadline_token is not None:
+            reset_current_deadline(request._deadline_token)
+        reset_current_tenant(request._tenant_context_token)
+
+class TenantSecurityMiddleware(TenantMiddlewareBase):
     """Layer 2: Access Guards & Enforcement."""
-    def __init__(self, get_response):
-        self.get_response = get_response
 
     def _error_response(self, request, tenant, status, title, heading, message):
         """Tier 80: Headless Error Response Negotiator."""
         accept = request.META.get('HTTP_ACCEPT', '')
-        
+
         if 'application/json' in accept or request.path.startswith('/api/'):
             return JsonResponse({
                 "error": {
@@ -62,61 +69,91 @@ class TenantSecurityMiddleware:
                     "heading": heading
                 }
             }, status=status)
-            
+
         return render(request, 'tenants/errors/base.html', {
             'tenant': tenant, 'title': title, 'heading': heading,
             'message': message
         }, status=status)
 
-    def __call__(self, request):
-        tenant = getattr(request, 'tenant', None)
-        if not tenant:
-            return self.get_response(request)
-
+    def _guard_access(self, request, tenant, profile):
         # 1. IP Whitelisting
-        if tenant.ip_whitelist:
+        if profile.ip_allowlist:
             client_ip = request.META.get('HTTP_X_FORWARDED_FOR', request.META.get('REMOTE_ADDR', '')).split(',')[0].strip()
-            if client_ip not in tenant.ip_whitelist:
+            if client_ip not in profile.ip_allowlist:
                 return self._error_response(request, tenant, 403, 'Forbidden', 'Restricted Access', 'Your IP address is not authorized.')
 
         # 2. Status Enforcement
-        if not tenant.is_active:
+        if not profile.is_active:
             return self._error_response(request, tenant, 403, 'Inactive', 'Organization Inactive', 'Contact support to reactivate.')
 
-        # 3. Membership Guard
-        if request.user.is_authenticated and not request.user.is_staff:
-            if not request.path.startswith('/admin/') and not request.path.startswith('/onboard/'):
-                if not Membership.objects.filter(user=request.user, tenant=tenant, is_active=True).exists():
-                    return self._error_response(request, tenant, 403, 'Denied', 'Access Denied', f'You are not a member of {tenant.name}.')
+    @staticmethod
+    def _requires_membership(request, user):
+        if user is None or not user.is_authenticated or user.is_staff:
+            return False
+        return not request.path.startswith('/admin/') and not request.path.startswith('/onboard/')
+
+    def _membership_denied(self, request, tenant):
+        return self._error_response(request, tenant, 403, 'Denied', 'Access Denied', f'You are not a member of {tenant.name}.')
 
+    def _guard_maintenance(self, request, tenant, profile):
         # 4. Maintenance
-        if tenant.is_maintenance and not request.path.startswith('/admin/') and not request.GET.get('bypass_maintenance'):
+        if profile.is_maintenance and not request.path.startswith('/admin/') and not request.GET.get('bypass_maintenance'):
             return self._error_response(request, tenant, 503, 'Maintenance', 'Under Maintenance', "We'll be back shortly!")
 
-        return self.get_response(request)
+    def process_request(self, request):
+        tenant = getattr(request, 'tenant', None)
+        if not tenant:
+            return None
+
+        profile = self.get_profile(request)
+        response = self._guard_access(request, tenant, profile)
+        if response:
+            return response
 
-class TenantPerformanceMiddleware:
-    """Layer 3: Optimization & Security Headers."""
-    def __init__(self, get_response):
-        self.get_response = get_response
+        # 3. Membership Guard (Tier 103: cached verdicts, invalidated by Membership signals)
+        user = self.get_user(request, required=True)
+        if self._requires_membership(request, user) and not MembershipCache.is_member(user, tenant):
+            return self._membership_denied(request, tenant)
 
-    def __call__(self, request):
+        return self._guard_maintenance(request, tenant, profile)
+
+    async def aprocess_request(self, request):
         tenant = getattr(request, 'tenant', None)
-        host = request.get_host().split(':')[0]
-        
+        if not tenant:
+            return None
+
+        profile = await self.aget_profile(request)
+        response = self._guard_access(request, tenant, profile)
+        if response:
+            return response
+
+        user = await self.aget_user(request, required=True)
+        if self._requires_membership(request, user) and not await MembershipCache.ais_member(user, tenant):
+            return self._membership_denied(request, tenant)
+
+        return self._guard_maintenance(request, tenant, profile)
+
+class TenantPerformanceMiddleware(TenantMiddlewareBase):
+    """Layer 3: Optimization & Security Headers."""
+
+    def _canonical_redirect(self, request, profile):
         # 1. Canonical Redirect
-        if tenant:
-            primary_domain = tenant.domains.filter(is_primary=True, status='ACTIVE').first()
-            if primary_domain and primary_domain.domain != host and not host.endswith('.localhost'):
-                scheme = request.is_secure() and "https" or "http"
-                return HttpResponsePermanentRedirect(f"{scheme}://{primary_domain.domain}{request.path}")
+        host = self.get_host(request)
+        primary_domain = profile.primary_domain if profile else None
+        if primary_domain and primary_domain != host and not host.endswith('.localhost'):
+            scheme = request.is_secure() and "https" or "http"
+            return HttpResponsePermanentRedirect(f"{scheme}://{primary_domain}{request.path}")
+
+    def process_request(self, request):
+        return self._canonical_redirect(request, self.get_profile(request))
 
-        response = self.get_response(request)
+    async def aprocess_request(self, request):
+        return self._canonical_redirect(request, await self.aget_profile(request))
 
+    def process_response(self, request, response):
         # 2. CSP Headers
-        if tenant and tenant.security_config:
-            csp = tenant.security_config.get('content_security_policy')
-            if csp:
-                response['Content-Security-Policy'] = csp
+        profile = getattr(request, 'tenant_profile', None)
+        if profile and profile.content_security_policy:
+            response['Content-Security-Policy'] = profile.content_security_policy
 
         return response
@@ -1,9 +1,8 @@
 import logging
 from django.utils.deprecation import MiddlewareMixin
-from django.contrib.auth import get_user_model
 from tenants.infrastructure.utils.context import get_current_tenant
+from tenants.infrastructure.security.impersonation import ImpersonatorCache
 
-User = get_user_model()
 logger = logging.getLogger(__name__)
 
 class AdminImpersonationMiddleware(MiddlewareMixin):
@@ -19,21 +18,20 @@ class AdminImpersonationMiddleware(MiddlewareMixin):
         if impersonator_id and request.user.is_authenticated:
             # The current 'request.user' is actually the target user we are impersonating
             # We store the real admin (the impersonator) for the audit trail
-            try:
-                impersonator = User.objects.get(id=impersonator_id)
-                if not impersonator.is_staff:
-                    # Security breach attempt: Clear session
-                    del request.session['impersonator_id']
-                    return
-
-                # Inject impersonator context for use in Audit Logs
-                from tenants.infrastructure.utils.context import set_current_impersonator
-                set_current_impersonator(impersonator)
-                
-                request.impersonator = impersonator
-                request.is_impersonating = True
-                
-                logger.info(f"Staff member {impersonator.email} IS IMPERSONATING {request.user.email}")
-                
-            except User.DoesNotExist:
+            # Tier 109: Served from a short-TTL cache, dropped when the staff user changes
+            impersonator, cached = ImpersonatorCache.get(impersonator_id)
+            if impersonator is None or not impersonator.is_staff:
+                # Missing user or security breach attempt: Clear session
                 del request.session['impersonator_id']
+                return
+
+            # Inject impersonator context for use in Audit Logs
+            from tenants.infrastructure.utils.context import set_current_impersonator
+            set_current_impersonator(impersonator)
+
+            request.impersonator = impersonator
+            request.is_impersonating = True
+
+            # Announce once per cache period rather than on every request of a long session
+            log = logger.debug if cached else logger.info
+            log(f"Staff member {impersonator.email} IS IMPERSONATING {request.user.email}")
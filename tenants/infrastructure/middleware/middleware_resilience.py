@@ -1,71 +1,160 @@
-import time
 import logging
 from django.core.cache import cache
 from django.http import JsonResponse
+from tenants.infrastructure.conf import conf
 from tenants.infrastructure.utils.context import get_current_tenant
+from tenants.infrastructure.utils.resilience import SlidingWindowCounter
+from tenants.infrastructure.middleware.base import TenantMiddlewareBase
 
 logger = logging.getLogger(__name__)
 
-class ResourceGovernorMiddleware:
+class ResourceGovernorMiddleware(TenantMiddlewareBase):
     """
     Psi Tier: Operational Resilience - Resource Governor.
     Detects and isolates 'Noisy Neighbors' (tenants causing performance degradation).
+
+    Tier 106: Velocity is an atomic sliding-window count, over-limit tenants get a
+    429 with Retry-After instead of a worker-blocking sleep, and every decision is
+    exposed through X-Governor-* response headers.
     """
+    ALLOW = 'allow'
+    THROTTLE = 'throttle'
+    QUARANTINE = 'quarantine'
+
+    velocity = SlidingWindowCounter("governor_velocity")
+    errors = SlidingWindowCounter("governor_errors")
+
+    @staticmethod
+    def _quarantined_response(tenant):
+        logger.warning(f"Blocking request for Quarantined Tenant: {tenant.slug}")
+        return JsonResponse({
+            "error": "This organization is temporarily isolated for resource protection.",
+            "code": "TENANT_QUARANTINED"
+        }, status=403)
+
+    def _decide(self, rate, auto_quarantined):
+        """Returns (decision, transition) for the observed rate; transition names the flag change to persist."""
+        if auto_quarantined:
+            # Psi Tier Refinement: Auto-Recovery
+            if rate < conf.GOVERNOR_RECOVERY_RATE:
+                return self.ALLOW, 'release'
+            return self.QUARANTINE, None
+
+        # Hard Limit: Quarantine
+        if rate > conf.GOVERNOR_HARD_LIMIT:
+            return self.QUARANTINE, 'quarantine'
+
+        # Soft Limit: Shed with a Retry-After hint instead of holding the worker
+        if rate > conf.GOVERNOR_SOFT_LIMIT:
+            return self.THROTTLE, 'throttle'
+
+        return self.ALLOW, None
 
-    def __init__(self, get_response):
-        self.get_response = get_response
+    def _respond(self, request, tenant, rate, decision):
+        request.governor_decision = (decision, rate)
+        if decision == self.ALLOW:
+            return None
 
-    def __call__(self, request):
+        if decision == self.QUARANTINE:
+            body = {"error": "Auto-quarantine in effect. Please reduce traffic.", "code": "TENANT_AUTO_QUARANTINED"}
+            retry_after = self.velocity.window
+        else:
+            body = {"error": "Request rate limit exceeded. Please retry later.", "code": "TENANT_THROTTLED"}
+            retry_after = self.velocity.retry_after()
+
+        response = JsonResponse(body, status=429)
+        response['Retry-After'] = str(retry_after)
+        return response
+
+    def _log_transition(self, tenant, transition, rate):
+        if transition == 'release':
+            logger.info(f"AUTO-RECOVERY triggered for {tenant.slug}. Releasing from quarantine.")
+        elif transition == 'quarantine':
+            logger.error(f"AUTO-QUARANTINE triggered for {tenant.slug} due to velocity spike ({int(rate)}/min)")
+        elif transition == 'throttle':
+            logger.info(f"Throttling high-velocity tenant: {tenant.slug} ({int(rate)}/min)")
+
+    def process_request(self, request):
         tenant = get_current_tenant()
         if not tenant:
-            return self.get_response(request)
+            return None
 
         # 1. Check if tenant is manually Quarantined
-        if tenant.config.get('resilience', {}).get('quarantined', False):
-            logger.warning(f"Blocking request for Quarantined Tenant: {tenant.slug}")
-            return JsonResponse({
-                "error": "This organization is temporarily isolated for resource protection.",
-                "code": "TENANT_QUARANTINED"
-            }, status=403)
-
-        # 2. Automated Rate Limiting / Slow Down (Noisy Neighbor Protection)
-        cache_key = f"governor_velocity_{tenant.id}"
-        velocity = cache.get(cache_key, 0)
-        
-        # Psi Tier Refinement: Auto-Recovery
-        if cache.get(f"auto_quarantine_{tenant.id}"):
-            if velocity < 100: # If velocity has dropped below 100/min
-                cache.delete(f"auto_quarantine_{tenant.id}")
-                logger.info(f"AUTO-RECOVERY triggered for {tenant.slug}. Releasing from quarantine.")
-            else:
-                return JsonResponse({"error": "Auto-quarantine in effect. Please reduce traffic."}, status=429)
-
-        # Soft Limit: Slow down
-        if velocity > 1000: # 1k requests/min
-            time.sleep(0.1) 
-            # Observation Logging for Admin Dashboard
-            cache.set(f"governor_throttle_active_{tenant.id}", True, timeout=60)
-            logger.info(f"Injecting protective latency for high-velocity tenant: {tenant.slug}")
+        profile = self.get_profile(request)
+        if profile and profile.is_quarantined:
+            request.governor_decision = (self.QUARANTINE, None)
+            return self._quarantined_response(tenant)
 
-        # Hard Limit: Quarantine
-        if velocity > 5000: # 5k requests/min
-            cache.set(f"auto_quarantine_{tenant.id}", True, timeout=300)
-            logger.error(f"AUTO-QUARANTINE triggered for {tenant.slug} due to velocity spike ({velocity})")
+        # 2. Automated Rate Limiting (Noisy Neighbor Protection)
+        rate = self.velocity.hit(tenant.id)
+        flag_key = f"auto_quarantine_{tenant.id}"
+        decision, transition = self._decide(rate, cache.get(flag_key))
+
+        if transition == 'release':
+            cache.delete(flag_key)
+        elif transition == 'quarantine':
+            cache.set(flag_key, True, timeout=conf.GOVERNOR_QUARANTINE_SECONDS)
+        elif transition == 'throttle':
+            # Observation flag for the Admin Dashboard; add() logs once per window, not per request
+            transition = transition if cache.add(f"governor_throttle_active_{tenant.id}", True, timeout=60) else None
+        self._log_transition(tenant, transition, rate)
 
-        # Increment velocity
-        cache.set(cache_key, velocity + 1, timeout=60)
+        return self._respond(request, tenant, rate, decision)
 
-        response = self.get_response(request)
-        
+    async def aprocess_request(self, request):
+        tenant = get_current_tenant()
+        if not tenant:
+            return None
+
+        profile = await self.aget_profile(request)
+        if profile and profile.is_quarantined:
+            request.governor_decision = (self.QUARANTINE, None)
+            return self._quarantined_response(tenant)
+
+        rate = await self.velocity.ahit(tenant.id)
+        flag_key = f"auto_quarantine_{tenant.id}"
+        decision, transition = self._decide(rate, await cache.aget(flag_key))
+
+        if transition == 'release':
+            await cache.adelete(flag_key)
+        elif transition == 'quarantine':
+            await cache.aset(flag_key, True, timeout=conf.GOVERNOR_QUARANTINE_SECONDS)
+        elif transition == 'throttle':
+            transition = transition if await cache.aadd(f"governor_throttle_active_{tenant.id}", True, timeout=60) else None
+        self._log_transition(tenant, transition, rate)
+
+        return self._respond(request, tenant, rate, decision)
+
+    @staticmethod
+    def _decorate(request, response):
+        decision = getattr(request, 'governor_decision', None)
+        if decision:
+            response['X-Governor-Decision'] = decision[0]
+            if decision[1] is not None:
+                response['X-Governor-Rate'] = str(int(decision[1]))
+                response['X-Governor-Limit'] = str(conf.GOVERNOR_SOFT_LIMIT)
+        return response
+
+    def _flag_unhealthy(self, tenant, error_rate, added):
+        if added:
+            logger.critical(f"HEALTH WARNING: Tenant {tenant.slug} is experiencing high error rates ({int(error_rate)}/min).")
+
+    def process_response(self, request, response):
         # 3. Error Rate Isolation
-        if response.status_code >= 500:
-            err_key = f"governor_errors_{tenant.id}"
-            err_count = cache.get(err_key, 0) + 1
-            cache.set(err_key, err_count, timeout=60)
-            
-            if err_count > 50: 
+        tenant = get_current_tenant()
+        if tenant and response.status_code >= 500:
+            error_rate = self.errors.hit(tenant.id)
+            if error_rate > conf.GOVERNOR_ERROR_THRESHOLD:
                 # Observation Logging for Admin Dashboard
-                cache.set(f"governor_unhealthy_{tenant.id}", True, timeout=60)
-                logger.critical(f"HEALTH WARNING: Tenant {tenant.slug} is experiencing high error rates ({err_count}/min).")
+                self._flag_unhealthy(tenant, error_rate, cache.add(f"governor_unhealthy_{tenant.id}", True, timeout=60))
 
-        return response
+        return self._decorate(request, response)
+
+    async def aprocess_response(self, request, response):
+        tenant = get_current_tenant()
+        if tenant and response.status_code >= 500:
+            error_rate = await self.errors.ahit(tenant.id)
+            if error_rate > conf.GOVERNOR_ERROR_THRESHOLD:
+                self._flag_unhealthy(tenant, error_rate, await cache.aadd(f"governor_unhealthy_{tenant.id}", True, timeout=60))
+
+        return self._decorate(request, response)
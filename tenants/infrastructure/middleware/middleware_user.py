@@ -1,18 +1,21 @@
-from tenants.infrastructure.utils.context import set_current_user, clear_context
+from tenants.infrastructure.utils.context import set_current_user, reset_current_user
+from tenants.infrastructure.middleware.base import TenantMiddlewareBase
 
-class UserContextMiddleware:
-    def __init__(self, get_response):
-        self.get_response = get_response
+class UserContextMiddleware(TenantMiddlewareBase):
 
-    def __call__(self, request):
-        if hasattr(request, 'user') and request.user.is_authenticated:
-            set_current_user(request.user)
+    @staticmethod
+    def _activate(request, user):
+        if user is not None and user.is_authenticated:
+            request._user_context_token = set_current_user(user)
         else:
-            set_current_user(None)
-            
-        response = self.get_response(request)
-        
+            request._user_context_token = set_current_user(None)
+
+    def process_request(self, request):
+        self._activate(request, getattr(request, 'user', None))
+
+    async def aprocess_request(self, request):
+        self._activate(request, await self.aget_user(request))
+
+    def teardown(self, request):
         # Cleanup
-        set_current_user(None)
-        
-        return response
+        reset_current_user(request._user_context_token)
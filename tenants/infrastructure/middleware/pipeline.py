@@ -0,0 +1,108 @@
+import time
+from tenants.infrastructure.metrics import registry
+from tenants.infrastructure.middleware.base import TenantMiddlewareBase
+from tenants.infrastructure.middleware.middleware import (
+    TenantResolutionMiddleware, TenantSecurityMiddleware, TenantPerformanceMiddleware
+)
+from tenants.infrastructure.middleware.branding import BrandingMiddleware
+from tenants.infrastructure.middleware.middleware_resilience import ResourceGovernorMiddleware
+
+class TenantPipelineMiddleware(TenantMiddlewareBase):
+    """
+    Tier 110: Fused Tenant Pipeline.
+    Optional single-entry replacement for the Resolution, Security, Performance,
+    Branding and ResourceGovernor middlewares. The stages share one request
+    context (host, tenant, profile), each is timed with perf_counter_ns, and
+    the breakdown is emitted as a Server-Timing header and a per-stage histogram.
+
+    Place it after AuthenticationMiddleware so the membership guard sees request.user.
+    """
+    STAGES = (
+        ('resolution', TenantResolutionMiddleware),
+        ('security', TenantSecurityMiddleware),
+        ('canonical', TenantPerformanceMiddleware),
+        ('branding', BrandingMiddleware),
+        ('governor', ResourceGovernorMiddleware),
+    )
+
+    stage_seconds = registry.histogram(
+        'tenant_pipeline_stage_seconds',
+        'Time spent in each tenant pipeline stage (request and response phases).',
+        labelnames=('stage',)
+    )
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.stages = [(name, stage(get_response)) for name, stage in self.STAGES]
+
+    @staticmethod
+    def _record(request, name, start):
+        timings = request._pipeline_timings
+        timings[name] = timings.get(name, 0) + time.perf_counter_ns() - start
+
+    def process_request(self, request):
+        request._pipeline_timings = {}
+        request._pipeline_admitted = []
+        try:
+            for name, stage in self.stages:
+                start = time.perf_counter_ns()
+                response = stage.process_request(request)
+                self._record(request, name, start)
+                request._pipeline_admitted.append((name, stage))
+                if response is not None:
+                    return response
+        except BaseException:
+            # The base only tears down admitted requests; unwind the stages that did run
+            self.teardown(request)
+            raise
+
+    async def aprocess_request(self, request):
+        request._pipeline_timings = {}
+        request._pipeline_admitted = []
+        try:
+            for name, stage in self.stages:
+                start = time.perf_counter_ns()
+                response = await stage.aprocess_request(request)
+                self._record(request, name, start)
+                request._pipeline_admitted.append((name, stage))
+                if response is not None:
+                    return response
+        except BaseException:
+            self.teardown(request)
+            raise
+
+    def process_response(self, request, response):
+        for name, stage in reversed(request._pipeline_admitted):
+            start = time.perf_counter_ns()
+            response = stage.process_response(request, response)
+            self._record(request, name, start)
+        return self._server_timing(request, response)
+
+    async def aprocess_response(self, request, response):
+        for name, stage in reversed(request._pipeline_admitted):
+            start = time.perf_counter_ns()
+            response = await stage.aprocess_response(request, response)
+            self._record(request, name, start)
+        return self._server_timing(request, response)
+
+    @staticmethod
+    def _server_timing(request, response):
+        entries = ", ".join(
+            f"tenant-{name};dur={elapsed / 1e6:.3f}" for name, elapsed in request._pipeline_timings.items()
+        )
+        existing = response.get('Server-Timing')
+        response['Server-Timing'] = f"{existing}, {entries}" if existing else entries
+        return response
+
+    def teardown(self, request):
+        admitted = getattr(request, '_pipeline_admitted', [])
+        while admitted:
+            _, stage = admitted.pop()
+            stage.teardown(request)
+
+        # Observed here so requests that raised in the view are still counted
+        timings = getattr(request, '_pipeline_timings', None)
+        if timings:
+            for name, elapsed in timings.items():
+                self.stage_seconds.observe(elapsed / 1e9, stage=name)
+            request._pipeline_timings = {}
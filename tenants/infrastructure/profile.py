@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from typing import ClassVar, Optional
+from django.utils import translation
+from tenants.infrastructure.cache import LocalTTLCache, SingleFlight
+from tenants.infrastructure.conf import conf
+from tenants.infrastructure.utils.security import IPAllowlist
+
+@dataclass(frozen=True)
+class TenantRequestProfile:
+    """
+    Tier 102: Precompiled Request Context.
+    Everything the tenant middlewares need per request, derived once per tenant
+    version so the hot path never touches the DB or the raw JSON fields.
+    """
+    tenant_id: str
+    version: tuple
+    primary_domain: Optional[str]
+    content_security_policy: Optional[str]
+    ip_allowlist: IPAllowlist
+    is_active: bool
+    is_maintenance: bool
+    is_quarantined: bool
+    locale: str
+    language: Optional[str]
+    timezone: str
+
+    _cache: ClassVar[Optional[LocalTTLCache]] = None
+    _flights: ClassVar[SingleFlight] = SingleFlight()
+
+    @staticmethod
+    def version_of(tenant):
+        """
+        A tenant's profile changes when the row is saved (updated_at) or when any
+        Domain changes (the resolution generation is bumped by the same signals).
+        """
+        from tenants.infrastructure.resolution import TenantResolver
+        updated_at = tenant.updated_at.timestamp() if tenant.updated_at else None
+        return (updated_at, TenantResolver.generation.current())
+
+    @staticmethod
+    async def aversion_of(tenant):
+        from tenants.infrastructure.resolution import TenantResolver
+        updated_at = tenant.updated_at.timestamp() if tenant.updated_at else None
+        return (updated_at, await TenantResolver.generation.acurrent())
+
+    @classmethod
+    def _local_cache(cls):
+        if cls._cache is None:
+            cls._cache = LocalTTLCache(
+                maxsize=conf.RESOLUTION_CACHE_SIZE,
+                ttl=conf.RESOLUTION_CACHE_TTL
+            )
+        return cls._cache
+
+    @classmethod
+    def for_tenant(cls, tenant):
+        """Returns the cached profile for `tenant`, building it on a version change."""
+        version = cls.version_of(tenant)
+        profile = cls._local_cache().get(tenant.id)
+        if profile is not None and profile.version == version:
+            return profile
+
+        profile = cls._flights.do((tenant.id, version), lambda: cls.build(tenant, version))
+        cls._local_cache().set(tenant.id, profile)
+        return profile
+
+    @classmethod
+    async def afor_tenant(cls, tenant):
+        """Async counterpart of for_tenant()."""
+        version = await cls.aversion_of(tenant)
+        profile = cls._local_cache().get(tenant.id)
+        if profile is not None and profile.version == version:
+            return profile
+
+        profile = await cls._flights.ado((tenant.id, version), lambda: cls.abuild(tenant, version))
+        cls._local_cache().set(tenant.id, profile)
+        return profile
+
+    @classmethod
+    def build(cls, tenant, version=None):
+        """Compiles a profile from the tenant row and its primary domain."""
+        primary_domain = tenant.domains.filter(is_primary=True, status='ACTIVE').first()
+        return cls._compile(tenant, primary_domain, version if version is not None else cls.version_of(tenant))
+
+    @classmethod
+    async def abuild(cls, tenant, version):
+        primary_domain = await tenant.domains.filter(is_primary=True, status='ACTIVE').afirst()
+        return cls._compile(tenant, primary_domain, version)
+
+    @classmethod
+    def _compile(cls, tenant, primary_domain, version):
+        security_config = tenant.security_config or {}
+        resilience = (tenant.config or {}).get('resilience', {})
+
+        return cls(
+            tenant_id=tenant.id,
+            version=version,
+            primary_domain=primary_domain.domain if primary_domain else None,
+            content_security_policy=security_config.get('content_security_policy') or None,
+            ip_allowlist=IPAllowlist(tenant.ip_whitelist),
+            is_active=tenant.is_active,
+            is_maintenance=tenant.is_maintenance,
+            is_quarantined=bool(resilience.get('quarantined', False)),
+            locale=tenant.locale,
+            # Tier 107: Resolved once per version instead of on every activation
+            language=translation.to_language(tenant.locale) if tenant.locale else None,
+            timezone=tenant.timezone,
+        )
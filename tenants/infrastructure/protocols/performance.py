@@ -1,4 +1,4 @@
-from typing import Protocol, runtime_checkable, Any, Optional
+from typing import Protocol, runtime_checkable, Any, Dict, Iterable, Optional
 
 @runtime_checkable
 class ICacheProvider(Protocol):
@@ -18,6 +18,22 @@ class ICacheProvider(Protocol):
         """Delete a value from the cache."""
         ...
 
+    def add(self, key: str, value: Any, timeout: int = 300) -> bool:
+        """Set a value only if the key is absent; returns whether it was stored."""
+        ...
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve several values in one round trip; missing keys are omitted."""
+        ...
+
+    def set_many(self, mapping: Dict[str, Any], timeout: int = 300) -> bool:
+        """Set several values in one round trip."""
+        ...
+
+    def delete_many(self, keys: Iterable[str]) -> bool:
+        """Delete several values in one round trip."""
+        ...
+
 @runtime_checkable
 class IQueueProvider(Protocol):
     """
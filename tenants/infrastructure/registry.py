@@ -1,3 +1,8 @@
+import hashlib
+import json
+from tenants.infrastructure.cache import LocalTTLCache
+from tenants.infrastructure.conf import conf
+
 class SearchRegistry:
     """
     Registry for models to participate in the Global Search Engine.
@@ -42,3 +47,45 @@ class APIRegistry:
     @classmethod
     def get_viewsets(cls):
         return cls._viewsets
+
+class ProviderInstanceCache:
+    """
+    Tier 112: Memoized Adapter Instances.
+    Adapter factories hand out one provider per (tenant, adapter kind, config
+    fingerprint) per process instead of rebuilding it on every call. A config
+    edit changes the fingerprint, so a stale instance is never served; Tenant
+    saves additionally evict the tenant's entries to free them early.
+    """
+    _local = None
+
+    @classmethod
+    def _cache(cls):
+        if cls._local is None:
+            cls._local = LocalTTLCache(
+                maxsize=conf.PROVIDER_CACHE_SIZE,
+                ttl=conf.PROVIDER_CACHE_TTL
+            )
+        return cls._local
+
+    @staticmethod
+    def fingerprint(config):
+        payload = json.dumps(config, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+    @classmethod
+    def get_or_create(cls, kind, tenant, config, build):
+        """Returns the cached provider for `tenant`, calling `build()` on a miss."""
+        key = (tenant.id, kind, cls.fingerprint(config))
+        provider = cls._cache().get(key)
+        if provider is None:
+            provider = build()
+            cls._cache().set(key, provider)
+        return provider
+
+    @classmethod
+    def evict(cls, tenant_id):
+        cls._cache().delete_where(lambda key: key[0] == tenant_id)
+
+    @classmethod
+    def clear(cls):
+        cls._cache().clear()
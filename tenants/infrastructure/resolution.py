@@ -0,0 +1,112 @@
+import copy
+import logging
+from tenants.infrastructure.cache import TenantCache, LocalTTLCache, SingleFlight, GenerationCounter
+from tenants.infrastructure.codecs import ModelSnapshot
+from tenants.infrastructure.conf import conf
+
+logger = logging.getLogger(__name__)
+
+class TenantResolver:
+    """
+    Tier 101: Host-to-Tenant Resolution.
+    Resolves a hostname through a per-process LRU (L1), the shared TenantCache (L2)
+    and finally the database. Both tiers are stamped with a shared generation, so a
+    Domain/Tenant edit in any process retires every cached resolution.
+    """
+    CACHE_PREFIX = "domain_resolution"
+
+    generation = GenerationCounter(CACHE_PREFIX)
+    _flights = SingleFlight()
+    _local = None
+
+    @classmethod
+    def _local_cache(cls):
+        if cls._local is None:
+            cls._local = LocalTTLCache(
+                maxsize=conf.RESOLUTION_CACHE_SIZE,
+                ttl=conf.RESOLUTION_CACHE_TTL
+            )
+        return cls._local
+
+    @classmethod
+    def resolve(cls, host):
+        """Returns the active Tenant serving `host`, or None."""
+        generation = cls.generation.current()
+        entry = cls._local_cache().get(host)
+
+        if entry is not None and entry[0] == generation:
+            tenant = entry[1]
+        else:
+            # Concurrent misses for the same host share a single lookup
+            tenant = cls._flights.do((host, generation), lambda: cls._load(host, generation))
+
+        # Hand out a copy so per-request attribute changes never leak into the L1 entry
+        return copy.copy(tenant) if tenant else None
+
+    @classmethod
+    async def aresolve(cls, host):
+        """Async counterpart of resolve() using the async cache and ORM APIs."""
+        generation = await cls.generation.acurrent()
+        entry = cls._local_cache().get(host)
+
+        if entry is not None and entry[0] == generation:
+            tenant = entry[1]
+        else:
+            tenant = await cls._flights.ado((host, generation), lambda: cls._aload(host, generation))
+
+        return copy.copy(tenant) if tenant else None
+
+    @staticmethod
+    def _restore(cached):
+        # Tier 117: L2 holds a plain snapshot (or False for unknown hosts), never a pickled model
+        if isinstance(cached, dict):
+            from tenants.domain.models import Tenant
+            return ModelSnapshot.load(Tenant, cached)
+        return cached
+
+    @staticmethod
+    def _snapshot(tenant):
+        return ModelSnapshot.dump(tenant) if tenant else tenant
+
+    @classmethod
+    def _load(cls, host, generation):
+        cache_key = f"{cls.CACHE_PREFIX}:{generation}:{host}"
+        tenant = cls._restore(TenantCache.get(cache_key))
+
+        if tenant is None:
+            from tenants.domain.models import Domain
+            try:
+                domain = Domain.objects.select_related('tenant').get(domain=host, status='ACTIVE')
+                tenant = domain.tenant
+                TenantCache.set(cache_key, cls._snapshot(tenant), timeout=3600)
+            except Domain.DoesNotExist:
+                tenant = False
+                TenantCache.set(cache_key, tenant, timeout=300)
+
+        cls._local_cache().set(host, (generation, tenant))
+        return tenant
+
+    @classmethod
+    async def _aload(cls, host, generation):
+        cache_key = f"{cls.CACHE_PREFIX}:{generation}:{host}"
+        tenant = cls._restore(await TenantCache.aget(cache_key))
+
+        if tenant is None:
+            from tenants.domain.models import Domain
+            try:
+                domain = await Domain.objects.select_related('tenant').aget(domain=host, status='ACTIVE')
+                tenant = domain.tenant
+                await TenantCache.aset(cache_key, cls._snapshot(tenant), timeout=3600)
+            except Domain.DoesNotExist:
+                tenant = False
+                await TenantCache.aset(cache_key, tenant, timeout=300)
+
+        cls._local_cache().set(host, (generation, tenant))
+        return tenant
+
+    @classmethod
+    def invalidate(cls):
+        """Retires every cached resolution in this process and, via the generation, in all others."""
+        cls.generation.bump()
+        cls._local_cache().clear()
+        logger.debug("[RESOLUTION] Tenant resolution cache invalidated.")
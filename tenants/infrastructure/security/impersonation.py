@@ -0,0 +1,58 @@
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from tenants.infrastructure.conf import conf
+
+class ImpersonatorCache:
+    """
+    Tier 109: Impersonator Identity Cache.
+    Long-lived support sessions resolve the impersonating staff user from the
+    shared cache instead of the DB on every request. Entries are dropped by the
+    User save/delete signals, so a revoked staff flag takes effect immediately.
+    Keys are global (not tenant-prefixed) because staff users span tenants.
+    Only the identity fields the middleware and audit trail need are cached
+    (never the password hash); the rest load lazily as deferred fields.
+    """
+    CACHE_PREFIX = "impersonator"
+    FIELDS = ('email', 'is_staff', 'is_superuser')
+
+    @classmethod
+    def _field_names(cls):
+        # from_db() expects the loaded values in concrete-field order
+        meta = get_user_model()._meta
+        wanted = {meta.pk.attname, *cls.FIELDS}
+        return tuple(field.attname for field in meta.concrete_fields if field.attname in wanted)
+
+    @classmethod
+    def _dump(cls, user):
+        return {name: getattr(user, name) for name in cls._field_names()}
+
+    @classmethod
+    def _load(cls, data):
+        names = cls._field_names()
+        return get_user_model().from_db('default', names, [data[name] for name in names])
+
+    @classmethod
+    def _key(cls, user_id):
+        return f"{cls.CACHE_PREFIX}:{user_id}"
+
+    @classmethod
+    def get(cls, user_id):
+        """Returns (impersonator, was_cached); impersonator is None if the user no longer exists."""
+        data = cache.get(cls._key(user_id))
+        if data is not None:
+            return cls._load(data), True
+
+        User = get_user_model()
+        try:
+            impersonator = User.objects.get(id=user_id)
+        except User.DoesNotExist:
+            return None, False
+
+        # Only staff identities are worth keeping; anything else ends the session
+        if impersonator.is_staff:
+            cache.set(cls._key(user_id), cls._dump(impersonator), timeout=conf.IMPERSONATION_CACHE_TTL)
+        return impersonator, False
+
+    @classmethod
+    def invalidate(cls, user_id):
+        cache.delete(cls._key(user_id))
@@ -0,0 +1,66 @@
+from tenants.infrastructure.cache import TenantCache, LocalTTLCache, GenerationCounter
+from tenants.infrastructure.conf import conf
+
+class MembershipCache:
+    """
+    Tier 103: Membership Verdict Cache.
+    Answers "is this user an active member of this tenant?" from process memory,
+    then the shared cache, then the DB. Verdicts are stamped with a per-tenant
+    generation that Membership save/delete signals bump.
+    """
+    CACHE_PREFIX = "membership_verdict"
+
+    generation = GenerationCounter(CACHE_PREFIX)
+    _local = None
+
+    @classmethod
+    def _local_cache(cls):
+        if cls._local is None:
+            cls._local = LocalTTLCache(
+                maxsize=conf.MEMBERSHIP_CACHE_SIZE,
+                ttl=conf.MEMBERSHIP_CACHE_TTL
+            )
+        return cls._local
+
+    @classmethod
+    def is_member(cls, user, tenant):
+        """Returns True if `user` holds an active membership in `tenant`."""
+        generation = cls.generation.current(tenant.id)
+        local_key = (tenant.id, user.pk)
+        entry = cls._local_cache().get(local_key)
+        if entry is not None and entry[0] == generation:
+            return entry[1]
+
+        cache_key = f"{cls.CACHE_PREFIX}:{tenant.id}:{generation}:{user.pk}"
+        verdict = TenantCache.get(cache_key)
+        if verdict is None:
+            from tenants.domain.models import Membership
+            verdict = Membership.objects.filter(user=user, tenant=tenant, is_active=True).exists()
+            TenantCache.set(cache_key, verdict, timeout=conf.MEMBERSHIP_CACHE_TTL)
+
+        cls._local_cache().set(local_key, (generation, verdict))
+        return verdict
+
+    @classmethod
+    async def ais_member(cls, user, tenant):
+        """Async counterpart of is_member()."""
+        generation = await cls.generation.acurrent(tenant.id)
+        local_key = (tenant.id, user.pk)
+        entry = cls._local_cache().get(local_key)
+        if entry is not None and entry[0] == generation:
+            return entry[1]
+
+        cache_key = f"{cls.CACHE_PREFIX}:{tenant.id}:{generation}:{user.pk}"
+        verdict = await TenantCache.aget(cache_key)
+        if verdict is None:
+            from tenants.domain.models import Membership
+            verdict = await Membership.objects.filter(user=user, tenant=tenant, is_active=True).aexists()
+            await TenantCache.aset(cache_key, verdict, timeout=conf.MEMBERSHIP_CACHE_TTL)
+
+        cls._local_cache().set(local_key, (generation, verdict))
+        return verdict
+
+    @classmethod
+    def invalidate(cls, tenant_id):
+        """Retires every cached verdict for a tenant, locally and in other processes."""
+        cls.generation.bump(tenant_id)
@@ -5,22 +5,31 @@ import contextvars
 _tenant_context = contextvars.ContextVar('tenant', default=None)
 _user_context = contextvars.ContextVar('user', default=None)
 _impersonator_context = contextvars.ContextVar('impersonator', default=None)
+_deadline_context = contextvars.ContextVar('deadline', default=None)
 
 def get_current_tenant():
     """Returns the current tenant from the context."""
     return _tenant_context.get()
 
 def set_current_tenant(tenant):
-    """Sets the current tenant in the context."""
-    _tenant_context.set(tenant)
+    """Sets the current tenant in the context. Returns a token for reset_current_tenant()."""
+    return _tenant_context.set(tenant)
+
+def reset_current_tenant(token):
+    """Restores the tenant that was active before the matching set_current_tenant()."""
+    _tenant_context.reset(token)
 
 def get_current_user():
     """Returns the current user from the context."""
     return _user_context.get()
 
 def set_current_user(user):
-    """Sets the current user in the context."""
-    _user_context.set(user)
+    """Sets the current user in the context. Returns a token for reset_current_user()."""
+    return _user_context.set(user)
+
+def reset_current_user(token):
+    """Restores the user that was active before the matching set_current_user()."""
+    _user_context.reset(token)
 
 def get_current_impersonator():
     """Returns the current impersonator from the context."""
@@ -30,8 +39,21 @@ def set_current_impersonator(user):
     """Sets the current impersonator in the context."""
     _impersonator_context.set(user)
 
+def get_current_deadline():
+    """Returns the active deadline as a time.monotonic() timestamp, or None."""
+    return _deadline_context.get()
+
+def set_current_deadline(deadline):
+    """Sets the deadline (a time.monotonic() timestamp). Returns a token for reset_current_deadline()."""
+    return _deadline_context.set(deadline)
+
+def reset_current_deadline(token):
+    """Restores the deadline that was active before the matching set_current_deadline()."""
+    _deadline_context.reset(token)
+
 def clear_context():
     """Resets the context variables to their default (None)."""
     _tenant_context.set(None)
     _user_context.set(None)
-    _impersonator_context.set(None)
\ No newline at end of file
+    _impersonator_context.set(None)
+    _deadline_context.set(None)
\ No newline at end of file
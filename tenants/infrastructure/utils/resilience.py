@@ -1,5 +1,10 @@
 import functools
 import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from asgiref.sync import sync_to_async
 from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
@@ -11,11 +16,405 @@ class CircuitBreakerError(Exception):
         self.retry_after = retry_after
         super().__init__(self.message)
 
+class BulkheadFullError(Exception):
+    """Exception raised when a bulkhead has no free slot and its wait queue is full."""
+    def __init__(self, message, retry_after=1):
+        self.message = message
+        self.retry_after = retry_after
+        super().__init__(self.message)
+
+class Bulkhead:
+    """
+    Tier 125: Per-Tenant Bulkhead.
+    Caps concurrent in-flight calls for one (tenant, provider) in this process.
+    Up to `max_waiting` callers may queue for at most `wait_timeout_ms` (or the
+    remaining deadline budget, if shorter); anyone beyond that is rejected at
+    once with BulkheadFullError, so a noisy tenant cannot hold every worker.
+    """
+    _registry = OrderedDict()
+    _registry_lock = threading.Lock()
+
+    def __init__(self, tenant, provider, max_concurrent=10, max_waiting=5, wait_timeout_ms=100):
+        from tenants.infrastructure.metrics import registry
+        self.tenant = tenant
+        self.provider = provider
+        self.max_concurrent = max_concurrent
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout_ms / 1000
+
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._waiting = 0
+
+        labelnames = ('tenant', 'provider')
+        self.in_flight_gauge = registry.gauge(
+            'tenant_bulkhead_in_flight', 'Provider calls currently holding a bulkhead slot.', labelnames=labelnames
+        )
+        self.waiting_gauge = registry.gauge(
+            'tenant_bulkhead_waiting', 'Provider calls queued for a bulkhead slot.', labelnames=labelnames
+        )
+        self.limit_gauge = registry.gauge(
+            'tenant_bulkhead_limit', 'Configured concurrent provider calls per bulkhead.', labelnames=labelnames
+        )
+        self.rejections = registry.counter(
+            'tenant_bulkhead_rejections_total', 'Provider calls rejected by a full bulkhead.', labelnames=labelnames
+        )
+        self.limit_gauge.set(max_concurrent, tenant=tenant, provider=provider)
+
+    @classmethod
+    def get(cls, tenant, provider, **limits):
+        """
+        Returns the process-wide bulkhead for (tenant, provider), applying `limits`
+        if they changed (e.g. after a plan change). The registry is an LRU bounded
+        by TENANT_BULKHEAD_REGISTRY_SIZE; only idle bulkheads are evicted.
+        """
+        from tenants.infrastructure.conf import conf
+        key = (tenant, provider)
+        with cls._registry_lock:
+            bulkhead = cls._registry.get(key)
+            if bulkhead is None:
+                bulkhead = cls._registry[key] = cls(tenant, provider, **limits)
+            else:
+                bulkhead.configure(**limits)
+                cls._registry.move_to_end(key)
+
+            for stale_key in list(cls._registry):
+                if len(cls._registry) <= conf.BULKHEAD_REGISTRY_SIZE:
+                    break
+                stale = cls._registry[stale_key]
+                if stale is not bulkhead and not (stale._in_flight or stale._waiting):
+                    del cls._registry[stale_key]
+                    stale._forget()
+        return bulkhead
+
+    @classmethod
+    def reset_all(cls):
+        with cls._registry_lock:
+            cls._registry.clear()
+
+    def configure(self, max_concurrent=None, max_waiting=None, wait_timeout_ms=None):
+        """Replaces the limits in place so calls already holding a slot stay accounted for."""
+        with self._condition:
+            if max_concurrent is not None and max_concurrent != self.max_concurrent:
+                self.max_concurrent = max_concurrent
+                self.limit_gauge.set(max_concurrent, tenant=self.tenant, provider=self.provider)
+                # A raised limit may admit queued callers right away
+                self._condition.notify_all()
+            if max_waiting is not None:
+                self.max_waiting = max_waiting
+            if wait_timeout_ms is not None:
+                self.wait_timeout = wait_timeout_ms / 1000
+
+    def _forget(self):
+        for gauge in (self.in_flight_gauge, self.waiting_gauge, self.limit_gauge):
+            gauge.remove(tenant=self.tenant, provider=self.provider)
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def _publish(self):
+        self.in_flight_gauge.set(self._in_flight, tenant=self.tenant, provider=self.provider)
+        self.waiting_gauge.set(self._waiting, tenant=self.tenant, provider=self.provider)
+
+    def _reject(self):
+        self.rejections.inc(tenant=self.tenant, provider=self.provider)
+        raise BulkheadFullError(
+            f"Too many concurrent {self.provider} calls for tenant '{self.tenant}'.",
+            retry_after=1
+        )
+
+    def acquire(self, blocking=True):
+        """Takes a slot, queueing as configured. With blocking=False returns False instead of queueing or rejecting."""
+        with self._condition:
+            if self._in_flight < self.max_concurrent:
+                self._in_flight += 1
+                self._publish()
+                return True
+            if not blocking:
+                return False
+            if self._waiting >= self.max_waiting:
+                self._reject()
+
+            timeout = self.wait_timeout
+            budget = remaining_budget()
+            if budget is not None:
+                timeout = min(timeout, budget)
+
+            self._waiting += 1
+            self._publish()
+            try:
+                admitted = self._condition.wait_for(lambda: self._in_flight < self.max_concurrent, timeout)
+            finally:
+                self._waiting -= 1
+            if not admitted:
+                self._publish()
+                self._reject()
+            self._in_flight += 1
+            self._publish()
+            return True
+
+    def release(self):
+        with self._condition:
+            self._in_flight -= 1
+            self._publish()
+            self._condition.notify()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+        return False
+
+class CircuitBreaker:
+    """
+    Tier 118: In-Process Circuit Breaker (closed -> open -> half-open).
+    Calls and failures are tallied in a bucketed sliding window in process memory,
+    so a successful call costs no network I/O. Failures are also counted in a
+    shared SlidingWindowCounter with atomic increments. The breaker trips when the
+    fleet-wide failure count reaches `threshold` and the local failure rate is at
+    least `failure_rate`. After `reset_timeout` it admits a limited number of
+    half-open probes: one success closes it, a failure re-opens it.
+    """
+    CLOSED, OPEN, HALF_OPEN = 'CLOSED', 'OPEN', 'HALF_OPEN'
+    BUCKETS = 10
+
+    _registry = OrderedDict()
+    _registry_lock = threading.Lock()
+
+    def __init__(self, name, threshold=5, reset_timeout=60, window=None, failure_rate=None, half_open_calls=None):
+        from tenants.infrastructure.conf import conf
+        self.name = name
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.window = window or conf.CIRCUIT_BREAKER_WINDOW
+        self.failure_rate = conf.CIRCUIT_BREAKER_FAILURE_RATE if failure_rate is None else failure_rate
+        self.half_open_calls = half_open_calls or conf.CIRCUIT_BREAKER_HALF_OPEN_CALLS
+        self.shared_failures = SlidingWindowCounter("cb_failures", window=self.window)
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._reset_window()
+
+    @classmethod
+    def get(cls, name, **params):
+        """
+        Returns the process-wide breaker for `name`, creating it with `params` on first use.
+        The registry is an LRU bounded by TENANT_CIRCUIT_BREAKER_REGISTRY_SIZE; an evicted
+        breaker starts closed again, while fleet-wide failures remain in the shared counter.
+        """
+        from tenants.infrastructure.conf import conf
+        with cls._registry_lock:
+            breaker = cls._registry.get(name)
+            if breaker is None:
+                breaker = cls._registry[name] = cls(name, **params)
+                while len(cls._registry) > conf.CIRCUIT_BREAKER_REGISTRY_SIZE:
+                    cls._registry.popitem(last=False)
+            else:
+                cls._registry.move_to_end(name)
+        return breaker
+
+    @classmethod
+    def reset_all(cls):
+        with cls._registry_lock:
+            cls._registry.clear()
+
+    # --- Sliding window ---
+
+    def _reset_window(self):
+        self._bucket_ids = [None] * self.BUCKETS
+        self._calls = [0] * self.BUCKETS
+        self._failures = [0] * self.BUCKETS
+
+    def _record(self, now, failed):
+        bucket = int(now * self.BUCKETS // self.window)
+        slot = bucket % self.BUCKETS
+        if self._bucket_ids[slot] != bucket:
+            self._bucket_ids[slot] = bucket
+            self._calls[slot] = self._failures[slot] = 0
+        self._calls[slot] += 1
+        self._failures[slot] += failed
+
+    def _totals(self, now):
+        oldest = int(now * self.BUCKETS // self.window) - self.BUCKETS + 1
+        calls = failures = 0
+        for slot, bucket in enumerate(self._bucket_ids):
+            if bucket is not None and bucket >= oldest:
+                calls += self._calls[slot]
+                failures += self._failures[slot]
+        return calls, failures
+
+    # --- State machine ---
+
+    @property
+    def state(self):
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+
+    def _maybe_half_open(self, now):
+        if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+            self._transition(self.HALF_OPEN)
+            self._probes = 0
+
+    def _transition(self, state):
+        from tenants.infrastructure.metrics import registry
+        self._state = state
+        registry.counter(
+            'circuit_breaker_transitions_total', 'Circuit breaker state changes by target state.',
+            labelnames=('state',)
+        ).inc(state=state)
+
+    def retry_after(self):
+        return max(1, int(self.reset_timeout - (time.monotonic() - self._opened_at)))
+
+    def before_call(self):
+        """Admits a call or raises CircuitBreakerError. Returns True when the call is a half-open probe."""
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            if self._state == self.CLOSED:
+                return False
+            if self._state == self.HALF_OPEN and self._probes < self.half_open_calls:
+                self._probes += 1
+                return True
+            retry_after = self.retry_after() if self._state == self.OPEN else 1
+
+        raise CircuitBreakerError(
+            f"Infrastructure component '{self.name}' is currently unavailable.",
+            retry_after=retry_after
+        )
+
+    def record_success(self, probe=False):
+        with self._lock:
+            if probe or self._state == self.HALF_OPEN:
+                logger.info(f"[CIRCUIT] Probe succeeded, closing circuit '{self.name}'.")
+                self._transition(self.CLOSED)
+                self._reset_window()
+            self._record(time.monotonic(), False)
+
+    def record_failure(self, error=None, probe=False):
+        now = time.monotonic()
+        with self._lock:
+            self._record(now, True)
+            if probe or self._state == self.HALF_OPEN:
+                self._trip(now, "half-open probe failed")
+                return
+            calls, failures = self._totals(now)
+
+        # Failure path only: one atomic increment on the shared counter
+        fleet_failures = self.shared_failures.hit(self.name)
+        logger.error(f"[CIRCUIT] Failure in {self.name} ({int(fleet_failures)}/{self.threshold}): {error}")
+
+        if fleet_failures >= self.threshold and failures / calls >= self.failure_rate:
+            with self._lock:
+                if self._state == self.CLOSED:
+                    self._trip(now, f"{int(fleet_failures)} failures in {self.window}s")
+
+    def _trip(self, now, reason):
+        logger.critical(f"[CIRCUIT] Tripping circuit '{self.name}' for {self.reset_timeout}s ({reason})!")
+        self._transition(self.OPEN)
+        self._opened_at = now
+        self._probes = 0
+        # Observation flag for dashboards; not read on the call path
+        cache.set(f"cb_state_{self.name}", self.OPEN, timeout=self.reset_timeout)
+
+    def call(self, func, *args, **kwargs):
+        probe = self.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e, probe=probe)
+            raise
+        self.record_success(probe=probe)
+        return result
+
+def action_setting(overrides, provider_name, action):
+    """Resolves a per-operation override keyed by "PROVIDER.action", "action" or "PROVIDER"."""
+    return overrides.get(f"{provider_name}.{action}") or overrides.get(action) or overrides.get(provider_name) or {}
+
+def remaining_budget():
+    """Seconds left before the active deadline (never negative), or None when no deadline is set."""
+    from tenants.infrastructure.utils.context import get_current_deadline
+    deadline = get_current_deadline()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+class RetryPolicy:
+    """
+    Tier 124: Declarative Retry Policy.
+    Bounded attempts with exponential backoff and full jitter
+    (sleep = uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))), only for
+    exceptions classified as retryable, and never past the call's deadline: the
+    earlier of the ambient request deadline and `deadline_ms` from the first attempt.
+    """
+
+    def __init__(self, max_attempts=1, base_delay_ms=100, max_delay_ms=2000, deadline_ms=None, retry_on=()):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay_ms / 1000
+        self.max_delay = max_delay_ms / 1000
+        self.deadline_ms = deadline_ms
+        self.retry_on = self._resolve(retry_on)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _import(path):
+        from django.utils.module_loading import import_string
+        try:
+            return import_string(path)
+        except ImportError:
+            # The client library is not installed, so its exceptions cannot be raised
+            return None
+
+    @classmethod
+    def _resolve(cls, retry_on):
+        classes = []
+        for entry in retry_on:
+            exc = cls._import(entry) if isinstance(entry, str) else entry
+            if exc is not None:
+                classes.append(exc)
+        return tuple(classes)
+
+    @classmethod
+    def for_action(cls, provider_name, action):
+        """Builds the policy from TENANT_RETRY_* defaults and TENANT_RETRY_POLICIES overrides."""
+        from tenants.infrastructure.conf import conf
+        params = {
+            'max_attempts': conf.RETRY_MAX_ATTEMPTS,
+            'base_delay_ms': conf.RETRY_BASE_DELAY_MS,
+            'max_delay_ms': conf.RETRY_MAX_DELAY_MS,
+            'deadline_ms': conf.RETRY_DEADLINE_MS,
+            'retry_on': conf.RETRY_ON,
+        }
+        params.update(action_setting(conf.RETRY_POLICIES, provider_name, action))
+        return cls(**params)
+
+    def is_retryable(self, error):
+        return isinstance(error, self.retry_on) and not isinstance(error, CircuitBreakerError)
+
+    def backoff(self, attempt):
+        """Full-jitter delay (seconds) to wait after failed attempt number `attempt`."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def deadline(self, now=None):
+        """Absolute time.monotonic() deadline for a call starting at `now`, or None."""
+        from tenants.infrastructure.utils.context import get_current_deadline
+        now = time.monotonic() if now is None else now
+        deadline = get_current_deadline()
+        if self.deadline_ms is not None:
+            own = now + self.deadline_ms / 1000
+            deadline = own if deadline is None else min(deadline, own)
+        return deadline
+
 def circuit_breaker(threshold=5, reset_timeout=60):
     """
     Tier 70: Regional Circuit Breaker.
-    Prevents cascading failures by tripping after 'threshold' consecutive failures.
-    Stored in Django cache for distributed state coordination.
+    Prevents cascading failures by tripping after 'threshold' failures.
+    Tier 118: State lives in a per-process CircuitBreaker; only failures touch the shared cache.
     """
     def decorator(func):
         @functools.wraps(func)
@@ -32,39 +431,52 @@ def circuit_breaker(threshold=5, reset_timeout=60):
             tenant_slug = tenant.slug if tenant else "global"
             # Use a stabilized name for the provider
             provider_name = func.__name__
-            
-            cache_key_failures = f"cb_fail_{tenant_slug}_{provider_name}"
-            cache_key_state = f"cb_state_{tenant_slug}_{provider_name}"
-            
-            # 2. Check if circuit is OPEN
-            if cache.get(cache_key_state) == "OPEN":
-                logger.warning(f"Circuit {provider_name} is OPEN for tenant {tenant_slug}")
-                raise CircuitBreakerError(
-                    f"Infrastructure component '{provider_name}' is currently unavailable for {tenant_slug}.",
-                    retry_after=reset_timeout
-                )
-            
-            try:
-                result = func(*args, **kwargs)
-                # Success: reset failure counter upon successful execution
-                if cache.get(cache_key_failures):
-                    cache.delete(cache_key_failures)
-                return result
-            except Exception as e:
-                # Don't trip for validation errors or expected business exceptions
-                # We only want to trip for infrastructure outages (Timeout, Connection Refused, etc)
-                # For now, we trip for any non-SovereignError or non-validation error if we can detect them
-                # But let's keep it simple: trip for any unhandled exception.
-                
-                failures = cache.get(cache_key_failures, 0) + 1
-                cache.set(cache_key_failures, failures, timeout=reset_timeout * 2)
-                
-                logger.error(f"[CIRCUIT] Failure in {provider_name} for {tenant_slug} ({failures}/{threshold}): {str(e)}")
-                
-                if failures >= threshold:
-                    logger.critical(f"[CIRCUIT] Tripping circuit '{provider_name}' for tenant {tenant_slug} for {reset_timeout}s!")
-                    cache.set(cache_key_state, "OPEN", timeout=reset_timeout)
-                
-                raise e
+
+            breaker = CircuitBreaker.get(
+                f"{tenant_slug}_{provider_name}", threshold=threshold, reset_timeout=reset_timeout
+            )
+            return breaker.call(func, *args, **kwargs)
         return wrapper
     return decorator
+
+class SlidingWindowCounter:
+    """
+    Tier 106: Atomic Sliding-Window Counter.
+    Hits land in per-window buckets via atomic cache increments. The rate is the
+    current bucket plus the previous one weighted by how much of it still
+    overlaps the sliding window, so counts are never lost under concurrency.
+    """
+
+    def __init__(self, name, window=60):
+        self.name = name
+        self.window = window
+
+    def _buckets(self, scope, now):
+        bucket = int(now // self.window)
+        elapsed = (now % self.window) / self.window
+        current = f"{self.name}:{scope}:{bucket}"
+        previous = f"{self.name}:{scope}:{bucket - 1}"
+        return current, previous, elapsed
+
+    def _estimate(self, current_count, previous_count, elapsed):
+        return current_count + (previous_count or 0) * (1 - elapsed)
+
+    def retry_after(self, now=None):
+        """Seconds until the current bucket rolls over."""
+        now = time.time() if now is None else now
+        return max(1, int(self.window - (now % self.window)) + 1)
+
+    def hit(self, scope, now=None):
+        """Counts one event and returns the sliding-window rate including it."""
+        current, previous, elapsed = self._buckets(scope, time.time() if now is None else now)
+        try:
+            count = cache.incr(current)
+        except ValueError:
+            # First hit in this bucket; add() keeps a racing creator from being overwritten
+            count = 1 if cache.add(current, 1, timeout=self.window * 2) else cache.incr(current)
+        return self._estimate(count, cache.get(previous, 0), elapsed)
+
+    async def ahit(self, scope, now=None):
+        # Django's built-in aincr is a non-atomic aget + aset that also resets the
+        # bucket TTL, so the async path runs the atomic sync incr/add in a thread.
+        return await sync_to_async(self.hit, thread_sensitive=False)(scope, now=now)
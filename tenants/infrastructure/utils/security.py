@@ -1,7 +1,12 @@
 
 import re
+import bisect
+import ipaddress
+import logging
 from tenants.business.exceptions import SecurityViolationError
 
+logger = logging.getLogger(__name__)
+
 class SchemaSanitizer:
     """
     Tier 80: Security Hardening.
@@ -41,3 +46,53 @@ class SchemaSanitizer:
             raise SecurityViolationError(f"Slug '{slug}' resulted in an invalid schema name.")
             
         return sanitized
+
+class IPAllowlist:
+    """
+    Tier 104: Compiled IP Allowlist.
+    Accepts single addresses and IPv4/IPv6 CIDR blocks. Entries are merged into
+    sorted integer ranges per address family, so a lookup is one bisect (O(log n)).
+    """
+
+    def __init__(self, entries=None):
+        entries = list(entries or [])
+        # A configured-but-unparseable list must still deny, never fail open.
+        self._enforced = bool(entries)
+        self._starts = {4: [], 6: []}
+        self._ends = {4: [], 6: []}
+
+        ranges = {4: [], 6: []}
+        for entry in entries:
+            try:
+                network = ipaddress.ip_network(str(entry).strip(), strict=False)
+            except ValueError:
+                logger.warning(f"[IP-ALLOWLIST] Ignoring invalid entry: {entry!r}")
+                continue
+            ranges[network.version].append(
+                (int(network.network_address), int(network.broadcast_address))
+            )
+
+        for version, items in ranges.items():
+            for start, end in sorted(items):
+                ends = self._ends[version]
+                if ends and start <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    self._starts[version].append(start)
+                    ends.append(end)
+
+    def __bool__(self):
+        return self._enforced
+
+    def __contains__(self, ip):
+        try:
+            address = ipaddress.ip_address(str(ip).strip())
+        except ValueError:
+            return False
+        if address.version == 6 and address.ipv4_mapped:
+            address = address.ipv4_mapped
+
+        value = int(address)
+        starts = self._starts[address.version]
+        idx = bisect.bisect_right(starts, value) - 1
+        return idx >= 0 and value <= self._ends[address.version][idx]
@@ -1,4 +1,9 @@
+import atexit
+import bisect
+import collections
 import logging
+import os
+import threading
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import (
@@ -50,18 +55,276 @@ def setup_telemetry():
 def get_tracer():
     return trace.get_tracer("sovereign.engine")
 
+class LatencyHistogram:
+    """
+    Tier 122: Mergeable Latency Histogram.
+    Works on TelemetryRollup.latency_histogram slots. Histograms merge by
+    element-wise addition, so any window's percentiles come from summing its
+    rollups; quantiles interpolate linearly inside the matching log-linear slot.
+    """
+
+    @staticmethod
+    def merge(histograms):
+        merged = None
+        for histogram in histograms:
+            if not histogram:
+                continue
+            if merged is None:
+                merged = list(histogram)
+            else:
+                merged = [a + b for a, b in zip(merged, histogram)]
+        return merged or TelemetryRollupWriter.empty_histogram()
+
+    @staticmethod
+    def quantile(histogram, q):
+        """Estimated latency (ms) at quantile q, or None for an empty histogram."""
+        from tenants.domain.models.models_telemetry import TelemetryRollup
+
+        bounds = TelemetryRollup.LATENCY_BOUNDS
+        total = sum(histogram)
+        if not total:
+            return None
+
+        rank = q * total
+        seen = 0
+        for slot, count in enumerate(histogram):
+            if count and seen + count >= rank:
+                if slot == len(bounds):
+                    # Overflow slot has no upper bound; report its floor
+                    return float(bounds[-1])
+                lower = bounds[slot - 1] if slot else 0
+                return lower + (bounds[slot] - lower) * (rank - seen) / count
+            seen += count
+        return float(bounds[-1])
+
+class LatencyTracker:
+    """
+    Tier 123: In-Process Latency Tracker.
+    A rolling LatencyHistogram per key (e.g. provider link and action) fed by
+    successful calls. Counts are halved every `window` samples so the estimate
+    follows recent behaviour without keeping individual samples.
+    """
+
+    def __init__(self, window=1000):
+        self.window = window
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, key, latency_ms):
+        slot = TelemetryRollupWriter.latency_slot(latency_ms)
+        with self._lock:
+            state = self._histograms.get(key)
+            if state is None:
+                state = self._histograms[key] = [TelemetryRollupWriter.empty_histogram(), 0]
+            histogram = state[0]
+            histogram[slot] += 1
+            state[1] += 1
+            if state[1] >= self.window:
+                state[0] = [count // 2 for count in histogram]
+                state[1] = 0
+
+    def quantile(self, key, q, min_samples=1):
+        """Estimated latency (ms) at quantile q, or None until `min_samples` are held."""
+        with self._lock:
+            state = self._histograms.get(key)
+            histogram = list(state[0]) if state else None
+        if histogram is None or sum(histogram) < min_samples:
+            return None
+        return LatencyHistogram.quantile(histogram, q)
+
+    def clear(self):
+        with self._lock:
+            self._histograms.clear()
+
+class TelemetryRollupWriter:
+    """
+    Tier 121: Incremental Rollup Maintenance.
+    Folds a batch of saved TelemetryEntry rows into per-minute TelemetryRollup
+    deltas and merges them in one transaction: missing rows are created with
+    ignore_conflicts, then the affected rows are locked, merged and bulk-updated.
+    """
+    FIELDS = ['count', 'error_count', 'latency_count', 'latency_sum_ms', 'latency_histogram']
+
+    @staticmethod
+    def latency_slot(latency_ms):
+        from tenants.domain.models.models_telemetry import TelemetryRollup
+        return bisect.bisect_left(TelemetryRollup.LATENCY_BOUNDS, latency_ms)
+
+    @staticmethod
+    def empty_histogram():
+        from tenants.domain.models.models_telemetry import TelemetryRollup
+        return [0] * (len(TelemetryRollup.LATENCY_BOUNDS) + 1)
+
+    @classmethod
+    def fold(cls, entries):
+        from tenants.domain.models.models_telemetry import TelemetryRollup
+
+        deltas = {}
+        for entry in entries:
+            key = (entry.tenant_id, entry.timestamp.replace(second=0, microsecond=0), entry.provider, entry.action, entry.status)
+            delta = deltas.get(key)
+            if delta is None:
+                delta = deltas[key] = {'count': 0, 'error_count': 0, 'latency_count': 0, 'latency_sum_ms': 0,
+                                       'latency_histogram': cls.empty_histogram()}
+            delta['count'] += 1
+            delta['error_count'] += entry.status in TelemetryRollup.ERROR_STATUSES
+            # Short-circuited calls never reached the provider; a 0ms sample would drag percentiles down
+            if entry.latency_ms is not None and entry.status != 'CIRCUIT_OPEN':
+                delta['latency_count'] += 1
+                delta['latency_sum_ms'] += entry.latency_ms
+                delta['latency_histogram'][cls.latency_slot(entry.latency_ms)] += 1
+        return deltas
+
+    @classmethod
+    def apply(cls, entries):
+        from django.db import transaction
+        from tenants.domain.models.models_telemetry import TelemetryRollup
+
+        deltas = cls.fold(entries)
+        if not deltas:
+            return 0
+
+        rollups = TelemetryRollup.unscoped_objects
+        with transaction.atomic():
+            rollups.bulk_create([
+                TelemetryRollup(tenant_id=tenant_id, bucket=bucket, provider=provider, action=action, status=status,
+                                latency_histogram=cls.empty_histogram())
+                for tenant_id, bucket, provider, action, status in deltas
+            ], ignore_conflicts=True)
+
+            rows = rollups.select_for_update().filter(
+                tenant_id__in={key[0] for key in deltas}, bucket__in={key[1] for key in deltas}
+            )
+            updated = []
+            for row in rows:
+                delta = deltas.get((row.tenant_id, row.bucket, row.provider, row.action, row.status))
+                if delta is None:
+                    continue
+                row.count += delta['count']
+                row.error_count += delta['error_count']
+                row.latency_count += delta['latency_count']
+                row.latency_sum_ms += delta['latency_sum_ms']
+                histogram = row.latency_histogram or cls.empty_histogram()
+                row.latency_histogram = [a + b for a, b in zip(histogram, delta['latency_histogram'])]
+                updated.append(row)
+            rollups.bulk_update(updated, cls.FIELDS)
+        return len(updated)
+
+class TelemetryBuffer:
+    """
+    Tier 120: Bounded Telemetry Write Buffer.
+    Records are appended to an in-memory ring and written by a daemon flusher
+    with bulk_create every TENANT_TELEMETRY_BATCH_SIZE records or
+    TENANT_TELEMETRY_FLUSH_INTERVAL_MS, whichever comes first. When the ring is
+    full new records are dropped (and counted) rather than blocking the caller.
+    """
+
+    def __init__(self, capacity=None, batch_size=None, flush_interval_ms=None, autostart=True):
+        from tenants.infrastructure.conf import conf
+        from tenants.infrastructure.metrics import registry
+
+        self.capacity = capacity or conf.TELEMETRY_BUFFER_SIZE
+        self.batch_size = batch_size or conf.TELEMETRY_BATCH_SIZE
+        self.flush_interval = (flush_interval_ms or conf.TELEMETRY_FLUSH_INTERVAL_MS) / 1000
+        self.autostart = autostart
+
+        self._records = collections.deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+
+        self.dropped = registry.counter(
+            'tenant_telemetry_dropped_total', 'Telemetry records dropped by the write buffer.', labelnames=('reason',)
+        )
+        self.written = registry.counter('tenant_telemetry_written_total', 'Telemetry records written by the buffer.')
+
+    def __len__(self):
+        return len(self._records)
+
+    def put(self, entry):
+        """Queues an unsaved TelemetryEntry. Returns False if it was dropped."""
+        with self._lock:
+            if entry.tenant_id is None:
+                # TelemetryEntry.tenant is required; one orphan would fail the whole batch insert
+                self.dropped.inc(reason='no_tenant')
+                return False
+            if len(self._records) >= self.capacity:
+                self.dropped.inc(reason='backpressure')
+                return False
+            self._records.append(entry)
+            full = len(self._records) >= self.batch_size
+
+        if self.autostart and (self._thread is None or self._pid != os.getpid()):
+            self._start()
+        if full:
+            self._wakeup.set()
+        return True
+
+    def _start(self):
+        with self._lock:
+            # Threads do not survive fork; each (Celery prefork) child starts its own flusher
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="telemetry-flusher", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def _drain(self):
+        with self._lock:
+            count = min(len(self._records), self.batch_size)
+            return [self._records.popleft() for _ in range(count)]
+
+    def flush(self):
+        """Writes everything queued so far. Returns the number of records written."""
+        from django.db import close_old_connections, transaction
+        from tenants.domain.models.models_telemetry import TelemetryEntry
+
+        written = 0
+        with self._flush_lock:
+            while True:
+                batch = self._drain()
+                if not batch:
+                    break
+                try:
+                    with transaction.atomic():
+                        TelemetryEntry.objects.bulk_create(batch)
+                        TelemetryRollupWriter.apply(batch)
+                    written += len(batch)
+                except Exception as e:
+                    self.dropped.inc(len(batch), reason='error')
+                    logger.error(f"[TELEMETRY-BRIDGE] Failed to flush {len(batch)} infrastructure events: {e}")
+            if threading.current_thread() is self._thread:
+                close_old_connections()
+        if written:
+            self.written.inc(written)
+        return written
+
 class InfrastructureTelemetryBridge:
     """
     Tier 94: Tenant-Visible Telemetry.
     Bridges infrastructure outcomes to the TelemetryEntry model.
+    Tier 120: Writes go through a TelemetryBuffer off the request thread (TENANT_TELEMETRY_BUFFERED).
+    Tier 121: Every write also folds into the per-minute TelemetryRollup rows.
     """
+    buffer = TelemetryBuffer()
     
     @staticmethod
     def record(tenant, provider, action, status, latency_ms=None, error_message=None, metadata=None):
+        from django.utils import timezone
         from tenants.domain.models.models_telemetry import TelemetryEntry
+        from tenants.infrastructure.conf import conf
         try:
-            TelemetryEntry.objects.create(
+            entry = TelemetryEntry(
                 tenant=tenant,
+                timestamp=timezone.now(),
                 provider=provider,
                 action=action,
                 status=status,
@@ -69,5 +332,35 @@ class InfrastructureTelemetryBridge:
                 error_message=str(error_message) if error_message else None,
                 metadata=metadata or {}
             )
+            if not conf.TELEMETRY_BUFFERED:
+                entry.save()
+                TelemetryRollupWriter.apply([entry])
+                return
+
+            if entry.tenant_id is None:
+                # bulk_create skips save(); resolve the ambient tenant while it is still active
+                from tenants.infrastructure.utils.context import get_current_tenant
+                entry.tenant = get_current_tenant()
+            InfrastructureTelemetryBridge.buffer.put(entry)
         except Exception as e:
             logger.error(f"[TELEMETRY-BRIDGE] Failed to record infrastructure event: {e}")
+
+    @staticmethod
+    def flush():
+        return InfrastructureTelemetryBridge.buffer.flush()
+
+def _flush_on_shutdown(**kwargs):
+    try:
+        InfrastructureTelemetryBridge.flush()
+    except Exception as e:
+        logger.warning(f"[TELEMETRY-BRIDGE] Shutdown flush failed: {e}")
+
+atexit.register(_flush_on_shutdown)
+
+try:
+    from celery.signals import worker_process_shutdown, worker_shutdown
+except ImportError:  # Celery is optional
+    pass
+else:
+    worker_process_shutdown.connect(_flush_on_shutdown, weak=False)
+    worker_shutdown.connect(_flush_on_shutdown, weak=False)
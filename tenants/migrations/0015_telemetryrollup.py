@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:48
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0014_invoice'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TelemetryRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('bucket', models.DateTimeField()),
+                ('provider', models.CharField(choices=[('EMAIL', 'Email'), ('SMS', 'SMS'), ('WHATSAPP', 'WhatsApp'), ('SEARCH', 'Search'), ('CACHE', 'Cache'), ('IDENTITY', 'Identity')], max_length=50)),
+                ('action', models.CharField(max_length=100)),
+                ('status', models.CharField(choices=[('SUCCESS', 'Success'), ('FAILURE', 'Failure'), ('DEGRADED', 'Degraded (Fallback Used)'), ('CIRCUIT_OPEN', 'Circuit Breaker Open')], max_length=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('error_count', models.PositiveIntegerField(default=0)),
+                ('latency_count', models.PositiveIntegerField(default=0)),
+                ('latency_sum_ms', models.BigIntegerField(default=0)),
+                ('latency_histogram', models.JSONField(default=list)),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)ss', to='tenants.tenant')),
+            ],
+            options={
+                'ordering': ['-bucket'],
+                'indexes': [models.Index(fields=['tenant', 'bucket'], name='tenants_tel_tenant__409287_idx')],
+                'unique_together': {('tenant', 'bucket', 'provider', 'action', 'status')},
+            },
+        ),
+    ]
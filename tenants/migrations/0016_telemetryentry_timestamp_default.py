@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:06
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0015_telemetryrollup'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='telemetryentry',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,101 @@
+import bisect
+import datetime
+from django.db import migrations, transaction
+from django.utils import timezone
+
+# Frozen copies of the rollup layout at the time of this migration, so later
+# changes to the telemetry writer cannot change what the backfill does.
+BACKFILL_DAYS = 31  # TelemetryViewSet.MAX_RANGE
+BACKFILL_BATCH = 2000
+ERROR_STATUSES = ('FAILURE', 'CIRCUIT_OPEN')
+SUB_BUCKETS = 16
+LATENCY_BOUNDS = tuple(range(1, SUB_BUCKETS + 1)) + tuple(
+    2 ** exponent + step * 2 ** exponent // SUB_BUCKETS
+    for exponent in range(4, 16) for step in range(1, SUB_BUCKETS + 1)
+)
+FIELDS = ['count', 'error_count', 'latency_count', 'latency_sum_ms', 'latency_histogram']
+
+
+def empty_histogram():
+    return [0] * (len(LATENCY_BOUNDS) + 1)
+
+
+def fold(entries):
+    deltas = {}
+    for entry in entries:
+        key = (entry.tenant_id, entry.timestamp.replace(second=0, microsecond=0), entry.provider, entry.action, entry.status)
+        delta = deltas.get(key)
+        if delta is None:
+            delta = deltas[key] = {'count': 0, 'error_count': 0, 'latency_count': 0, 'latency_sum_ms': 0,
+                                   'latency_histogram': empty_histogram()}
+        delta['count'] += 1
+        delta['error_count'] += entry.status in ERROR_STATUSES
+        # Older rows logged short-circuited calls at 0ms; they never reached the provider
+        if entry.latency_ms is not None and entry.status != 'CIRCUIT_OPEN':
+            delta['latency_count'] += 1
+            delta['latency_sum_ms'] += entry.latency_ms
+            delta['latency_histogram'][bisect.bisect_left(LATENCY_BOUNDS, entry.latency_ms)] += 1
+    return deltas
+
+
+def apply(TelemetryRollup, using, entries):
+    deltas = fold(entries)
+    if not deltas:
+        return
+    rollups = TelemetryRollup._base_manager.db_manager(using)
+    with transaction.atomic(using=using):
+        rollups.bulk_create([
+            TelemetryRollup(tenant_id=tenant_id, bucket=bucket, provider=provider, action=action, status=status,
+                            latency_histogram=empty_histogram())
+            for tenant_id, bucket, provider, action, status in deltas
+        ], ignore_conflicts=True)
+
+        rows = rollups.select_for_update().filter(
+            tenant_id__in={key[0] for key in deltas}, bucket__in={key[1] for key in deltas}
+        )
+        updated = []
+        for row in rows:
+            delta = deltas.get((row.tenant_id, row.bucket, row.provider, row.action, row.status))
+            if delta is None:
+                continue
+            row.count += delta['count']
+            row.error_count += delta['error_count']
+            row.latency_count += delta['latency_count']
+            row.latency_sum_ms += delta['latency_sum_ms']
+            histogram = row.latency_histogram or empty_histogram()
+            row.latency_histogram = [a + b for a, b in zip(histogram, delta['latency_histogram'])]
+            updated.append(row)
+        rollups.bulk_update(updated, FIELDS)
+
+
+def backfill_rollups(apps, schema_editor):
+    """Folds recent TelemetryEntry rows so the dashboards are not empty after upgrade."""
+    TelemetryEntry = apps.get_model('tenants', 'TelemetryEntry')
+    TelemetryRollup = apps.get_model('tenants', 'TelemetryRollup')
+    using = schema_editor.connection.alias
+    since = timezone.now() - datetime.timedelta(days=BACKFILL_DAYS)
+
+    entries = TelemetryEntry._base_manager.db_manager(using).filter(timestamp__gte=since).only(
+        'tenant_id', 'timestamp', 'provider', 'action', 'status', 'latency_ms'
+    ).order_by('pk')
+    # Keyset batches, each in its own transaction, so a large table is never
+    # folded under one long-running lock
+    last_pk = None
+    while True:
+        batch = list((entries if last_pk is None else entries.filter(pk__gt=last_pk))[:BACKFILL_BATCH])
+        if not batch:
+            break
+        apply(TelemetryRollup, using, batch)
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('tenants', '0016_telemetryentry_timestamp_default'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop, atomic=False),
+    ]
@@ -131,6 +131,16 @@ def automated_webhook_post_delete(sender, instance, **kwargs):
 # Sigma Tier: Seat-Based Billing Sync
 from .domain.models.models_identity import Membership
 
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def invalidate_membership_verdicts(sender, instance, **kwargs):
+    """
+    Tier 103: Retires cached membership verdicts for the affected tenant.
+    Connected ahead of the seat sync so a billing failure cannot skip it.
+    """
+    from .infrastructure.security.membership import MembershipCache
+    MembershipCache.invalidate(instance.tenant_id)
+
 @receiver(post_save, sender=Membership)
 @receiver(post_delete, sender=Membership)
 def sync_seats_on_membership_change(sender, instance, **kwargs):
@@ -141,3 +151,72 @@ def sync_seats_on_membership_change(sender, instance, **kwargs):
     # In production, this should be offloaded to a background task
     # to avoid blocking on external API calls.
     SeatService.handle_membership_change(instance.tenant)
+
+# Tier 101: Tenant Resolution Cache Invalidation
+from .domain.models.models_tenant import Tenant, Domain
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+@receiver(post_save, sender=Domain)
+@receiver(post_delete, sender=Domain)
+def invalidate_tenant_resolution(sender, instance, **kwargs):
+    """
+    Retires cached host-to-tenant resolutions whenever a tenant or domain changes.
+    The generation bump reaches other processes on their next poll.
+    """
+    from .infrastructure.resolution import TenantResolver
+    TenantResolver.invalidate()
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+def evict_tenant_providers(sender, instance, **kwargs):
+    """Tier 112: Frees memoized adapter instances built from the tenant's previous config."""
+    from .infrastructure.registry import ProviderInstanceCache
+    ProviderInstanceCache.evict(instance.id)
+
+# Fields whose change can make something cached in the tenant's namespace stale
+TENANT_CACHE_FIELDS = ('plan', 'config', 'isolation_mode', 'is_active', 'is_maintenance', 'subscription_status')
+
+@receiver(pre_save, sender=Tenant)
+def snapshot_tenant_cache_fields(sender, instance, update_fields=None, raw=False, **kwargs):
+    """Tier 115: Records the stored values of TENANT_CACHE_FIELDS so post_save can tell if they changed."""
+    instance._cache_fields_before = {}
+    if raw or instance._state.adding:
+        return
+    names = [name for name in TENANT_CACHE_FIELDS if update_fields is None or name in update_fields]
+    if not names:
+        return
+    attnames = [sender._meta.get_field(name).attname for name in names]
+    instance._cache_fields_before = sender._base_manager.filter(pk=instance.pk).values(*attnames).first()
+
+def _tenant_cache_fields_changed(instance):
+    before = getattr(instance, '_cache_fields_before', None)
+    if before is None:
+        # No stored row (or no snapshot at all): assume the worst
+        return True
+    return any(getattr(instance, attname) != value for attname, value in before.items())
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+def invalidate_tenant_cache(sender, instance, created=False, signal=None, **kwargs):
+    """
+    Tier 115: Plan, config and lifecycle changes (including offboarding) retire
+    the tenant's whole cache namespace with one generation bump. Saves that
+    touch none of TENANT_CACHE_FIELDS (billing ids, counters, branding) keep it.
+    """
+    if created:
+        return
+    if signal is post_save and not _tenant_cache_fields_changed(instance):
+        return
+    from .infrastructure.cache import TenantCache
+    TenantCache.invalidate_tenant(instance.id)
+
+# Tier 109: Impersonator Cache Invalidation
+from django.contrib.auth import get_user_model
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def invalidate_impersonator(sender, instance, **kwargs):
+    """Drops the cached impersonator identity so staff changes apply to open sessions."""
+    from .infrastructure.security.impersonation import ImpersonatorCache
+    ImpersonatorCache.invalidate(instance.pk)
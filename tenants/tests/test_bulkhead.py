@@ -0,0 +1,88 @@
+import threading
+from unittest import mock
+from django.test import TestCase, override_settings
+from tenants.domain.models import Plan, Tenant
+from tenants.infrastructure.hub import ResilientProviderProxy
+from tenants.infrastructure.utils.resilience import Bulkhead, BulkheadFullError
+
+class BulkheadTest(TestCase):
+    """
+    Tier 125: Bounded per-(tenant, provider) concurrency with fast rejection.
+    """
+
+    def setUp(self):
+        Bulkhead.reset_all()
+        self.addCleanup(Bulkhead.reset_all)
+        patcher = mock.patch('tenants.infrastructure.hub.InfrastructureTelemetryBridge.record')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_full_bulkhead_rejects_after_queue(self):
+        bulkhead = Bulkhead("acme", "EMAIL", max_concurrent=1, max_waiting=0, wait_timeout_ms=10)
+        with bulkhead:
+            self.assertEqual(bulkhead.in_flight_gauge.value(tenant="acme", provider="EMAIL"), 1)
+            before = bulkhead.rejections.value(tenant="acme", provider="EMAIL")
+            with self.assertRaises(BulkheadFullError):
+                bulkhead.acquire()
+            self.assertEqual(bulkhead.rejections.value(tenant="acme", provider="EMAIL"), before + 1)
+        self.assertEqual(bulkhead.in_flight, 0)
+
+    def test_queued_call_is_admitted_when_a_slot_frees(self):
+        bulkhead = Bulkhead("acme", "SMS", max_concurrent=1, max_waiting=1, wait_timeout_ms=2000)
+        bulkhead.acquire()
+        admitted = threading.Event()
+
+        def waiter():
+            with bulkhead:
+                admitted.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        self.assertFalse(admitted.wait(0.05))
+        bulkhead.release()
+        self.assertTrue(admitted.wait(2))
+        thread.join()
+
+    @override_settings(TENANT_BULKHEAD_PLAN_LIMITS={"free": {"max_concurrent": 1, "max_waiting": 0, "EMAIL": {"wait_timeout_ms": 1}}})
+    def test_proxy_applies_plan_limits(self):
+        plan = Plan.objects.create(name="Free", slug="free")
+        tenant = Tenant.objects.create(name="Acme Corp", slug="acme", plan=plan)
+        inside, release = threading.Event(), threading.Event()
+        self.addCleanup(release.set)
+        provider = mock.Mock()
+        provider.send_email.side_effect = lambda *args: inside.set() or release.wait(5)
+        proxy = ResilientProviderProxy(tenant, "EMAIL", provider)
+
+        bulkhead = ResilientProviderProxy.bulkhead_for(tenant, "EMAIL")
+        self.assertEqual((bulkhead.max_concurrent, bulkhead.max_waiting, bulkhead.wait_timeout), (1, 0, 0.001))
+
+        thread = threading.Thread(target=proxy.send_email, args=("to@example.com",))
+        thread.start()
+        self.assertTrue(inside.wait(2))
+        with self.assertRaises(BulkheadFullError):
+            proxy.send_email("other@example.com")
+        release.set()
+        thread.join()
+        self.assertEqual(bulkhead.in_flight, 0)
+
+    def test_changed_limits_update_the_existing_bulkhead(self):
+        bulkhead = Bulkhead.get("acme", "EMAIL", max_concurrent=2)
+        bulkhead.acquire()
+        self.addCleanup(bulkhead.release)
+
+        self.assertIs(Bulkhead.get("acme", "EMAIL", max_concurrent=5), bulkhead)
+        self.assertEqual(bulkhead.max_concurrent, 5)
+        self.assertEqual(bulkhead.limit_gauge.value(tenant="acme", provider="EMAIL"), 5)
+        self.assertEqual(bulkhead.in_flight, 1)
+
+    @override_settings(TENANT_BULKHEAD_REGISTRY_SIZE=2)
+    def test_registry_evicts_least_recently_used_idle_bulkheads(self):
+        busy = Bulkhead.get("busy", "EMAIL")
+        busy.acquire()
+        self.addCleanup(busy.release)
+        idle = Bulkhead.get("idle", "EMAIL")
+        Bulkhead.get("new", "EMAIL")
+
+        self.assertEqual(set(Bulkhead._registry), {("busy", "EMAIL"), ("new", "EMAIL")})
+        self.assertNotIn(("idle", "EMAIL"), idle.limit_gauge._values)
+        self.assertIs(Bulkhead.get("busy", "EMAIL"), busy)
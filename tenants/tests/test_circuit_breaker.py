@@ -0,0 +1,128 @@
+from unittest import mock
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from tenants.domain.models import Tenant
+from tenants.domain.models.models_telemetry import TelemetryEntry
+from tenants.infrastructure.hub import ResilientProviderProxy
+from tenants.infrastructure.utils.resilience import CircuitBreaker, CircuitBreakerError, circuit_breaker
+
+class CircuitBreakerTest(SimpleTestCase):
+    """
+    Tier 118: Breaker state lives in process memory; only failures reach the shared cache.
+    """
+
+    def setUp(self):
+        cache.clear()
+        CircuitBreaker.reset_all()
+        self.addCleanup(CircuitBreaker.reset_all)
+
+    def _fail(self, breaker):
+        def boom():
+            raise ConnectionError("provider down")
+        with self.assertRaises(ConnectionError):
+            breaker.call(boom)
+
+    def test_success_path_does_no_cache_io(self):
+        breaker = CircuitBreaker('acme_get_cache_provider', threshold=3, reset_timeout=30)
+        with mock.patch('tenants.infrastructure.utils.resilience.cache') as shared:
+            for _ in range(50):
+                self.assertEqual(breaker.call(lambda: 'ok'), 'ok')
+        self.assertEqual(shared.method_calls, [])
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_trips_after_threshold_and_rejects_fast(self):
+        breaker = CircuitBreaker('acme_get_queue_provider', threshold=3, reset_timeout=30)
+        for _ in range(3):
+            self._fail(breaker)
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        func = mock.Mock()
+        with self.assertRaises(CircuitBreakerError) as ctx:
+            breaker.call(func)
+        func.assert_not_called()
+        self.assertGreaterEqual(ctx.exception.retry_after, 1)
+
+    def test_low_failure_rate_keeps_circuit_closed(self):
+        breaker = CircuitBreaker('acme_get_search_provider', threshold=3, reset_timeout=30, failure_rate=0.5)
+        for _ in range(10):
+            breaker.call(lambda: 'ok')
+        for _ in range(3):
+            self._fail(breaker)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_half_open_probe(self):
+        breaker = CircuitBreaker('acme_get_audit_provider', threshold=2, reset_timeout=30)
+        with mock.patch('tenants.infrastructure.utils.resilience.time.monotonic', return_value=1000.0):
+            self._fail(breaker)
+            self._fail(breaker)
+
+        with mock.patch('tenants.infrastructure.utils.resilience.time.monotonic', return_value=1031.0):
+            self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+            # A failed probe re-opens the circuit
+            self._fail(breaker)
+            self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        with mock.patch('tenants.infrastructure.utils.resilience.time.monotonic', return_value=1062.0):
+            probe = breaker.before_call()
+            self.assertTrue(probe)
+            # Only one probe is admitted at a time
+            with self.assertRaises(CircuitBreakerError):
+                breaker.before_call()
+            breaker.record_success(probe=True)
+            self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_decorator_shares_breaker_per_tenant_and_function(self):
+        calls = []
+
+        @circuit_breaker(threshold=2, reset_timeout=30)
+        def get_billing_provider(tenant=None):
+            calls.append(tenant)
+            raise ConnectionError("down")
+
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                get_billing_provider()
+        with self.assertRaises(CircuitBreakerError):
+            get_billing_provider()
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(CircuitBreaker.get('global_get_billing_provider').state, CircuitBreaker.OPEN)
+
+    @override_settings(TENANT_CIRCUIT_BREAKER_REGISTRY_SIZE=2)
+    def test_registry_evicts_least_recently_used(self):
+        first = CircuitBreaker.get("acme:EMAIL:send_email")
+        CircuitBreaker.get("acme:SMS:send_sms")
+        self.assertIs(CircuitBreaker.get("acme:EMAIL:send_email"), first)
+        CircuitBreaker.get("acme:SEARCH:search")
+
+        self.assertEqual(list(CircuitBreaker._registry), ["acme:EMAIL:send_email", "acme:SEARCH:search"])
+
+class ResilientProviderChainBreakerTest(TestCase):
+    """
+    Tier 119: Provider operations are broken per (tenant, provider, action).
+    """
+
+    def setUp(self):
+        cache.clear()
+        CircuitBreaker.reset_all()
+        self.addCleanup(CircuitBreaker.reset_all)
+        self.tenant = Tenant.objects.create(name="Acme Corp", slug="acme")
+        self.provider = mock.Mock()
+        self.provider.search.side_effect = TimeoutError("search timed out")
+        self.provider.index_document.return_value = True
+        self.proxy = ResilientProviderProxy(self.tenant, "SEARCH", self.provider)
+
+    @override_settings(TENANT_CIRCUIT_BREAKER_ACTIONS={"SEARCH.search": {"threshold": 2, "reset_timeout": 30}})
+    def test_open_circuit_short_circuits_to_degraded_path(self):
+        for _ in range(4):
+            self.assertEqual(self.proxy.search("query"), "DEGRADED_MODE")
+
+        # Only the calls before the circuit opened reached the provider
+        self.assertEqual(self.provider.search.call_count, 2)
+        statuses = list(TelemetryEntry.objects.filter(action="search").values_list('status', flat=True))
+        self.assertEqual(sorted(statuses), ["CIRCUIT_OPEN", "CIRCUIT_OPEN", "FAILURE", "FAILURE"])
+        # Short-circuited calls never ran, so they carry no latency
+        self.assertFalse(TelemetryEntry.objects.filter(status="CIRCUIT_OPEN", latency_ms__isnull=False).exists())
+
+        # Other actions on the same provider keep their own circuit
+        self.assertTrue(self.proxy.index_document({"id": 1}))
@@ -0,0 +1,41 @@
+from unittest import mock
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from tenants.domain.models import Tenant
+from tenants.infrastructure.hub import ResilientProviderChain, ResilientProviderProxy
+from tenants.infrastructure.utils.resilience import CircuitBreaker
+
+class ResilientProviderFallbackTest(SimpleTestCase):
+    """
+    Tier 123: Tenant fallback chains are walked in order until a vendor answers.
+    """
+
+    def setUp(self):
+        cache.clear()
+        CircuitBreaker.reset_all()
+        ResilientProviderChain.latency.clear()
+        self.addCleanup(CircuitBreaker.reset_all)
+        self.addCleanup(ResilientProviderChain.latency.clear)
+        patcher = mock.patch('tenants.infrastructure.hub.InfrastructureTelemetryBridge.record')
+        self.record = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tenant = Tenant(name="Acme Corp", slug="acme")
+
+    @override_settings(TENANT_RETRY_MAX_ATTEMPTS=1)
+    def test_chain_falls_through_to_next_vendor(self):
+        sendgrid, ses = mock.Mock(), mock.Mock()
+        sendgrid.send_email.side_effect = ConnectionError("sendgrid down")
+        ses.send_email.return_value = "ses-message-id"
+        proxy = ResilientProviderProxy(self.tenant, "EMAIL", sendgrid, fallbacks=[("ses", ses)])
+
+        self.assertEqual(proxy.send_email("to@example.com", "Hi", "Body"), "ses-message-id")
+        ses.send_email.assert_called_once_with("to@example.com", "Hi", "Body")
+        statuses = [(c.args[3], c.kwargs.get('metadata')) for c in self.record.call_args_list]
+        self.assertEqual(statuses, [("FAILURE", {}), ("SUCCESS", {"link": "EMAIL/ses"})])
+
+    def test_exhausted_chain_degrades(self):
+        primary, fallback = mock.Mock(), mock.Mock()
+        primary.send_sms.side_effect = TimeoutError()
+        fallback.send_sms.side_effect = TimeoutError()
+        proxy = ResilientProviderProxy(self.tenant, "SMS", primary, fallbacks=[("backup", fallback)])
+        self.assertEqual(proxy.send_sms("+100", "hi"), "DEGRADED_MODE")
@@ -0,0 +1,115 @@
+import threading
+import time
+from unittest import mock
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from tenants.domain.models import Tenant
+from tenants.infrastructure.hub import ResilientProviderChain, ResilientProviderProxy
+from tenants.infrastructure.utils.resilience import Bulkhead, CircuitBreaker
+
+class HedgedCallTest(SimpleTestCase):
+    """
+    Tier 123: Hedged calls race the first fallback against a primary slower than its p95.
+    """
+
+    def setUp(self):
+        cache.clear()
+        CircuitBreaker.reset_all()
+        ResilientProviderChain.latency.clear()
+        self.addCleanup(CircuitBreaker.reset_all)
+        self.addCleanup(ResilientProviderChain.latency.clear)
+        patcher = mock.patch('tenants.infrastructure.hub.InfrastructureTelemetryBridge.record')
+        self.record = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tenant = Tenant(name="Acme Corp", slug="acme")
+
+    @override_settings(TENANT_HEDGE_MIN_SAMPLES=5)
+    def test_hedge_fires_after_observed_p95(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        slow, fast = mock.Mock(), mock.Mock()
+        slow.send_email.side_effect = lambda *args: release.wait(5) and "slow"
+        fast.send_email.return_value = "fast"
+        for _ in range(5):
+            ResilientProviderChain.latency.observe(("EMAIL", "send_email"), 1)
+
+        proxy = ResilientProviderProxy(self.tenant, "EMAIL", slow, fallbacks=[("ses", fast)], hedge=["send_email"])
+        before = ResilientProviderChain.hedges.value(provider="EMAIL", winner="EMAIL/ses")
+        self.assertEqual(proxy.send_email("to@example.com"), "fast")
+        self.assertEqual(ResilientProviderChain.hedges.value(provider="EMAIL", winner="EMAIL/ses"), before + 1)
+
+    def _prime_hedging(self, latency_ms=1):
+        for _ in range(5):
+            ResilientProviderChain.latency.observe(("EMAIL", "send_email"), latency_ms)
+        Bulkhead.reset_all()
+        self.addCleanup(Bulkhead.reset_all)
+
+    @override_settings(TENANT_HEDGE_MIN_SAMPLES=5)
+    def test_abandoned_hedge_call_keeps_its_bulkhead_slot(self):
+        self._prime_hedging()
+        release, finished = threading.Event(), threading.Event()
+        self.addCleanup(release.set)
+        slow, fast = mock.Mock(), mock.Mock()
+        slow.send_email.side_effect = lambda *args: (release.wait(5), finished.set())
+        fast.send_email.return_value = "fast"
+        proxy = ResilientProviderProxy(self.tenant, "EMAIL", slow, fallbacks=[("ses", fast)], hedge=["send_email"])
+
+        self.assertEqual(proxy.send_email("to@example.com"), "fast")
+        bulkhead = ResilientProviderProxy.bulkhead_for(self.tenant, "EMAIL")
+        # Slots are handed back by done-callbacks, which may trail the result slightly
+        self.assertEqual(self._settle(bulkhead, 1), 1)
+        release.set()
+        self.assertTrue(finished.wait(2))
+        self.assertEqual(self._settle(bulkhead, 0), 0)
+
+    def _settle(self, bulkhead, expected):
+        for _ in range(200):
+            if bulkhead.in_flight == expected:
+                break
+            time.sleep(0.01)
+        return bulkhead.in_flight
+
+    @override_settings(
+        TENANT_HEDGE_MIN_SAMPLES=5,
+        TENANT_RETRY_POLICIES={"send_email": {"max_attempts": 1, "deadline_ms": 100}},
+    )
+    def test_hedged_wait_is_bounded_by_the_deadline(self):
+        self._prime_hedging()
+        release = threading.Event()
+        self.addCleanup(release.set)
+        primary, backup = mock.Mock(), mock.Mock()
+        primary.send_email.side_effect = lambda *args: release.wait(5)
+        backup.send_email.side_effect = lambda *args: release.wait(5)
+        proxy = ResilientProviderProxy(self.tenant, "EMAIL", primary, fallbacks=[("ses", backup)], hedge=["send_email"])
+
+        started = time.monotonic()
+        self.assertEqual(proxy.send_email("to@example.com"), "DEGRADED_MODE")
+        self.assertLess(time.monotonic() - started, 2)
+
+    @override_settings(TENANT_HEDGE_MIN_SAMPLES=5)
+    def test_saturated_hedge_pool_runs_the_chain_inline(self):
+        self._prime_hedging()
+        busy = threading.BoundedSemaphore(1)
+        busy.acquire()
+        callers = []
+        provider, backup = mock.Mock(), mock.Mock()
+        provider.send_email.side_effect = lambda *args: callers.append(threading.current_thread()) or "sent"
+        proxy = ResilientProviderProxy(self.tenant, "EMAIL", provider, fallbacks=[("ses", backup)], hedge=["send_email"])
+
+        with mock.patch.object(ResilientProviderChain, '_hedge_executor', return_value=(mock.Mock(), busy)):
+            self.assertEqual(proxy.send_email("to@example.com"), "sent")
+        self.assertEqual(callers, [threading.current_thread()])
+        backup.send_email.assert_not_called()
+
+    @override_settings(TENANT_HEDGE_MIN_SAMPLES=5)
+    def test_hedge_workers_close_their_connections(self):
+        provider, backup = mock.Mock(), mock.Mock()
+        provider.send_email.return_value = "sent"
+        for _ in range(5):
+            ResilientProviderChain.latency.observe(("EMAIL", "send_email"), 1000)
+
+        proxy = ResilientProviderProxy(self.tenant, "EMAIL", provider, fallbacks=[("ses", backup)], hedge=["send_email"])
+        with mock.patch('tenants.infrastructure.hub.close_old_connections') as close:
+            self.assertEqual(proxy.send_email("to@example.com"), "sent")
+        # Once before and once after the call on the worker thread
+        self.assertEqual(close.call_count, 2)
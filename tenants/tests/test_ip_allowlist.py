@@ -0,0 +1,36 @@
+from django.test import SimpleTestCase
+from tenants.infrastructure.utils.security import IPAllowlist
+
+class IPAllowlistTest(SimpleTestCase):
+    """
+    Tier 104: CIDR-aware allowlist matching.
+    """
+
+    def test_exact_addresses_still_match(self):
+        allowlist = IPAllowlist(["203.0.113.7"])
+        self.assertIn("203.0.113.7", allowlist)
+        self.assertNotIn("203.0.113.8", allowlist)
+
+    def test_ipv4_and_ipv6_cidr_blocks(self):
+        allowlist = IPAllowlist(["10.0.0.0/8", "192.168.1.0/24", "2001:db8::/32"])
+        self.assertIn("10.255.1.2", allowlist)
+        self.assertIn("192.168.1.200", allowlist)
+        self.assertNotIn("192.168.2.1", allowlist)
+        self.assertIn("2001:db8:abcd::1", allowlist)
+        self.assertNotIn("2001:db9::1", allowlist)
+
+    def test_overlapping_and_adjacent_ranges_are_merged(self):
+        allowlist = IPAllowlist(["10.0.0.0/25", "10.0.0.128/25", "10.0.0.64/26"])
+        self.assertEqual(len(allowlist._starts[4]), 1)
+        self.assertIn("10.0.0.255", allowlist)
+        self.assertNotIn("10.0.1.0", allowlist)
+
+    def test_ipv4_mapped_ipv6_client(self):
+        self.assertIn("::ffff:172.16.0.5", IPAllowlist(["172.16.0.0/12"]))
+
+    def test_invalid_entries_never_fail_open(self):
+        allowlist = IPAllowlist(["not-an-ip"])
+        self.assertTrue(allowlist)
+        self.assertNotIn("1.2.3.4", allowlist)
+        self.assertNotIn("garbage", allowlist)
+        self.assertFalse(IPAllowlist([]))
@@ -0,0 +1,56 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+from tenants.api.views.views_telemetry import TelemetryViewSet
+from tenants.domain.models import Tenant
+from tenants.infrastructure.utils.telemetry import (
+    InfrastructureTelemetryBridge, LatencyHistogram, TelemetryRollupWriter
+)
+
+class LatencyPercentileTest(TestCase):
+    """
+    Tier 122: Percentiles come from merged log-linear rollup histograms.
+    """
+
+    def setUp(self):
+        self.tenant = Tenant.objects.create(name="Acme Corp", slug="acme")
+        self.user = get_user_model().objects.create_user(username="ops", password="pw")
+        for status, latency in (("SUCCESS", 3), ("SUCCESS", 40), ("FAILURE", 900), ("SUCCESS", None)):
+            InfrastructureTelemetryBridge.record(self.tenant, "SEARCH", "search", status, latency_ms=latency)
+
+    def _get(self, action, **params):
+        request = APIRequestFactory().get(f"/api/v1/telemetry/{action}/", params)
+        force_authenticate(request, user=self.user)
+        return TelemetryViewSet.as_view({'get': action})(request)
+
+    def test_percentiles_merge_rollup_histograms(self):
+        response = self._get('percentiles')
+        self.assertEqual(len(response.data), 1)
+        row = response.data[0]
+        self.assertEqual((row['provider'], row['action'], row['count'], row['error_count']), ("SEARCH", "search", 4, 1))
+        self.assertEqual(row['error_rate'], 0.25)
+        # 3 latencies: 3ms, 40ms, 900ms -> p50 in (38, 40], p99 in (896, 960]
+        self.assertTrue(38 < row['p50'] <= 40)
+        self.assertTrue(896 < row['p99'] <= 960)
+
+    def test_quantile_interpolates_within_slot(self):
+        slot = TelemetryRollupWriter.latency_slot(100) # (96, 100]
+        one = TelemetryRollupWriter.empty_histogram()
+        one[slot] = 4
+        histogram = LatencyHistogram.merge([one, list(one)])
+        self.assertEqual(histogram[slot], 8)
+        self.assertEqual(LatencyHistogram.quantile(histogram, 0.5), 98.0) # Midway through (96, 100]
+        self.assertIsNone(LatencyHistogram.quantile(TelemetryRollupWriter.empty_histogram(), 0.5))
+
+    def test_quantiles_stay_within_a_few_percent(self):
+        import random
+        rng = random.Random(7)
+        samples = sorted(int(rng.lognormvariate(5, 1.2)) + 1 for _ in range(20000))
+        histogram = TelemetryRollupWriter.empty_histogram()
+        for latency in samples:
+            histogram[TelemetryRollupWriter.latency_slot(latency)] += 1
+
+        for q in (0.5, 0.95, 0.99):
+            exact = samples[int(q * len(samples)) - 1]
+            estimate = LatencyHistogram.quantile(histogram, q)
+            self.assertLess(abs(estimate - exact) / exact, 0.05, q)
@@ -0,0 +1,31 @@
+from django.test import SimpleTestCase
+from tenants.infrastructure.metrics import MetricsRegistry
+
+class MetricsRegistryTest(SimpleTestCase):
+    """
+    Tier 110: Metrics render in the Prometheus text exposition format.
+    """
+
+    def test_render_counter_and_histogram(self):
+        registry = MetricsRegistry()
+        hits = registry.counter('cache_hits_total', 'Cache hits.', labelnames=('tier',))
+        latency = registry.histogram('stage_seconds', 'Stage latency.', labelnames=('stage',), buckets=(0.1, 1.0))
+
+        hits.inc(tier='l1')
+        hits.inc(2, tier='l1')
+        latency.observe(0.05, stage='auth')
+        latency.observe(0.5, stage='auth')
+
+        text = registry.render()
+        self.assertIn('# TYPE cache_hits_total counter', text)
+        self.assertIn('cache_hits_total{tier="l1"} 3', text)
+        self.assertIn('stage_seconds_bucket{stage="auth",le="0.1"} 1', text)
+        self.assertIn('stage_seconds_bucket{stage="auth",le="+Inf"} 2', text)
+        self.assertIn('stage_seconds_count{stage="auth"} 2', text)
+        self.assertIs(registry.counter('cache_hits_total', 'Cache hits.', labelnames=('tier',)), hits)
+
+    def test_conflicting_registration_is_rejected(self):
+        registry = MetricsRegistry()
+        registry.counter('requests_total', 'Requests.')
+        with self.assertRaises(ValueError):
+            registry.gauge('requests_total', 'Requests.')
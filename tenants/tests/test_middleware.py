@@ -0,0 +1,391 @@
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import TestCase, RequestFactory, override_settings
+from tenants.domain.models import Tenant, Domain
+from tenants.infrastructure.middleware.middleware import TenantPerformanceMiddleware
+from tenants.infrastructure.profile import TenantRequestProfile
+from tenants.infrastructure.security.membership import MembershipCache
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class TenantRequestProfileTest(TestCase):
+    """
+    Tier 102: The tenant middlewares read a precompiled profile instead of the DB.
+    """
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.tenant = Tenant.objects.create(
+            name="Acme Corp", slug="acme",
+            security_config={'content_security_policy': "default-src 'self'"}
+        )
+        Domain.objects.create(domain="acme.example.com", tenant=self.tenant, is_primary=True)
+        Domain.objects.create(domain="www.acme.example.com", tenant=self.tenant)
+        self.tenant.refresh_from_db()
+        self.middleware = TenantPerformanceMiddleware(lambda request: HttpResponse("ok"))
+
+    def _request(self, host):
+        request = self.factory.get("/dashboard/", HTTP_HOST=host)
+        request.tenant = self.tenant
+        return request
+
+    def test_profile_is_built_once_per_version(self):
+        profile = TenantRequestProfile.for_tenant(self.tenant)
+        self.assertEqual(profile.primary_domain, "acme.example.com")
+        with self.assertNumQueries(0):
+            self.assertIs(TenantRequestProfile.for_tenant(self.tenant), profile)
+
+    def test_canonical_redirect_and_csp_without_queries(self):
+        TenantRequestProfile.for_tenant(self.tenant)
+        with self.assertNumQueries(0):
+            redirect = self.middleware(self._request("www.acme.example.com"))
+            response = self.middleware(self._request("acme.example.com"))
+
+        self.assertEqual(redirect.status_code, 301)
+        self.assertEqual(redirect['Location'], "http://acme.example.com/dashboard/")
+        self.assertEqual(response['Content-Security-Policy'], "default-src 'self'")
+
+    def test_domain_change_rebuilds_profile(self):
+        TenantRequestProfile.for_tenant(self.tenant)
+        Domain.objects.filter(tenant=self.tenant).update(is_primary=False)
+        Domain.objects.get(domain="www.acme.example.com").save()
+        self.assertIsNone(TenantRequestProfile.for_tenant(self.tenant).primary_domain)
+
+class MembershipCacheTest(TestCase):
+    """
+    Tier 103: The membership guard answers from cache on the steady-state path.
+    """
+
+    def setUp(self):
+        from django.contrib.auth import get_user_model
+        from tenants.domain.models import Membership
+        self.tenant = Tenant.objects.create(name="Acme Corp", slug="acme")
+        self.user = get_user_model().objects.create_user(
+            username="member", email="member@acme.example.com", password="secret"
+        )
+        # bulk_create keeps the seat-billing signal out of the fixture
+        Membership.objects.bulk_create([Membership(user=self.user, tenant=self.tenant)])
+
+    def test_verdict_is_served_from_cache(self):
+        self.assertTrue(MembershipCache.is_member(self.user, self.tenant))
+        with self.assertNumQueries(0):
+            self.assertTrue(MembershipCache.is_member(self.user, self.tenant))
+
+    def test_invalidation_reflects_revoked_membership(self):
+        from tenants.domain.models import Membership
+        self.assertTrue(MembershipCache.is_member(self.user, self.tenant))
+        Membership.objects.filter(user=self.user).update(is_active=False)
+        MembershipCache.invalidate(self.tenant.id)
+        self.assertFalse(MembershipCache.is_member(self.user, self.tenant))
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class MembershipGuardStackTest(TestCase):
+    """
+    Tier 103: The membership guard runs on real requests through settings.MIDDLEWARE.
+    """
+
+    def setUp(self):
+        from django.contrib.auth import get_user_model
+        from django.core.cache import cache
+        from tenants.domain.models import Membership
+        cache.clear()
+        self.tenant = Tenant.objects.create(name="Acme Corp", slug="acme")
+        Domain.objects.create(domain="acme.example.com", tenant=self.tenant, is_primary=True)
+        User = get_user_model()
+        self.member = User.objects.create_user(username="member", email="member@acme.example.com", password="secret")
+        self.outsider = User.objects.create_user(username="outsider", email="out@other.example.com", password="secret")
+        Membership.objects.bulk_create([Membership(user=self.member, tenant=self.tenant)])
+
+    def test_outsider_is_denied(self):
+        self.client.force_login(self.outsider)
+        response = self.client.get("/dashboard/", HTTP_HOST="acme.example.com", HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()['error']['code'], 'DENIED')
+
+    def test_member_is_admitted_through_the_cache(self):
+        from unittest import mock
+        self.client.force_login(self.member)
+        with mock.patch.object(MembershipCache, 'is_member', wraps=MembershipCache.is_member) as is_member:
+            response = self.client.get("/dashboard/", HTTP_HOST="acme.example.com", HTTP_ACCEPT="application/json")
+        self.assertNotEqual(response.status_code, 403)
+        is_member.assert_called_once()
+
+    def test_guard_without_authentication_middleware_fails_closed(self):
+        from django.core.exceptions import ImproperlyConfigured
+        from tenants.infrastructure.middleware.middleware import TenantSecurityMiddleware
+        request = RequestFactory().get("/dashboard/", HTTP_HOST="acme.example.com")
+        request.tenant = self.tenant
+        with self.assertRaises(ImproperlyConfigured):
+            TenantSecurityMiddleware(lambda r: HttpResponse("ok"))(request)
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class AsyncMiddlewareStackTest(TestCase):
+    """
+    Tier 105: The tenant middleware stack runs natively under ASGI.
+    """
+
+    def setUp(self):
+        self.tenant = Tenant.objects.create(
+            name="Acme Corp", slug="acme", timezone="Europe/Berlin", locale="de",
+            security_config={'content_security_policy': "default-src 'self'"}
+        )
+        Domain.objects.create(domain="acme.example.com", tenant=self.tenant, is_primary=True)
+
+    def _build_stack(self, view):
+        from tenants.infrastructure.middleware.middleware import TenantResolutionMiddleware, TenantSecurityMiddleware
+        from tenants.infrastructure.middleware.branding import BrandingMiddleware
+        from tenants.infrastructure.middleware.middleware_resilience import ResourceGovernorMiddleware
+        from tenants.infrastructure.middleware.middleware_user import UserContextMiddleware
+
+        handler = view
+        for middleware in reversed([
+            TenantResolutionMiddleware, TenantSecurityMiddleware, TenantPerformanceMiddleware,
+            BrandingMiddleware, ResourceGovernorMiddleware, UserContextMiddleware,
+        ]):
+            handler = middleware(handler)
+        return handler
+
+    async def test_async_stack_carries_tenant_context(self):
+        from asgiref.sync import iscoroutinefunction
+        from django.utils import timezone, translation
+        from tenants.infrastructure.utils.context import get_current_tenant
+
+        seen = {}
+
+        async def view(request):
+            seen['tenant'] = get_current_tenant()
+            seen['timezone'] = timezone.get_current_timezone_name()
+            seen['language'] = translation.get_language()
+            return HttpResponse("ok")
+
+        stack = self._build_stack(view)
+        self.assertTrue(iscoroutinefunction(stack))
+
+        request = RequestFactory().get("/dashboard/", HTTP_HOST="acme.example.com")
+        request.user = AnonymousUser()
+        response = await stack(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Security-Policy'], "default-src 'self'")
+        self.assertEqual(seen['tenant'].id, self.tenant.id)
+        self.assertEqual(seen['timezone'], "Europe/Berlin")
+        self.assertEqual(seen['language'], "de")
+        self.assertIsNone(get_current_tenant())
+
+    async def test_schema_is_recorded_on_the_executor_connection(self):
+        from unittest import mock
+        from asgiref.sync import sync_to_async
+        from django.db import connection
+        from tenants.infrastructure.middleware.middleware import TenantResolutionMiddleware
+
+        await sync_to_async(Tenant.objects.filter(pk=self.tenant.pk).update)(isolation_mode='PHYSICAL')
+        self.addCleanup(lambda: connection.__dict__.pop('tenant_schema', None))
+
+        def record(schema_name):
+            # What PostgresSchemaManager.set_schema does; the execute wrapper reads it per query
+            connection.tenant_schema = schema_name
+
+        middleware = TenantResolutionMiddleware(self._async_view)
+        request = RequestFactory().get("/dashboard/", HTTP_HOST="acme.example.com")
+        with mock.patch('tenants.infrastructure.database.schemas.SovereignSchemaManager.set_active_schema', side_effect=record):
+            await middleware.aprocess_request(request)
+        middleware.teardown(request)
+
+        executor_schema = await sync_to_async(lambda: getattr(connection, 'tenant_schema', None))()
+        self.assertEqual(executor_schema, 'acme')
+
+    @staticmethod
+    async def _async_view(request):
+        return HttpResponse("ok")
+
+@override_settings(TENANT_GOVERNOR_SOFT_LIMIT=2, TENANT_GOVERNOR_HARD_LIMIT=4, TENANT_GOVERNOR_RECOVERY_RATE=1)
+class ResourceGovernorTest(TestCase):
+    """
+    Tier 106: The governor sheds load with 429s instead of sleeping in the worker.
+    """
+
+    def setUp(self):
+        from django.core.cache import cache
+        from tenants.infrastructure.middleware.middleware_resilience import ResourceGovernorMiddleware
+        from tenants.infrastructure.utils.context import set_current_tenant, reset_current_tenant
+
+        cache.clear()
+        self.tenant = Tenant.objects.create(name="Acme Corp", slug="acme")
+        token = set_current_tenant(self.tenant)
+        self.addCleanup(reset_current_tenant, token)
+        self.middleware = ResourceGovernorMiddleware(lambda request: HttpResponse("ok"))
+
+    def _call(self):
+        request = RequestFactory().get("/dashboard/")
+        request.tenant = self.tenant
+        return self.middleware(request)
+
+    def test_soft_limit_returns_retry_after_and_hard_limit_quarantines(self):
+        from django.core.cache import cache
+
+        first = self._call()
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first['X-Governor-Decision'], 'allow')
+        self.assertEqual(first['X-Governor-Rate'], '1')
+        self._call()
+
+        throttled = self._call()
+        self.assertEqual(throttled.status_code, 429)
+        self.assertEqual(throttled['X-Governor-Decision'], 'throttle')
+        self.assertGreaterEqual(int(throttled['Retry-After']), 1)
+
+        self._call()
+        quarantined = self._call()
+        self.assertEqual(quarantined.status_code, 429)
+        self.assertEqual(quarantined['X-Governor-Decision'], 'quarantine')
+        self.assertTrue(cache.get(f"auto_quarantine_{self.tenant.id}"))
+
+    def test_sliding_window_weights_previous_bucket(self):
+        from tenants.infrastructure.utils.resilience import SlidingWindowCounter
+
+        counter = SlidingWindowCounter("test_window", window=60)
+        for _ in range(10):
+            counter.hit("scope", now=600.0)
+        # Halfway through the next window, half of the previous bucket still counts
+        self.assertEqual(counter.hit("scope", now=690.0), 1 + 10 * 0.5)
+
+    def test_async_hits_use_atomic_incr(self):
+        import asyncio
+        from django.core.cache import cache
+        from tenants.infrastructure.utils.resilience import SlidingWindowCounter
+
+        counter = SlidingWindowCounter("test_async_window", window=60)
+
+        async def burst():
+            return await asyncio.gather(*(counter.ahit("scope", now=600.0) for _ in range(20)))
+
+        asyncio.run(burst())
+        self.assertEqual(cache.get("test_async_window:scope:10"), 20)
+
+class BrandingActivationTest(TestCase):
+    """
+    Tier 107: Branding activation is memoized and skipped for default tenants.
+    """
+
+    def _run(self, tenant):
+        from django.utils import timezone, translation
+        from tenants.infrastructure.middleware.branding import BrandingMiddleware
+
+        seen = {}
+
+        def view(request):
+            seen['timezone'] = timezone.get_current_timezone_name()
+            seen['language'] = translation.get_language()
+            return HttpResponse("ok")
+
+        request = RequestFactory().get("/")
+        request.tenant = tenant
+        BrandingMiddleware(view)(request)
+        return request, seen
+
+    def test_non_default_tenant_is_activated(self):
+        tenant = Tenant.objects.create(name="Berlin", slug="berlin", timezone="Europe/Berlin", locale="de_DE")
+        request, seen = self._run(tenant)
+        self.assertEqual(seen, {'timezone': "Europe/Berlin", 'language': "de-de"})
+        self.assertEqual(request.LANGUAGE_CODE, "de-de")
+
+    def test_default_tenant_skips_activation(self):
+        tenant = Tenant.objects.create(name="Default", slug="default-co")
+        request, seen = self._run(tenant)
+        self.assertEqual(request.LANGUAGE_CODE, "en-us")
+        self.assertFalse(getattr(request, '_branding_timezone_active', False))
+        self.assertFalse(getattr(request, '_branding_language_active', False))
+
+    def test_zone_lookup_is_memoized(self):
+        from tenants.infrastructure.middleware.branding import get_zone
+        self.assertIs(get_zone("Asia/Tokyo"), get_zone("Asia/Tokyo"))
+        self.assertIsNone(get_zone("Mars/Olympus_Mons"))
+
+class ImpersonatorCacheTest(TestCase):
+    """
+    Tier 109: Long impersonation sessions do not re-query the staff user.
+    """
+
+    def setUp(self):
+        from django.contrib.auth import get_user_model
+        from django.core.cache import cache
+        from tenants.infrastructure.middleware.middleware_impersonation import AdminImpersonationMiddleware
+        from tenants.infrastructure.utils.context import set_current_impersonator
+
+        cache.clear()
+        self.addCleanup(set_current_impersonator, None)
+        User = get_user_model()
+        self.staff = User.objects.create(username="support", email="support@example.com", is_staff=True)
+        self.target = User.objects.create(username="customer", email="customer@example.com")
+        self.middleware = AdminImpersonationMiddleware(lambda request: HttpResponse("ok"))
+
+    def _request(self):
+        request = RequestFactory().get("/dashboard/")
+        request.session = {'impersonator_id': str(self.staff.id)}
+        request.user = self.target
+        self.middleware.process_request(request)
+        return request
+
+    def test_impersonator_is_cached_until_staff_changes(self):
+        self.assertEqual(self._request().impersonator.pk, self.staff.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(self._request().is_impersonating)
+
+        self.staff.is_staff = False
+        self.staff.save()
+        request = self._request()
+        self.assertNotIn('impersonator_id', request.session)
+        self.assertFalse(hasattr(request, 'impersonator'))
+
+    def test_only_identity_fields_are_cached(self):
+        from django.core.cache import cache
+        from tenants.infrastructure.security.impersonation import ImpersonatorCache
+        self.staff.set_password("s3cret")
+        self.staff.save()
+        self._request()
+
+        cached = cache.get(ImpersonatorCache._key(self.staff.id))
+        self.assertEqual(cached, {'id': self.staff.id, 'email': "support@example.com", 'is_staff': True, 'is_superuser': False})
+        with self.assertNumQueries(0):
+            impersonator = self._request().impersonator
+        self.assertEqual((impersonator.pk, impersonator.email), (self.staff.pk, "support@example.com"))
+        self.assertIn('password', impersonator.get_deferred_fields())
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class TenantPipelineTest(TestCase):
+    """
+    Tier 110: The fused pipeline runs every stage and reports per-stage timings.
+    """
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        self.tenant = Tenant.objects.create(
+            name="Acme Corp", slug="acme",
+            security_config={'content_security_policy': "default-src 'self'"}
+        )
+        Domain.objects.create(domain="acme.example.com", tenant=self.tenant, is_primary=True)
+
+    def test_stages_are_timed_and_observed(self):
+        from tenants.infrastructure.middleware.pipeline import TenantPipelineMiddleware
+        from tenants.infrastructure.utils.context import get_current_tenant
+
+        seen = {}
+
+        def view(request):
+            seen['tenant'] = get_current_tenant()
+            return HttpResponse("ok")
+
+        pipeline = TenantPipelineMiddleware(view)
+        before = pipeline.stage_seconds.count(stage='governor')
+        request = RequestFactory().get("/dashboard/", HTTP_HOST="acme.example.com")
+        request.user = AnonymousUser()
+        response = pipeline(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(seen['tenant'].id, self.tenant.id)
+        self.assertEqual(response['Content-Security-Policy'], "default-src 'self'")
+        self.assertEqual(response['X-Governor-Decision'], 'allow')
+        stages = [entry.split(';')[0] for entry in response['Server-Timing'].split(', ')]
+        self.assertEqual(stages, ['tenant-resolution', 'tenant-security', 'tenant-canonical', 'tenant-branding', 'tenant-governor'])
+        self.assertEqual(pipeline.stage_seconds.count(stage='governor'), before + 1)
+        self.assertIsNone(get_current_tenant())
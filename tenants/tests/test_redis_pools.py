@@ -0,0 +1,32 @@
+from django.test import SimpleTestCase
+from tenants.infrastructure.adapters.performance.pools import RedisPoolRegistry
+from tenants.infrastructure.adapters.performance.providers import RedisClusterProvider
+
+class RedisPoolRegistryTest(SimpleTestCase):
+    """
+    Tier 111: Redis clients share one pool per URL per process.
+    """
+
+    def setUp(self):
+        self.addCleanup(RedisPoolRegistry.disconnect_all)
+
+    def test_clients_share_a_pool_per_url(self):
+        provider = RedisClusterProvider({'redis_url': 'redis://cache-a:6379/0'})
+        first, second = provider._get_client(), provider._get_client()
+        self.assertIs(first.connection_pool, second.connection_pool)
+        self.assertIsNot(
+            first.connection_pool,
+            RedisPoolRegistry.get_pool('redis://cache-b:6379/0')
+        )
+        self.assertEqual(first.connection_pool.max_connections, 50)
+
+    def test_pool_waits_for_a_free_connection_at_the_cap(self):
+        import redis
+        pool = RedisPoolRegistry.get_pool('redis://cache-a:6379/0')
+        self.assertIsInstance(pool, redis.BlockingConnectionPool)
+        self.assertEqual(pool.timeout, 2)
+
+    def test_forked_child_gets_fresh_pools(self):
+        parent_pool = RedisPoolRegistry.get_pool('redis://cache-a:6379/0')
+        RedisPoolRegistry._pid = -1
+        self.assertIsNot(RedisPoolRegistry.get_pool('redis://cache-a:6379/0'), parent_pool)
@@ -0,0 +1,89 @@
+import threading
+import time
+from django.test import TestCase
+from tenants.domain.models import Tenant, Domain
+from tenants.infrastructure.cache import SingleFlight
+from tenants.infrastructure.resolution import TenantResolver
+
+class TenantResolutionCacheTest(TestCase):
+    """
+    Tier 101: Verifies the L1/L2 host-to-tenant resolution path.
+    """
+
+    def setUp(self):
+        self.tenant = Tenant.objects.create(name="Acme Corp", slug="acme")
+        self.domain = Domain.objects.create(domain="acme.example.com", tenant=self.tenant, is_primary=True)
+
+    def test_warm_resolution_skips_database(self):
+        self.assertEqual(TenantResolver.resolve("acme.example.com").id, self.tenant.id)
+        with self.assertNumQueries(0):
+            self.assertEqual(TenantResolver.resolve("acme.example.com").id, self.tenant.id)
+
+    def test_unknown_host_is_negatively_cached(self):
+        self.assertIsNone(TenantResolver.resolve("unknown.example.com"))
+        with self.assertNumQueries(0):
+            self.assertIsNone(TenantResolver.resolve("unknown.example.com"))
+
+    def test_domain_change_invalidates_resolution(self):
+        TenantResolver.resolve("acme.example.com")
+        self.domain.status = 'FAILED'
+        self.domain.save()
+        self.assertIsNone(TenantResolver.resolve("acme.example.com"))
+
+    def test_resolved_tenant_is_isolated_per_request(self):
+        first = TenantResolver.resolve("acme.example.com")
+        first.name = "Mutated"
+        self.assertEqual(TenantResolver.resolve("acme.example.com").name, "Acme Corp")
+
+class SingleFlightTest(TestCase):
+
+    def test_concurrent_callers_share_one_execution(self):
+        flights = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            release.wait(timeout=5)
+            return "value"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flights.do("key", loader))) for _ in range(5)]
+        for t in threads:
+            t.start()
+        # Give every follower time to join the in-flight call before releasing the leader
+        time.sleep(0.2)
+        release.set()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(results, ["value"] * 5)
+        self.assertEqual(len(calls), 1)
+
+class ProviderInstanceCacheTest(TestCase):
+    """
+    Tier 112: Adapter factories reuse provider instances until the config changes.
+    """
+
+    def setUp(self):
+        from tenants.infrastructure.registry import ProviderInstanceCache
+        ProviderInstanceCache.clear()
+        self.tenant = Tenant.objects.create(name="Acme Corp", slug="acme")
+
+    def test_provider_is_reused_until_config_changes(self):
+        from tenants.infrastructure.adapters.performance.factory import CacheFactory
+        from tenants.infrastructure.adapters.search.factory import SearchFactory
+
+        provider = CacheFactory.get_provider(self.tenant)
+        self.assertIs(CacheFactory.get_provider(self.tenant), provider)
+        self.assertIs(SearchFactory.get_provider(self.tenant), SearchFactory.get_provider(self.tenant))
+
+        self.tenant.config = {'cache': {'provider': 'redis_cluster', 'redis_url': 'redis://cache-a:6379/0'}}
+        self.assertEqual(type(CacheFactory.get_provider(self.tenant)).__name__, 'RedisClusterProvider')
+
+    def test_tenant_save_evicts_instances(self):
+        from tenants.infrastructure.adapters.control.factory import ControlFactory
+
+        provider = ControlFactory.get_provider(self.tenant)
+        self.tenant.save()
+        self.assertIsNot(ControlFactory.get_provider(self.tenant), provider)
@@ -0,0 +1,73 @@
+import time
+from unittest import mock
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from tenants.domain.models import Tenant
+from tenants.infrastructure.hub import ResilientProviderProxy
+from tenants.infrastructure.utils.context import set_current_deadline, reset_current_deadline
+from tenants.infrastructure.utils.resilience import CircuitBreaker, RetryPolicy
+
+class RetryPolicyTest(SimpleTestCase):
+    """
+    Tier 124: Retries with full-jitter backoff, retryable classification and deadlines.
+    """
+
+    def setUp(self):
+        cache.clear()
+        CircuitBreaker.reset_all()
+        self.addCleanup(CircuitBreaker.reset_all)
+        patcher = mock.patch('tenants.infrastructure.hub.InfrastructureTelemetryBridge.record')
+        self.record = patcher.start()
+        self.addCleanup(patcher.stop)
+        sleeper = mock.patch('tenants.infrastructure.hub.time.sleep')
+        self.sleep = sleeper.start()
+        self.addCleanup(sleeper.stop)
+        self.tenant = Tenant(name="Acme Corp", slug="acme")
+
+    def test_backoff_is_capped_full_jitter(self):
+        policy = RetryPolicy(max_attempts=5, base_delay_ms=100, max_delay_ms=300)
+        with mock.patch('tenants.infrastructure.utils.resilience.random.uniform', side_effect=lambda a, b: b):
+            self.assertEqual([policy.backoff(n) for n in (1, 2, 3)], [0.1, 0.2, 0.3])
+
+    @override_settings(TENANT_RETRY_POLICIES={"EMAIL.send_email": {"max_attempts": 3, "retry_on": ["builtins.ConnectionError"]}})
+    def test_retryable_errors_are_retried_and_recorded(self):
+        provider = mock.Mock()
+        provider.send_email.side_effect = [ConnectionError("reset"), ConnectionError("reset"), "sent"]
+        proxy = ResilientProviderProxy(self.tenant, "EMAIL", provider)
+
+        self.assertEqual(proxy.send_email("to@example.com"), "sent")
+        self.assertEqual(provider.send_email.call_count, 3)
+        self.assertEqual(self.sleep.call_count, 2)
+        attempts = [(c.args[3], c.kwargs['metadata'].get('attempt', 1)) for c in self.record.call_args_list]
+        self.assertEqual(attempts, [("FAILURE", 1), ("FAILURE", 2), ("SUCCESS", 3)])
+
+    def test_sends_are_not_retried_by_default(self):
+        provider = mock.Mock()
+        provider.send_email.side_effect = ConnectionError("reset")
+        provider.search.side_effect = [ConnectionError("reset"), ["hit"]]
+        proxy = ResilientProviderProxy(self.tenant, "EMAIL", provider)
+
+        self.assertEqual(proxy.send_email("to@example.com"), "DEGRADED_MODE")
+        self.assertEqual(provider.send_email.call_count, 1)
+        # Idempotent actions keep the global retry budget
+        self.assertEqual(proxy.search("q"), ["hit"])
+        self.assertEqual(provider.search.call_count, 2)
+
+    @override_settings(TENANT_RETRY_MAX_ATTEMPTS=3)
+    def test_non_retryable_errors_fail_fast(self):
+        provider = mock.Mock()
+        provider.send_email.side_effect = ValueError("bad recipient")
+        proxy = ResilientProviderProxy(self.tenant, "EMAIL", provider)
+
+        self.assertEqual(proxy.send_email("nobody"), "DEGRADED_MODE")
+        self.assertEqual(provider.send_email.call_count, 1)
+
+    @override_settings(TENANT_RETRY_MAX_ATTEMPTS=3)
+    def test_expired_deadline_skips_the_call(self):
+        provider = mock.Mock()
+        proxy = ResilientProviderProxy(self.tenant, "EMAIL", provider)
+        token = set_current_deadline(time.monotonic() - 1)
+        self.addCleanup(reset_current_deadline, token)
+
+        self.assertEqual(proxy.send_email("to@example.com"), "DEGRADED_MODE")
+        provider.send_email.assert_not_called()
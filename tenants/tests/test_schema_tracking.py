@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+from django.test import SimpleTestCase
+from tenants.infrastructure.database.impl import PostgresSchemaManager
+
+class SearchPathTrackingTest(SimpleTestCase):
+    """
+    Tier 108: search_path is applied lazily and only when the schema changes.
+    """
+
+    def setUp(self):
+        self.statements = []
+        self.conn = SimpleNamespace(in_atomic_block=False)
+        PostgresSchemaManager.reset_tracking(self.conn)
+        raw = SimpleNamespace(execute=self.statements.append)
+        self.context = {'connection': self.conn, 'cursor': SimpleNamespace(cursor=raw)}
+
+    def _query(self):
+        PostgresSchemaManager._apply_search_path(
+            lambda sql, params, many, context: self.statements.append(sql),
+            "SELECT 1", None, False, self.context
+        )
+
+    def test_public_schema_never_issues_set(self):
+        self.conn.tenant_schema = 'public'
+        self._query()
+        self._query()
+        self.assertEqual(self.statements, ["SELECT 1", "SELECT 1"])
+
+    def test_set_is_issued_once_per_change(self):
+        self.conn.tenant_schema = 'acme'
+        self._query()
+        self._query()
+        self.conn.tenant_schema = 'public'
+        self._query()
+        self.assertEqual(self.statements, [
+            "SET search_path TO acme, public", "SELECT 1", "SELECT 1",
+            "SET search_path TO public, public", "SELECT 1",
+        ])
+
+    def test_set_inside_transaction_is_reapplied_after_it_ends(self):
+        self.conn.tenant_schema = 'acme'
+        self.conn.in_atomic_block = True
+        self._query()
+        self.conn.in_atomic_block = False
+        self._query()
+        self.assertEqual(self.statements.count("SET search_path TO acme, public"), 2)
+
+    def test_rolled_back_set_is_not_trusted_by_the_next_transaction(self):
+        self.conn.tenant_schema = 'acme'
+        self.conn.in_atomic_block = True
+        self._query()
+        # The transaction rolls back (undoing the SET) and a new one opens before
+        # any query runs in autocommit
+        self._query()
+        self.assertEqual(self.statements.count("SET search_path TO acme, public"), 2)
+
+    def test_path_set_in_autocommit_is_reused_inside_transactions(self):
+        self.conn.tenant_schema = 'acme'
+        self._query()
+        self.conn.in_atomic_block = True
+        self._query()
+        self.assertEqual(self.statements.count("SET search_path TO acme, public"), 1)
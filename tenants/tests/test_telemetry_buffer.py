@@ -0,0 +1,61 @@
+from datetime import timedelta
+from unittest.mock import patch
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from tenants.domain.models import Tenant
+from tenants.domain.models.models_telemetry import TelemetryEntry
+from tenants.infrastructure.utils.telemetry import InfrastructureTelemetryBridge, TelemetryBuffer
+
+class TelemetryBufferTest(TestCase):
+    """
+    Tier 120: Telemetry is batched off the request thread and shed under backpressure.
+    """
+
+    def setUp(self):
+        self.tenant = Tenant.objects.create(name="Acme Corp", slug="acme")
+        self.buffer = TelemetryBuffer(capacity=3, batch_size=2, autostart=False)
+
+    def _entry(self, action):
+        return TelemetryEntry(tenant=self.tenant, provider="SEARCH", action=action, status="SUCCESS", latency_ms=5)
+
+    def test_flush_writes_in_batches(self):
+        for action in ("search", "index_document", "delete_document"):
+            self.assertTrue(self.buffer.put(self._entry(action)))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.buffer.flush(), 3)
+        inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT INTO "tenants_telemetryentry"')]
+        self.assertEqual(len(inserts), 2)
+        self.assertEqual(len(self.buffer), 0)
+        self.assertEqual(TelemetryEntry.objects.filter(tenant=self.tenant).count(), 3)
+
+    def test_full_buffer_drops_and_counts(self):
+        before = self.buffer.dropped.value(reason='backpressure')
+        for _ in range(3):
+            self.buffer.put(self._entry("search"))
+
+        self.assertFalse(self.buffer.put(self._entry("search")))
+        self.assertEqual(len(self.buffer), 3)
+        self.assertEqual(self.buffer.dropped.value(reason='backpressure'), before + 1)
+
+    def test_tenantless_entries_are_rejected_at_put(self):
+        before = self.buffer.dropped.value(reason='no_tenant')
+        orphan = TelemetryEntry(provider="SEARCH", action="search", status="SUCCESS")
+
+        self.assertFalse(self.buffer.put(orphan))
+        self.assertTrue(self.buffer.put(self._entry("search")))
+        self.assertEqual(self.buffer.dropped.value(reason='no_tenant'), before + 1)
+        self.assertEqual(self.buffer.flush(), 1)
+
+    def test_buffered_entries_keep_their_record_time(self):
+        with override_settings(TENANT_TELEMETRY_BUFFERED=True), \
+                patch.object(InfrastructureTelemetryBridge, 'buffer', self.buffer):
+            recorded_at = timezone.now()
+            InfrastructureTelemetryBridge.record(self.tenant, "SEARCH", "search", "SUCCESS", latency_ms=5)
+            with patch('django.utils.timezone.now', return_value=recorded_at + timedelta(minutes=5)):
+                self.buffer.flush()
+
+        entry = TelemetryEntry.objects.get(tenant=self.tenant)
+        self.assertLess(entry.timestamp - recorded_at, timedelta(seconds=5))
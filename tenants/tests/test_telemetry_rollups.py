@@ -0,0 +1,84 @@
+from datetime import timedelta
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+from tenants.api.views.views_telemetry import TelemetryViewSet
+from tenants.domain.models import Tenant
+from tenants.domain.models.models_telemetry import TelemetryEntry, TelemetryRollup
+from tenants.infrastructure.utils.telemetry import InfrastructureTelemetryBridge, TelemetryRollupWriter
+
+class TelemetryRollupTest(TestCase):
+    """
+    Tier 121: The writer maintains per-minute rollups and the dashboards read only those.
+    """
+
+    def setUp(self):
+        self.tenant = Tenant.objects.create(name="Acme Corp", slug="acme")
+        self.user = get_user_model().objects.create_user(username="ops", password="pw")
+        for status, latency in (("SUCCESS", 3), ("SUCCESS", 40), ("FAILURE", 900), ("SUCCESS", None)):
+            InfrastructureTelemetryBridge.record(self.tenant, "SEARCH", "search", status, latency_ms=latency)
+
+    def _get(self, action, **params):
+        request = APIRequestFactory().get(f"/api/v1/telemetry/{action}/", params)
+        force_authenticate(request, user=self.user)
+        return TelemetryViewSet.as_view({'get': action})(request)
+
+    def test_writer_folds_entries_into_minute_rollups(self):
+        success = TelemetryRollup.objects.get(tenant=self.tenant, status="SUCCESS")
+        self.assertEqual((success.count, success.error_count, success.latency_count), (3, 0, 2))
+        self.assertEqual(success.latency_sum_ms, 43)
+        self.assertEqual(success.latency_histogram[2], 1) # 3ms -> (2, 3]
+        self.assertEqual(success.latency_histogram[TelemetryRollup.LATENCY_BOUNDS.index(40)], 1) # 40ms -> (38, 40]
+        self.assertEqual(success.bucket.second, 0)
+
+        failure = TelemetryRollup.objects.get(tenant=self.tenant, status="FAILURE")
+        self.assertEqual((failure.count, failure.error_count), (1, 1))
+
+    def test_aggregate_and_timeseries_read_rollups(self):
+        with self.assertNumQueries(1):
+            response = self._get('aggregate')
+        stats = {row['status']: row for row in response.data}
+        self.assertEqual(stats['SUCCESS']['count'], 3)
+        self.assertEqual(stats['SUCCESS']['avg_latency'], 21.5)
+        self.assertEqual(stats['FAILURE']['error_count'], 1)
+
+        response = self._get('timeseries', provider="SEARCH")
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual((response.data[0]['count'], response.data[0]['error_count']), (4, 1))
+
+        response = self._get('timeseries', start="not-a-date")
+        self.assertEqual(response.status_code, 400)
+
+    def test_migration_backfills_recent_entries(self):
+        from importlib import import_module
+        from django.apps import apps
+        from types import SimpleNamespace
+        migration = import_module('tenants.migrations.0017_backfill_telemetryrollup')
+
+        TelemetryRollup.unscoped_objects.all().delete()
+        TelemetryEntry.unscoped_objects.create(
+            tenant=self.tenant, provider="SEARCH", action="search", status="SUCCESS",
+            timestamp=timezone.now() - timedelta(days=40),
+        )
+        with patch.object(migration, 'BACKFILL_BATCH', 3):
+            migration.backfill_rollups(apps, SimpleNamespace(connection=connection))
+
+        rollups = TelemetryRollup.unscoped_objects.filter(tenant=self.tenant)
+        self.assertEqual(sum(r.count for r in rollups), 4)
+        self.assertEqual(sum(r.error_count for r in rollups), 1)
+        self.assertEqual(sum(r.latency_count for r in rollups), 3)
+
+    def test_calls_that_never_ran_stay_out_of_the_histogram(self):
+        entries = [
+            TelemetryEntry(tenant=self.tenant, provider="SEARCH", action="search", status="CIRCUIT_OPEN",
+                           latency_ms=0, timestamp=timezone.now()),
+            TelemetryEntry(tenant=self.tenant, provider="SEARCH", action="search", status="FAILURE",
+                           latency_ms=None, timestamp=timezone.now()),
+        ]
+        deltas = TelemetryRollupWriter.fold(entries)
+        self.assertEqual(sum(delta['count'] for delta in deltas.values()), 2)
+        self.assertEqual(sum(delta['latency_count'] for delta in deltas.values()), 0)
+        self.assertEqual(sum(sum(delta['latency_histogram']) for delta in deltas.values()), 0)
@@ -0,0 +1,239 @@
+import time
+from django.test import TestCase, override_settings
+from tenants.domain.models import Tenant
+
+class TenantCacheBatchTest(TestCase):
+    """
+    Tier 113: Multi-key TenantCache operations keep the tenant prefix internal.
+    """
+
+    def setUp(self):
+        from tenants.infrastructure.utils.context import set_current_tenant, reset_current_tenant
+        self.tenant = Tenant.objects.create(name="Acme Corp", slug="acme")
+        token = set_current_tenant(self.tenant)
+        self.addCleanup(reset_current_tenant, token)
+
+    def test_many_roundtrip_uses_unprefixed_keys(self):
+        from django.core.cache import cache
+        from tenants.infrastructure.cache import TenantCache
+
+        TenantCache.set_many({'a': 1, 'b': 2})
+        self.assertEqual(TenantCache.get_many(['a', 'b', 'missing']), {'a': 1, 'b': 2})
+        from tenants.infrastructure.codecs import CacheCodec
+        provider = TenantCache._get_provider()
+        full_key = f"tenant:{self.tenant.id}:a"
+        self.assertEqual(CacheCodec.decode(full_key, cache.get(provider._key(full_key))), 1)
+
+        TenantCache.delete_many(['a'])
+        self.assertEqual(TenantCache.get_many(['a', 'b']), {'b': 2})
+
+class TenantCacheGetOrSetTest(TestCase):
+    """
+    Tier 114: get_or_set writes to the tenant provider and never stampedes.
+    """
+
+    def setUp(self):
+        from django.core.cache import cache
+        from tenants.infrastructure.utils.context import set_current_tenant, reset_current_tenant
+        cache.clear()
+        self.tenant = Tenant.objects.create(name="Acme Corp", slug="acme")
+        token = set_current_tenant(self.tenant)
+        self.addCleanup(reset_current_tenant, token)
+        self.calls = 0
+
+    def _compute(self):
+        self.calls += 1
+        return f"value-{self.calls}"
+
+    def test_value_is_cached_in_tenant_provider(self):
+        from tenants.infrastructure.cache import TenantCache
+
+        self.assertEqual(TenantCache.get_or_set('report', self._compute), "value-1")
+        self.assertEqual(TenantCache.get_or_set('report', self._compute), "value-1")
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(TenantCache.get('report'), "value-1")
+
+    def test_stale_value_is_served_while_another_caller_refreshes(self):
+        from tenants.infrastructure.cache import TenantCache, CacheEnvelope
+
+        provider = TenantCache._get_provider()
+        full_key = TenantCache._get_key('report')
+        provider.set(full_key, CacheEnvelope("stale", 0.1, time.time() - 1), 60)
+        provider.add(f"{full_key}:refresh_lock", 1, 10)
+
+        self.assertEqual(TenantCache.get_or_set('report', self._compute), "stale")
+        self.assertEqual(self.calls, 0)
+
+    def test_expensive_value_is_refreshed_before_expiry(self):
+        from tenants.infrastructure.cache import TenantCache, CacheEnvelope
+
+        provider = TenantCache._get_provider()
+        # A recompute far longer than the remaining lifetime makes early refresh certain
+        provider.set(TenantCache._get_key('report'), CacheEnvelope("old", 3600, time.time() + 1), 60)
+
+        self.assertEqual(TenantCache.get_or_set('report', self._compute), "value-1")
+
+class TenantCacheInvalidationTest(TestCase):
+    """
+    Tier 115: Tenant-wide and tag invalidation are single generation bumps.
+    """
+
+    def setUp(self):
+        from tenants.infrastructure.utils.context import set_current_tenant, reset_current_tenant
+        self.tenant = Tenant.objects.create(name="Acme Corp", slug="acme")
+        self.other = Tenant.objects.create(name="Globex", slug="globex")
+        token = set_current_tenant(self.tenant)
+        self.addCleanup(reset_current_tenant, token)
+
+    def test_invalidate_tenant_only_affects_that_tenant(self):
+        from tenants.infrastructure.cache import TenantCache
+        from tenants.infrastructure.utils.context import set_current_tenant, reset_current_tenant
+
+        TenantCache.set('plan', 'pro')
+        token = set_current_tenant(self.other)
+        TenantCache.set('plan', 'free')
+        reset_current_tenant(token)
+
+        TenantCache.invalidate_tenant(self.tenant.id)
+        self.assertIsNone(TenantCache.get('plan'))
+
+        token = set_current_tenant(self.other)
+        self.assertEqual(TenantCache.get('plan'), 'free')
+        reset_current_tenant(token)
+
+    def test_tag_invalidation_retires_only_tagged_keys(self):
+        from tenants.infrastructure.cache import TenantCache
+
+        TenantCache.set('roles', ['admin'], tags=['permissions'])
+        TenantCache.set('seats', 10, tags=['entitlements'])
+
+        TenantCache.invalidate_tag('permissions')
+        self.assertIsNone(TenantCache.get('roles', tags=['permissions']))
+        self.assertEqual(TenantCache.get('seats', tags=['entitlements']), 10)
+
+    def test_config_change_retires_cached_entries(self):
+        from tenants.infrastructure.cache import TenantCache
+
+        TenantCache.set('plan', 'pro')
+        self.tenant.config = {'features': ['sso']}
+        self.tenant.save()
+        self.assertIsNone(TenantCache.get('plan'))
+
+    def test_unrelated_saves_keep_cached_entries(self):
+        from tenants.infrastructure.cache import TenantCache
+
+        TenantCache.set('plan', 'pro')
+        self.tenant.billing_customer_id = "cus_123"
+        self.tenant.save()
+        with self.assertNumQueries(1):
+            self.tenant.save(update_fields=['billing_customer_id'])
+        self.assertEqual(TenantCache.get('plan'), 'pro')
+
+        self.tenant.is_active = False
+        self.tenant.save(update_fields=['is_active'])
+        self.assertIsNone(TenantCache.get('plan'))
+
+@override_settings(TENANT_CACHE_L1_KEY_PREFIXES=['entitlements:'])
+class TenantCacheLocalTierTest(TestCase):
+    """
+    Tier 116: Opted-in keys are served from process memory and still invalidated.
+    """
+
+    def setUp(self):
+        from django.core.cache import cache
+        from tenants.infrastructure.cache import TenantCache
+        from tenants.infrastructure.utils.context import set_current_tenant, reset_current_tenant
+        cache.clear()
+        TenantCache.l1.clear()
+        self.tenant = Tenant.objects.create(name="Acme Corp", slug="acme")
+        token = set_current_tenant(self.tenant)
+        self.addCleanup(reset_current_tenant, token)
+
+    def test_l1_serves_reads_until_tenant_invalidation(self):
+        from tenants.infrastructure.cache import TenantCache
+
+        TenantCache.set('entitlements:seats', 10)
+        hits = TenantCache.l1.requests.value(tier='l1', result='hit')
+        # Remove the L2 copy behind the cache's back: the L1 copy still answers
+        TenantCache._get_provider().delete(TenantCache._get_key('entitlements:seats'))
+        self.assertEqual(TenantCache.get('entitlements:seats'), 10)
+        self.assertEqual(TenantCache.l1.requests.value(tier='l1', result='hit'), hits + 1)
+
+        TenantCache.invalidate_tenant(self.tenant.id)
+        self.assertIsNone(TenantCache.get('entitlements:seats'))
+
+    def test_broadcast_messages_drop_local_entries(self):
+        from tenants.infrastructure.cache import TenantCache
+
+        TenantCache.set('entitlements:seats', 10)
+        full_key = TenantCache._get_key('entitlements:seats')
+        TenantCache.l1.apply(f"other-process|key|{full_key}")
+        self.assertIs(TenantCache.l1._cache().get(full_key), None)
+
+        TenantCache.set('entitlements:plan', 'pro')
+        TenantCache.l1.apply(f"other-process|tenant|{self.tenant.id}")
+        self.assertIs(TenantCache.l1._cache().get(TenantCache._get_key('entitlements:plan')), None)
+
+class CacheCodecTest(TestCase):
+    """
+    Tier 117: TenantCache values are compact, typed bytes rather than pickles.
+    """
+
+    def test_roundtrip_compression_and_pickle_fallback(self):
+        from tenants.infrastructure.cache import CacheEnvelope
+        from tenants.infrastructure.codecs import CacheCodec
+
+        small = CacheCodec.encode("tenant:1:flags", {'beta': True})
+        self.assertIn(small[:1], (b'J', b'M'))
+        self.assertEqual(CacheCodec.decode("tenant:1:flags", small), {'beta': True})
+
+        large = CacheCodec.encode("tenant:1:report", ["row"] * 1000)
+        self.assertTrue(large[:1].islower())
+        self.assertEqual(CacheCodec.decode("tenant:1:report", large), ["row"] * 1000)
+
+        fallback = CacheCodec.encode("tenant:1:obj", {1, 2})
+        self.assertEqual(fallback[:1], b'P')
+        self.assertEqual(CacheCodec.decode("tenant:1:obj", fallback), {1, 2})
+
+        envelope = CacheCodec.decode("tenant:1:x", CacheCodec.encode("tenant:1:x", CacheEnvelope("v", 0.5, 123.0)))
+        self.assertEqual(envelope, CacheEnvelope("v", 0.5, 123.0))
+
+    def test_non_native_types_roundtrip_unchanged(self):
+        import datetime
+        import decimal
+        import uuid
+        from tenants.infrastructure.codecs import CacheCodec
+
+        values = [
+            datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+            datetime.date(2026, 1, 2),
+            uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            decimal.Decimal('9.99'),
+            (1, 'a'),
+            {1: 'one', 2: 'two'},
+            {'nested': [(1, 2)], 'when': datetime.date(2026, 1, 2)},
+            b'raw',
+        ]
+        for value in values:
+            with self.subTest(value=value):
+                data = CacheCodec.encode("tenant:1:value", value)
+                self.assertEqual(data[:1], b'P')
+                decoded = CacheCodec.decode("tenant:1:value", data)
+                self.assertEqual(decoded, value)
+                self.assertIs(type(decoded), type(value))
+
+        # Too wide for msgpack: must still come back intact
+        self.assertEqual(CacheCodec.decode("tenant:1:big", CacheCodec.encode("tenant:1:big", 2 ** 70)), 2 ** 70)
+        self.assertIn(CacheCodec.encode("tenant:1:plain", {'a': [1, 2.5, None, 'x']})[:1], (b'J', b'M'))
+
+    def test_resolution_caches_a_tenant_snapshot(self):
+        from tenants.infrastructure.codecs import CacheCodec, ModelSnapshot
+
+        tenant = Tenant.objects.create(name="Acme Corp", slug="acme", config={'cache': {}})
+        data = CacheCodec.encode("domain_resolution:1:acme", ModelSnapshot.dump(tenant))
+        self.assertNotEqual(data[:1], b'P')
+        restored = ModelSnapshot.load(Tenant, CacheCodec.decode("domain_resolution:1:acme", data))
+        self.assertEqual(restored.id, tenant.id)
+        self.assertEqual(restored.updated_at, tenant.updated_at)
+        self.assertEqual(restored.config, {'cache': {}})
+        self.assertFalse(restored._state.adding)